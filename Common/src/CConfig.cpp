@@ -2648,6 +2648,39 @@ void CConfig::SetConfig_Options() {
   /* DESCRIPTION: Finite different step for gradient estimation */
   addPythonOption("FIN_DIFF_STEP");
 
+  /* DESCRIPTION: Finite difference scheme for gradient estimation, FORWARD or CENTRAL */
+  addPythonOption("FIN_DIFF_SCHEME");
+
+  /* DESCRIPTION: Number of finite difference steps run at once */
+  addPythonOption("FIN_DIFF_JOBS");
+
+  /* DESCRIPTION: Start the finite difference steps from the base solution */
+  addPythonOption("FIN_DIFF_RESTART");
+
+  /* DESCRIPTION: Finite difference scheme of the stability derivatives, FORWARD or CENTRAL */
+  addPythonOption("STABILITY_SCHEME");
+
+  /* DESCRIPTION: Number of stability derivative points run at once */
+  addPythonOption("STABILITY_JOBS");
+
+  /* DESCRIPTION: Restart new designs from the closest converged design */
+  addPythonOption("WARM_START");
+
+  /* DESCRIPTION: Number of adjoint solutions of a design run at once */
+  addPythonOption("ADJOINT_JOBS");
+
+  /* DESCRIPTION: Backend of the SU2_CFD runs of the python scripts, SUBPROCESS or PYSU2 */
+  addPythonOption("CFD_BACKEND");
+
+  /* DESCRIPTION: Seconds after which the python scripts stop an SU2 process */
+  addPythonOption("SOLVER_TIMEOUT");
+
+  /* DESCRIPTION: Folder of the persistent result cache */
+  addPythonOption("RESULT_CACHE");
+
+  /* DESCRIPTION: Disk budget of the result cache in MB */
+  addPythonOption("RESULT_CACHE_SIZE");
+
   /* DESCRIPTION: Verbosity of the python scripts to Stdout */
   addPythonOption("CONSOLE");
 
@@ -2726,6 +2759,12 @@ void CConfig::SetConfig_Options() {
   /* DESCRIPTION: Multipoint mesh filenames, if using different meshes for each point */
   addPythonOption("MULTIPOINT_MESH_FILENAME");
 
+  /* DESCRIPTION: Number of multipoint points run at once */
+  addPythonOption("MULTIPOINT_JOBS");
+
+  /* DESCRIPTION: Number of partitions of each multipoint point */
+  addPythonOption("MULTIPOINT_NUMBER_PART");
+
   /*--- options that are used for the output ---*/
   /*!\par CONFIG_CATEGORY:Output Options\ingroup Config*/
 
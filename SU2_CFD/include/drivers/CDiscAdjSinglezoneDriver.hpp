@@ -89,6 +89,11 @@ public:
    */
   void Postprocess(void) override;
 
+  /*!
+   * \brief Load the direct solution again and record the computational graph at the next preprocessing.
+   */
+  void LoadRestart() override;
+
   /*!
    * \brief Record one iteration of a flow iteration in within multiple zones.
    * \param[in] kind_recording - Type of recording (full list in ENUM_RECORDING, option_structure.hpp)
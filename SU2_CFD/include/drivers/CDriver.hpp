@@ -242,6 +242,15 @@ protected:
    */
   void PythonInterface_Preprocessing(CConfig** config, CGeometry**** geometry, CSolver***** solver);
 
+  /*!
+   * \brief Check the size of an array of the bulk marker access of the Python wrapper.
+   * \param[in] iMarker - Marker identifier.
+   * \param[in] nRow - Number of rows of the array, one per vertex of the marker.
+   * \param[in] nCol - Number of columns of the array.
+   * \param[in] nColExpected - Number of columns the access needs.
+   */
+  void CheckMarkerArray(unsigned short iMarker, int nRow, int nCol, int nColExpected) const;
+
   /*!
    * \brief Preprocess the output container.
    */
@@ -375,6 +384,16 @@ public:
    */
   virtual void BoundaryConditionsUpdate() { }
 
+  /*!
+   * \brief Load the restart solutions of all zones again, e.g. the direct solution of a new design in a discrete adjoint.
+   */
+  virtual void LoadRestart();
+
+  /*!
+   * \brief Open the history files of all zones again, relative to the current working directory.
+   */
+  void ReopenHistoryFiles();
+
   /*!
    * \brief Get the total drag.
    * \return Total drag.
@@ -843,6 +862,156 @@ public:
    */
   void SetInlet_Angle(unsigned short iMarker, passivedouble alpha);
 
+  /*!
+   * \brief Get the global indices of all vertices of a marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[out] indices - Array of nVertex global indices, e.g. a numpy array of int64 from Python.
+   * \param[in] nRow - Number of vertices of the marker.
+   */
+  void GetMarkerGlobalIndices(unsigned short iMarker, long* indices, int nRow) const;
+
+  /*!
+   * \brief Get the halo mask of all vertices of a marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[out] halo - Array of nVertex flags, true for the vertices that are halo nodes of this rank.
+   * \param[in] nRow - Number of vertices of the marker.
+   */
+  void GetMarkerHaloMask(unsigned short iMarker, bool* halo, int nRow) const;
+
+  /*!
+   * \brief Get the coordinates of all vertices of a marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[out] values - Array of (nVertex, nDim) coordinates.
+   * \param[in] nRow - Number of vertices of the marker.
+   * \param[in] nCol - Number of dimensions.
+   */
+  void GetMarkerCoordinates(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const;
+
+  /*!
+   * \brief Get the undeformed coordinates of all vertices of a marker, from the mesh solver.
+   * \param[in] iMarker - Marker identifier.
+   * \param[out] values - Array of (nVertex, nDim) coordinates, zero without mesh solver.
+   * \param[in] nRow - Number of vertices of the marker.
+   * \param[in] nCol - Number of dimensions.
+   */
+  void GetMarkerUndeformedCoordinates(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const;
+
+  /*!
+   * \brief Get the fluid forces of all vertices of a marker, see GetVertexForceX.
+   * \param[in] iMarker - Marker identifier.
+   * \param[out] values - Array of (nVertex, nDim) forces, zero on halo nodes.
+   * \param[in] nRow - Number of vertices of the marker.
+   * \param[in] nCol - Number of dimensions.
+   */
+  void GetMarkerForces(unsigned short iMarker, passivedouble* values, int nRow, int nCol);
+
+  /*!
+   * \brief Get the flow loads of all vertices of a marker, see GetFlowLoad.
+   * \param[in] iMarker - Marker identifier.
+   * \param[out] values - Array of (nVertex, nDim) loads, zero if the marker is not a fluid load marker.
+   * \param[in] nRow - Number of vertices of the marker.
+   * \param[in] nCol - Number of dimensions.
+   */
+  void GetMarkerFlowLoads(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const;
+
+  /*!
+   * \brief Get the displacements of the FEA solver of all vertices of a marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[out] values - Array of (nVertex, nDim) displacements.
+   * \param[in] nRow - Number of vertices of the marker.
+   * \param[in] nCol - Number of dimensions.
+   */
+  void GetMarkerFEA_Displacements(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const;
+
+  /*!
+   * \brief Get the sensitivities of the mesh boundary displacements of all vertices of a marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[out] values - Array of (nVertex, nDim) sensitivities.
+   * \param[in] nRow - Number of vertices of the marker.
+   * \param[in] nCol - Number of dimensions.
+   */
+  void GetMarkerMeshDisp_Sensitivities(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const;
+
+  /*!
+   * \brief Get the temperatures of all vertices of a marker, see GetVertexTemperature.
+   * \param[in] iMarker - Marker identifier.
+   * \param[out] values - Array of nVertex temperatures.
+   * \param[in] nRow - Number of vertices of the marker.
+   */
+  void GetMarkerTemperatures(unsigned short iMarker, passivedouble* values, int nRow) const;
+
+  /*!
+   * \brief Set the mesh displacements of the elasticity mesh solver for all vertices of a marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[in] values - Array of (nVertex, nDim) displacements.
+   * \param[in] nRow - Number of vertices of the marker.
+   * \param[in] nCol - Number of dimensions.
+   */
+  void SetMarkerMeshDisplacements(unsigned short iMarker, const passivedouble* values, int nRow, int nCol);
+
+  /*!
+   * \brief Set the loads of the structural solver for all vertices of a marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[in] values - Array of (nVertex, nDim) loads.
+   * \param[in] nRow - Number of vertices of the marker.
+   * \param[in] nCol - Number of dimensions.
+   */
+  void SetMarkerFEA_Loads(unsigned short iMarker, const passivedouble* values, int nRow, int nCol);
+
+  /*!
+   * \brief Set the wall temperatures of all vertices of a marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[in] values - Array of nVertex temperatures.
+   * \param[in] nRow - Number of vertices of the marker.
+   */
+  void SetMarkerTemperatures(unsigned short iMarker, const passivedouble* values, int nRow);
+
+  /*!
+   * \brief Set the wall normal heat fluxes of all vertices of a marker.
+   * \param[in] iMarker - Marker identifier.
+   * \param[in] values - Array of nVertex heat fluxes.
+   * \param[in] nRow - Number of vertices of the marker.
+   */
+  void SetMarkerNormalHeatFluxes(unsigned short iMarker, const passivedouble* values, int nRow);
+
+  /*!
+   * \brief Get the number of points (halo points included) of a zone, the rows of the solution arrays.
+   * \param[in] iZone - Index of the zone.
+   * \return Number of points.
+   */
+  unsigned long GetNumberPoints(unsigned short iZone) const;
+
+  /*!
+   * \brief Copy the solution of all solvers (adjoint or primal) of a zone to an array.
+   * \param[in] iZone - Index of the zone.
+   * \param[in] adjoint - True to consider adjoint solvers instead of primal.
+   * \param[out] values - Array of nPoint x nVar solution values, see GetTotalNumberOfVariables.
+   * \param[in] nRow - Number of points of the zone.
+   * \param[in] nCol - Total number of variables of the solvers.
+   */
+  void GetSolutions(unsigned short iZone, bool adjoint, passivedouble* values, int nRow, int nCol) const;
+
+  /*!
+   * \brief Set the solution of all solvers (adjoint or primal) of a zone from an array.
+   * \param[in] iZone - Index of the zone.
+   * \param[in] adjoint - True to consider adjoint solvers instead of primal.
+   * \param[in] values - Array of nPoint x nVar solution values, see GetTotalNumberOfVariables.
+   * \param[in] nRow - Number of points of the zone.
+   * \param[in] nCol - Total number of variables of the solvers.
+   */
+  void SetSolutions(unsigned short iZone, bool adjoint, const passivedouble* values, int nRow, int nCol);
+
+  /*!
+   * \brief Get the solution of one solver of a zone without copy, only in builds without AD.
+   * \note The view shares the memory of the solver, it is valid while the driver is alive.
+   * \param[in] iZone - Index of the zone.
+   * \param[in] iSol - Position of the solver in the solver container, e.g. FLOW_SOL.
+   * \param[out] view - Pointer to the nPoint x nVar solution values of the solver.
+   * \param[out] nRow - Number of points of the zone.
+   * \param[out] nCol - Number of variables of the solver.
+   */
+  void GetSolutionView(unsigned short iZone, unsigned short iSol, passivedouble** view, int* nRow, int* nCol);
+
   /*!
    * \brief Sum the number of primal or adjoint variables for all solvers in a given zone.
    * \param[in] iZone - Index of the zone.
@@ -280,6 +280,12 @@ public:
    */
   void PreprocessMultizoneHistoryOutput(COutput **output, CConfig **config, CConfig *driver_config, bool wrt = true);
 
+  /*!
+   * \brief Open the history file again, relative to the current working directory, and print its header.
+   * \param[in] config - Definition of the particular problem.
+   */
+  void ReopenHistoryFile(CConfig *config);
+
   /*!
    * \brief Collects history data from the solvers, monitors the convergence and writes to screen and history file.
    * \param[in] geometry - Geometrical definition of the problem.
@@ -511,6 +511,16 @@ void CDiscAdjSinglezoneDriver::Print_DirectResidual(unsigned short kind_recordin
 
 }
 
+void CDiscAdjSinglezoneDriver::LoadRestart(){
+
+  CDriver::LoadRestart();
+
+  /*--- The recorded graph belongs to the previous direct solution, record again at the next preprocessing. ---*/
+
+  RecordingState = NONE;
+
+}
+
 void CDiscAdjSinglezoneDriver::MainRecording(){
 
   /*--- SetRecording stores the computational graph on one iteration of the direct problem. Calling it with NONE
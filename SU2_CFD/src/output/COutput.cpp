@@ -1256,6 +1256,23 @@ void COutput::PrepareHistoryFile(CConfig *config){
 
 }
 
+void COutput::ReopenHistoryFile(CConfig *config){
+
+  if (rank != MASTER_NODE || noWriting || !histFile.is_open()) return;
+
+  /*--- Open the history file again, the columns of the table are already set ---*/
+
+  histFile.close();
+  histFile.open(historyFilename.c_str(), ios::out);
+
+  if (config->GetTabular_FileFormat() == TAB_TECPLOT) {
+    histFile << "VARIABLES = \\" << endl;
+  }
+  historyFileTable->PrintHeader();
+  histFile.flush();
+
+}
+
 void COutput::CheckHistoryOutput(){
 
 
@@ -28,6 +28,7 @@
 
  #include "../include/drivers/CDriver.hpp"
  #include "../include/drivers/CSinglezoneDriver.hpp"
+ #include "../include/output/COutput.hpp"
 
 void CDriver::PythonInterface_Preprocessing(CConfig **config, CGeometry ****geometry, CSolver *****solver){
 
@@ -1261,3 +1262,309 @@ void CDriver::SetInlet_Angle(unsigned short iMarker, passivedouble alpha){
   }
 
 }
+
+void CDriver::CheckMarkerArray(unsigned short iMarker, int nRow, int nCol, int nColExpected) const {
+
+  const auto nVertex = geometry_container[ZONE_0][INST_0][MESH_0]->nVertex[iMarker];
+
+  if ((nRow < 0) || (static_cast<unsigned long>(nRow) != nVertex) || (nCol != nColExpected)) {
+    SU2_MPI::Error("The array of marker " + config_container[ZONE_0]->GetMarker_All_TagBound(iMarker) +
+                   " must have " + to_string(nVertex) + " rows and " + to_string(nColExpected) + " columns.",
+                   CURRENT_FUNCTION);
+  }
+
+}
+
+void CDriver::GetMarkerGlobalIndices(unsigned short iMarker, long* indices, int nRow) const {
+
+  CheckMarkerArray(iMarker, nRow, 1, 1);
+
+  const CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    const auto iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    indices[iVertex] = geometry->nodes->GetGlobalIndex(iPoint);
+  }
+
+}
+
+void CDriver::GetMarkerHaloMask(unsigned short iMarker, bool* halo, int nRow) const {
+
+  CheckMarkerArray(iMarker, nRow, 1, 1);
+
+  const CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    const auto iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    halo[iVertex] = !geometry->nodes->GetDomain(iPoint);
+  }
+
+}
+
+void CDriver::GetMarkerCoordinates(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const {
+
+  CheckMarkerArray(iMarker, nRow, nCol, nDim);
+
+  const CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    const auto iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    const su2double *Coord = geometry->nodes->GetCoord(iPoint);
+    for (auto iDim = 0u; iDim < nDim; iDim++)
+      values[iVertex*nDim+iDim] = SU2_TYPE::GetValue(Coord[iDim]);
+  }
+
+}
+
+void CDriver::GetMarkerUndeformedCoordinates(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const {
+
+  CheckMarkerArray(iMarker, nRow, nCol, nDim);
+
+  const CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+  CSolver *solver = solver_container[ZONE_0][INST_0][MESH_0][MESH_SOL];
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    const auto iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    for (auto iDim = 0u; iDim < nDim; iDim++) {
+      if (solver != nullptr)
+        values[iVertex*nDim+iDim] = SU2_TYPE::GetValue(solver->GetNodes()->GetMesh_Coord(iPoint, iDim));
+      else
+        values[iVertex*nDim+iDim] = 0.0;
+    }
+  }
+
+}
+
+void CDriver::GetMarkerForces(unsigned short iMarker, passivedouble* values, int nRow, int nCol) {
+
+  CheckMarkerArray(iMarker, nRow, nCol, nDim);
+
+  for (auto iVertex = 0ul; iVertex < geometry_container[ZONE_0][INST_0][MESH_0]->nVertex[iMarker]; iVertex++) {
+
+    /*--- Halo nodes introduce non physical forces ---*/
+
+    const bool halo = ComputeVertexForces(iMarker, iVertex);
+    for (auto iDim = 0u; iDim < nDim; iDim++)
+      values[iVertex*nDim+iDim] = halo ? 0.0 : SU2_TYPE::GetValue(PyWrapNodalForce[iDim]);
+  }
+
+}
+
+void CDriver::GetMarkerFlowLoads(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const {
+
+  CheckMarkerArray(iMarker, nRow, nCol, nDim);
+
+  CSolver *solver = solver_container[ZONE_0][INST_0][MESH_0][FLOW_SOL];
+  const bool fluid_load = (config_container[ZONE_0]->GetMarker_All_Fluid_Load(iMarker) == YES);
+
+  for (auto iVertex = 0ul; iVertex < geometry_container[ZONE_0][INST_0][MESH_0]->nVertex[iMarker]; iVertex++) {
+    for (auto iDim = 0u; iDim < nDim; iDim++) {
+      if (fluid_load)
+        values[iVertex*nDim+iDim] = SU2_TYPE::GetValue(solver->GetVertexTractions(iMarker, iVertex, iDim));
+      else
+        values[iVertex*nDim+iDim] = 0.0;
+    }
+  }
+
+}
+
+void CDriver::GetMarkerFEA_Displacements(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const {
+
+  CheckMarkerArray(iMarker, nRow, nCol, nDim);
+
+  const CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+  CSolver *solver = solver_container[ZONE_0][INST_0][MESH_0][FEA_SOL];
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    const auto iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    for (auto iDim = 0u; iDim < nDim; iDim++)
+      values[iVertex*nDim+iDim] = SU2_TYPE::GetValue(solver->GetNodes()->GetSolution(iPoint, iDim));
+  }
+
+}
+
+void CDriver::GetMarkerMeshDisp_Sensitivities(unsigned short iMarker, passivedouble* values, int nRow, int nCol) const {
+
+  CheckMarkerArray(iMarker, nRow, nCol, nDim);
+
+  const CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+  CSolver *solver = solver_container[ZONE_0][INST_0][MESH_0][ADJMESH_SOL];
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    const auto iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    for (auto iDim = 0u; iDim < nDim; iDim++)
+      values[iVertex*nDim+iDim] = SU2_TYPE::GetValue(solver->GetNodes()->GetBoundDisp_Sens(iPoint, iDim));
+  }
+
+}
+
+void CDriver::GetMarkerTemperatures(unsigned short iMarker, passivedouble* values, int nRow) const {
+
+  CheckMarkerArray(iMarker, nRow, 1, 1);
+
+  const CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+  CSolver *solver = solver_container[ZONE_0][INST_0][MESH_0][FLOW_SOL];
+  const bool compressible = (config_container[ZONE_0]->GetKind_Regime() == COMPRESSIBLE);
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    const auto iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    if (geometry->nodes->GetDomain(iPoint) && compressible)
+      values[iVertex] = SU2_TYPE::GetValue(solver->GetNodes()->GetTemperature(iPoint));
+    else
+      values[iVertex] = 0.0;
+  }
+
+}
+
+void CDriver::SetMarkerMeshDisplacements(unsigned short iMarker, const passivedouble* values, int nRow, int nCol) {
+
+  CheckMarkerArray(iMarker, nRow, nCol, nDim);
+
+  const CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+  CSolver *solver = solver_container[ZONE_0][INST_0][MESH_0][MESH_SOL];
+  su2double Disp[3] = {0.0, 0.0, 0.0};
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    const auto iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    for (auto iDim = 0u; iDim < nDim; iDim++)
+      Disp[iDim] = values[iVertex*nDim+iDim];
+    solver->GetNodes()->SetBound_Disp(iPoint, Disp);
+  }
+
+}
+
+void CDriver::SetMarkerFEA_Loads(unsigned short iMarker, const passivedouble* values, int nRow, int nCol) {
+
+  CheckMarkerArray(iMarker, nRow, nCol, nDim);
+
+  const CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+  CSolver *solver = solver_container[ZONE_0][INST_0][MESH_0][FEA_SOL];
+  su2double Load[3] = {0.0, 0.0, 0.0};
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++) {
+    const auto iPoint = geometry->vertex[iMarker][iVertex]->GetNode();
+    for (auto iDim = 0u; iDim < nDim; iDim++)
+      Load[iDim] = values[iVertex*nDim+iDim];
+    solver->GetNodes()->Set_FlowTraction(iPoint, Load);
+  }
+
+}
+
+void CDriver::SetMarkerTemperatures(unsigned short iMarker, const passivedouble* values, int nRow) {
+
+  CheckMarkerArray(iMarker, nRow, 1, 1);
+
+  CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++)
+    geometry->SetCustomBoundaryTemperature(iMarker, iVertex, values[iVertex]);
+
+}
+
+void CDriver::SetMarkerNormalHeatFluxes(unsigned short iMarker, const passivedouble* values, int nRow) {
+
+  CheckMarkerArray(iMarker, nRow, 1, 1);
+
+  CGeometry *geometry = geometry_container[ZONE_0][INST_0][MESH_0];
+
+  for (auto iVertex = 0ul; iVertex < geometry->nVertex[iMarker]; iVertex++)
+    geometry->SetCustomBoundaryHeatFlux(iMarker, iVertex, values[iVertex]);
+
+}
+
+namespace {
+/*!
+ * \brief Row-major (iPoint,iVar) access to the arrays of the Python wrapper,
+ *        for the Get/SetAllSolutions templates of the driver.
+ */
+template<class Scalar>
+struct CPyWrapperArray2D {
+  Scalar* data;
+  unsigned long nCol;
+  Scalar& operator() (unsigned long iRow, unsigned long iCol) const { return data[iRow*nCol+iCol]; }
+};
+}
+
+unsigned long CDriver::GetNumberPoints(unsigned short iZone) const {
+
+  return geometry_container[iZone][INST_0][MESH_0]->GetnPoint();
+
+}
+
+void CDriver::GetSolutions(unsigned short iZone, bool adjoint, passivedouble* values, int nRow, int nCol) const {
+
+  const auto nPoint = GetNumberPoints(iZone);
+  const auto nVar = GetTotalNumberOfVariables(iZone, adjoint);
+
+  if ((nRow < 0) || (static_cast<unsigned long>(nRow) != nPoint) || (nCol != nVar)) {
+    SU2_MPI::Error("The solution array must have " + to_string(nPoint) + " rows and " + to_string(nVar) + " columns.",
+                   CURRENT_FUNCTION);
+  }
+
+  CPyWrapperArray2D<passivedouble> solution{values, nVar};
+  GetAllSolutions(iZone, adjoint, solution);
+
+}
+
+void CDriver::SetSolutions(unsigned short iZone, bool adjoint, const passivedouble* values, int nRow, int nCol) {
+
+  const auto nPoint = GetNumberPoints(iZone);
+  const auto nVar = GetTotalNumberOfVariables(iZone, adjoint);
+
+  if ((nRow < 0) || (static_cast<unsigned long>(nRow) != nPoint) || (nCol != nVar)) {
+    SU2_MPI::Error("The solution array must have " + to_string(nPoint) + " rows and " + to_string(nVar) + " columns.",
+                   CURRENT_FUNCTION);
+  }
+
+  const CPyWrapperArray2D<const passivedouble> solution{values, nVar};
+  SetAllSolutions(iZone, adjoint, solution);
+
+}
+
+void CDriver::GetSolutionView(unsigned short iZone, unsigned short iSol, passivedouble** view, int* nRow, int* nCol) {
+
+  *view = nullptr;
+  *nRow = 0;
+  *nCol = 0;
+
+#if defined(CODI_REVERSE_TYPE) || defined(CODI_FORWARD_TYPE)
+  SU2_MPI::Error("The solution cannot be shared in AD builds, use GetSolutions instead.", CURRENT_FUNCTION);
+#else
+  CSolver *solver = (iSol < MAX_SOLS)? solver_container[iZone][INST_0][MESH_0][iSol] : nullptr;
+
+  if (solver == nullptr) {
+    SU2_MPI::Error("Zone " + to_string(iZone) + " has no solver at position " + to_string(iSol) + ".",
+                   CURRENT_FUNCTION);
+  }
+
+  /*--- The rows of the solution are contiguous, the view starts at the first point. ---*/
+
+  CVariable *nodes = solver->GetNodes();
+  *view = nodes->GetSolution(0ul);
+  *nRow = nodes->GetSolution().rows();
+  *nCol = nodes->GetSolution().cols();
+#endif
+
+}
+
+void CDriver::LoadRestart() {
+
+  for (iZone = 0; iZone < nZone; iZone++) {
+    for (iInst = 0; iInst < nInst[iZone]; iInst++) {
+      bool update_geo = !config_container[iZone]->GetFSI_Simulation();
+      Solver_Restart(solver_container[iZone][iInst], geometry_container[iZone][iInst],
+                     config_container[iZone], update_geo);
+    }
+  }
+
+}
+
+void CDriver::ReopenHistoryFiles() {
+
+  for (iZone = 0; iZone < nZone; iZone++)
+    output_container[iZone]->ReopenHistoryFile(config_container[iZone]);
+
+  if (driver_output != nullptr)
+    driver_output->ReopenHistoryFile(driver_config);
+
+}
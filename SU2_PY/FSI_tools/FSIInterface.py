@@ -99,11 +99,30 @@ class Interface:
         self.nSolidInterfaceNodes = 0			#number of nodes on the solid interface, sum over all partitions
         self.nSolidInterfacePhysicalNodes = 0		#number of physical nodes on the solid interface, sum over all partitions
 
+        self.fluidInterfaceGlobalIndices = None		#fluid solver indexing of the interface nodes (halo nodes included), on each partition
+        self.fluidInterfaceHaloMask = None		#True for the halo nodes of the fluid interface, on each partition
+        self.fluidInterfaceFSIIndices = None		#FSI indexing of the physical fluid interface nodes, on each partition
+        self.fluidInterfaceBuffer = None		#(nodes, nDim) buffer for the exchanges with the fluid solver, halo nodes included
+        self.solidInterfaceHaloMask = None		#True for the halo nodes of the solid interface, on each partition
+        self.solidInterfaceFSIIndices = None		#FSI indexing of the physical solid interface nodes, on each partition
+        self.solidInterfaceBuffer = None		#(nodes, 3) buffer for the exchanges with the solid solver, halo nodes included
+
         if FSI_config['MATCHING_MESH'] == 'NO' and (FSI_config['MESH_INTERP_METHOD'] == 'RBF' or FSI_config['MESH_INTERP_METHOD'] == 'TPS'):
           self.MappingMatrixA = None
           self.MappingMatrixA_T = None
           self.MappingMatrixB = None
           self.MappingMatrixB_T = None
+          self.MappingSolverA = None			#interpolation solver, set up once, for the displacements
+          self.MappingSolverA_T = None			#transposed interpolation solver, set up once, for the loads
+          self.MappingDirect = FSI_config['MAPPING_SOLVER'] == 'DIRECT'	#LU factorization instead of FGMRES
+          self.gamma_array_DispX = None			#RBF/TPS coefficients of the displacement interpolation
+          self.gamma_array_DispY = None
+          self.gamma_array_DispZ = None
+          self.gamma_array_LoadX = None			#right hand sides of the load interpolation
+          self.gamma_array_LoadY = None
+          self.gamma_array_LoadZ = None
+          self.MappingRHS = None			#dense block of right hand sides, one column per direction (direct solver)
+          self.MappingSol = None			#dense block of solutions, one column per direction (direct solver)
           self.d_RBF = self.nDim+1
         else:
           self.MappingMatrix = None			#interpolation/mapping matrix for meshes interpolation/mapping
@@ -296,12 +315,16 @@ class Interface:
         self.MPIBarrier()
         # --- Calculate the total number of nodes at the fluid interface (sum over all the partitions) ---
         # Calculate the number of halo nodes on each partition
-        self.nLocalFluidInterfaceHaloNode = 0
-        for iVertex in range(self.nLocalFluidInterfaceNodes):
-            if FluidSolver.IsAHaloNode(self.fluidInterfaceIdentifier, iVertex) == True:
-              GlobalIndex = FluidSolver.GetVertexGlobalIndex(self.fluidInterfaceIdentifier, iVertex)
-              self.FluidHaloNodeList[GlobalIndex] = iVertex
-              self.nLocalFluidInterfaceHaloNode += 1
+        # The global indices and halo mask of the interface are kept for the bulk exchanges with the fluid solver
+        self.fluidInterfaceGlobalIndices = np.zeros(self.nLocalFluidInterfaceNodes, dtype='l')
+        self.fluidInterfaceHaloMask = np.zeros(self.nLocalFluidInterfaceNodes, dtype=bool)
+        self.fluidInterfaceBuffer = np.zeros((self.nLocalFluidInterfaceNodes, self.nDim))
+        if self.nLocalFluidInterfaceNodes != 0:
+          FluidSolver.GetMarkerGlobalIndices(self.fluidInterfaceIdentifier, self.fluidInterfaceGlobalIndices)
+          FluidSolver.GetMarkerHaloMask(self.fluidInterfaceIdentifier, self.fluidInterfaceHaloMask)
+        for iVertex in np.flatnonzero(self.fluidInterfaceHaloMask):
+          self.FluidHaloNodeList[int(self.fluidInterfaceGlobalIndices[iVertex])] = int(iVertex)
+        self.nLocalFluidInterfaceHaloNode = int(np.count_nonzero(self.fluidInterfaceHaloMask))
         # Calculate the number of physical (= not halo) nodes on each partition
         self.nLocalFluidInterfacePhysicalNodes = self.nLocalFluidInterfaceNodes - self.nLocalFluidInterfaceHaloNode
         if self.have_MPI == True:
@@ -321,6 +344,11 @@ class Interface:
           self.SolidHaloNodeList = self.comm.allgather(self.SolidHaloNodeList)
         else:
           self.SolidHaloNodeList = [{}]
+        self.solidInterfaceHaloMask = np.zeros(self.nLocalSolidInterfaceNodes, dtype=bool)
+        for iVertex in range(self.nLocalSolidInterfaceNodes):
+          GlobalIndex = SolidSolver.getInterfaceNodeGlobalIndex(self.solidInterfaceIdentifier, iVertex)
+          self.solidInterfaceHaloMask[iVertex] = GlobalIndex in self.SolidHaloNodeList[myid]
+        self.solidInterfaceBuffer = np.zeros((self.nLocalSolidInterfaceNodes, 3))
 
 
         # --- Calculate the total number of nodes (with and without halo) at the fluid interface (sum over all the partitions) and broadcast the number accross all processors ---
@@ -409,6 +437,10 @@ class Interface:
           self.solidGlobalIndexRange = list()
           self.solidGlobalIndexRange.append(temp)
 
+        # --- FSI indexing of the physical interface nodes of each partition, for single calls to the PETSc vectors ---
+        self.fluidInterfaceFSIIndices = self.__getGlobalIndex('fluid', myid, 0) + np.arange(self.nLocalFluidInterfacePhysicalNodes, dtype=PETSc.IntType)
+        self.solidInterfaceFSIIndices = self.__getGlobalIndex('solid', myid, 0) + np.arange(self.nLocalSolidInterfacePhysicalNodes, dtype=PETSc.IntType)
+
         self.MPIPrint('Total number of fluid interface nodes (halo nodes included) : {}'.format(self.nFluidInterfaceNodes))
         self.MPIPrint('Total number of solid interface nodes (halo nodes included) : {}'.format(self.nSolidInterfaceNodes))
         self.MPIPrint('Total number of fluid interface nodes : {}'.format(self.nFluidInterfacePhysicalNodes))
@@ -557,28 +589,21 @@ class Interface:
           MPIsize = 1
 
         # --- Get the fluid interface from fluid solver on each partition ---
-        GlobalIndex = int()
-        localIndex = 0
-        fluidIndexing_temp = {}
-        self.localFluidInterface_array_X_init = np.zeros((self.nLocalFluidInterfacePhysicalNodes))
-        self.localFluidInterface_array_Y_init = np.zeros((self.nLocalFluidInterfacePhysicalNodes))
-        self.localFluidInterface_array_Z_init = np.zeros((self.nLocalFluidInterfacePhysicalNodes))
-        for iVertex in range(self.nLocalFluidInterfaceNodes):
-            # Note that the fluid solver is separated in more processors outside the python script
-            # thus when, from a core, we request for the vertices on the interface, we only obtain
-            # those in that node
-            GlobalIndex = FluidSolver.GetVertexGlobalIndex(self.fluidInterfaceIdentifier, iVertex)
-            posx = FluidSolver.GetVertexCoordX(self.fluidInterfaceIdentifier, iVertex)
-            posy = FluidSolver.GetVertexCoordY(self.fluidInterfaceIdentifier, iVertex)
-            posz = FluidSolver.GetVertexCoordZ(self.fluidInterfaceIdentifier, iVertex)
-            if GlobalIndex in self.FluidHaloNodeList[myid].keys():
-              self.haloNodesPositionsInit[GlobalIndex] = (posx, posy, posz)
-            else:
-              fluidIndexing_temp[GlobalIndex] = self.__getGlobalIndex('fluid', myid, localIndex)
-              self.localFluidInterface_array_X_init[localIndex] = posx
-              self.localFluidInterface_array_Y_init[localIndex] = posy
-              self.localFluidInterface_array_Z_init[localIndex] = posz
-              localIndex += 1
+        # Note that the fluid solver is separated in more processors outside the python script
+        # thus when, from a core, we request for the vertices on the interface, we only obtain
+        # those in that node
+        position = np.zeros((self.nLocalFluidInterfaceNodes, 3))
+        if self.nLocalFluidInterfaceNodes != 0:
+          FluidSolver.GetMarkerCoordinates(self.fluidInterfaceIdentifier, self.fluidInterfaceBuffer)
+          position[:,:self.nDim] = self.fluidInterfaceBuffer
+        haloMask = self.fluidInterfaceHaloMask
+        physicalMask = ~haloMask
+        for GlobalIndex, pos in zip(self.fluidInterfaceGlobalIndices[haloMask].tolist(), position[haloMask].tolist()):
+          self.haloNodesPositionsInit[GlobalIndex] = tuple(pos)
+        fluidIndexing_temp = dict(zip(self.fluidInterfaceGlobalIndices[physicalMask].tolist(), self.fluidInterfaceFSIIndices.tolist()))
+        self.localFluidInterface_array_X_init = position[physicalMask,0]
+        self.localFluidInterface_array_Y_init = position[physicalMask,1]
+        self.localFluidInterface_array_Z_init = position[physicalMask,2]
         if self.have_MPI == True:
           fluidIndexing_temp = self.comm.allgather(fluidIndexing_temp)
           for ii in range(len(fluidIndexing_temp)):
@@ -595,19 +620,16 @@ class Interface:
         self.localSolidInterface_array_X = np.zeros(self.nLocalSolidInterfaceNodes)
         self.localSolidInterface_array_Y = np.zeros(self.nLocalSolidInterfaceNodes)
         self.localSolidInterface_array_Z = np.zeros(self.nLocalSolidInterfaceNodes)
-        for iVertex in range(self.nLocalSolidInterfaceNodes):
+        for iVertex in np.flatnonzero(~self.solidInterfaceHaloMask).tolist():
           GlobalIndex = SolidSolver.getInterfaceNodeGlobalIndex(self.solidInterfaceIdentifier, iVertex)
           posx = SolidSolver.getInterfaceNodePosX(self.solidInterfaceIdentifier, iVertex)
           posy = SolidSolver.getInterfaceNodePosY(self.solidInterfaceIdentifier, iVertex)
           posz = SolidSolver.getInterfaceNodePosZ(self.solidInterfaceIdentifier, iVertex)
-          if GlobalIndex in self.SolidHaloNodeList[myid].keys():
-            pass
-          else:
-            solidIndexing_temp[GlobalIndex] = self.__getGlobalIndex('solid', myid, localIndex)
-            self.localSolidInterface_array_X[localIndex] = posx
-            self.localSolidInterface_array_Y[localIndex] = posy
-            self.localSolidInterface_array_Z[localIndex] = posz
-            localIndex += 1
+          solidIndexing_temp[GlobalIndex] = int(self.solidInterfaceFSIIndices[localIndex])
+          self.localSolidInterface_array_X[localIndex] = posx
+          self.localSolidInterface_array_Y[localIndex] = posy
+          self.localSolidInterface_array_Z[localIndex] = posz
+          localIndex += 1
         if self.have_MPI == True:
           solidIndexing_temp = self.comm.allgather(solidIndexing_temp)
           for ii in range(len(solidIndexing_temp)):
@@ -723,6 +745,8 @@ class Interface:
           self.MappingMatrixA_T.assemblyBegin()
           self.MappingMatrixA_T.assemblyEnd()
           self.MPIPrint('Matrix A is built.')
+          self.setUpMappingSolvers()
+          self.MPIPrint('Interpolation solvers are set up.')
         else:
           self.MPIPrint("Building interpolation matrix...")
         self.MPIBarrier()
@@ -793,6 +817,108 @@ class Interface:
         del self.localFluidInterface_array_Y_init
         del self.localFluidInterface_array_Z_init
 
+    def setUpMappingSolvers(self):
+        """
+        Sets up the solvers of the RBF/TPS interpolation system once, the matrix A does not change during the simulation.
+        A direct solver factorizes A and A^T here, so that each interpolation only needs back-substitutions.
+        """
+        self.MappingSolverA = self.__createMappingSolver(self.MappingMatrixA)
+        self.MappingSolverA_T = self.__createMappingSolver(self.MappingMatrixA_T)
+
+        # --- Work vectors, the coefficients of the previous interpolation are kept as initial guess ---
+        self.gamma_array_DispX = self.MappingMatrixA.createVecRight()
+        self.gamma_array_DispY = self.MappingMatrixA.createVecRight()
+        self.gamma_array_DispZ = self.MappingMatrixA.createVecRight()
+        self.gamma_array_LoadX = self.MappingMatrixA.createVecRight()
+        self.gamma_array_LoadY = self.MappingMatrixA.createVecRight()
+        self.gamma_array_LoadZ = self.MappingMatrixA.createVecRight()
+        for gamma_array in [self.gamma_array_DispX, self.gamma_array_DispY, self.gamma_array_DispZ,
+                            self.gamma_array_LoadX, self.gamma_array_LoadY, self.gamma_array_LoadZ]:
+          gamma_array.set(0.0)
+
+        # --- Dense blocks to solve all the directions at once with the factorization ---
+        if self.MappingSolverA.getType() == 'preonly' and hasattr(self.MappingSolverA, 'matSolve'):
+          rowSizes = self.MappingMatrixA.getSizes()[0]
+          colSizes = (PETSc.DECIDE, self.nDim)
+          if self.have_MPI == True:
+            self.MappingRHS = PETSc.Mat().createDense((rowSizes, colSizes), comm=self.comm)
+            self.MappingSol = PETSc.Mat().createDense((rowSizes, colSizes), comm=self.comm)
+          else:
+            self.MappingRHS = PETSc.Mat().createDense((rowSizes, colSizes))
+            self.MappingSol = PETSc.Mat().createDense((rowSizes, colSizes))
+          self.MappingRHS.assemble()
+          self.MappingSol.assemble()
+
+    def __mappingFactorPackage(self):
+        """
+        Returns the PETSc package with a pivoting LU factorization for the direct solver, None if there is none.
+        The native PETSc LU does not pivot, the interpolation systems have a zero block on the diagonal.
+        """
+        parallel = self.have_MPI == True and self.comm.Get_size() > 1
+        hasPackage = getattr(PETSc.Sys, 'hasExternalPackage', None)
+        if hasPackage is None:
+          # old petsc4py, MUMPS is required in parallel anyway
+          return 'mumps' if parallel else None
+        for package in ['mumps', 'superlu_dist', 'superlu']:
+          if parallel and package == 'superlu':
+            continue
+          if hasPackage(package):
+            return package
+        return 'mumps' if parallel else None
+
+    def __createMappingSolver(self, Matrix):
+        """
+        Creates the solver of an interpolation system, FGMRES with Jacobi preconditioning or a LU factorization.
+        Without a pivoting LU package, the direct solver is a shifted native LU used as preconditioner of FGMRES.
+        """
+        if self.have_MPI == True:
+          KSP_solver = PETSc.KSP().create(self.comm)
+        else:
+          KSP_solver = PETSc.KSP().create()
+        if self.MappingDirect == True:
+          package = self.__mappingFactorPackage()
+          KSP_solver.getPC().setType('lu')
+          if package is not None:
+            KSP_solver.setType('preonly')
+            KSP_solver.getPC().setFactorSolverType(package)
+          else:
+            # zero pivots are shifted, the iterations correct the shift
+            KSP_solver.setType('fgmres')
+            KSP_solver.getPC().setFactorOrdering('natural')
+            KSP_solver.getPC().setFactorShift(PETSc.Mat.FactorShiftType.NONZERO)
+        else:
+          KSP_solver.setType('fgmres')
+          KSP_solver.getPC().setType('jacobi')
+          # The coefficients of the previous interpolation are the initial guess
+          KSP_solver.setInitialGuessNonzero(True)
+        KSP_solver.setOperators(Matrix)
+        KSP_solver.setFromOptions()
+        KSP_solver.setUp()
+
+        return KSP_solver
+
+    def solveMappingSystem(self, KSP_solver, rhs_arrays, sol_arrays):
+        """
+        Solves an interpolation system for the X, Y (and Z) directions.
+        With a direct solver, the directions are solved as one block of right hand sides.
+        """
+        rhs_arrays = rhs_arrays[:self.nDim]
+        sol_arrays = sol_arrays[:self.nDim]
+
+        if self.MappingRHS is None:
+          for rhs, sol in zip(rhs_arrays, sol_arrays):
+            KSP_solver.solve(rhs, sol)
+          return
+
+        rhsBlock = self.MappingRHS.getDenseArray()
+        for iDim, rhs in enumerate(rhs_arrays):
+          rhsBlock[:,iDim] = rhs.getArray()
+        self.MappingRHS.assemble()
+        KSP_solver.matSolve(self.MappingRHS, self.MappingSol)
+        solBlock = self.MappingSol.getDenseArray()
+        for iDim, sol in enumerate(sol_arrays):
+          sol.setArray(solBlock[:,iDim])
+
     def matchingMeshMapping(self,solidInterfaceBuffRcv_X, solidInterfaceBuffRcv_Y, solidInterfaceBuffRcv_Z, iProc):
         """
         Fill the mapping matrix in case of matching meshes at the f/s interface.
@@ -1106,51 +1232,13 @@ class Interface:
 
         # --- Interpolate (or map) in parallel the solid interface displacement on the fluid interface ---
         if FSI_config['MATCHING_MESH'] == 'NO' and (FSI_config['MESH_INTERP_METHOD'] == 'RBF' or FSI_config['MESH_INTERP_METHOD'] == 'TPS'):
-          if self.have_MPI == True:
-            gamma_array_DispX = PETSc.Vec().create(self.comm)
-            gamma_array_DispY = PETSc.Vec().create(self.comm)
-            gamma_array_DispZ = PETSc.Vec().create(self.comm)
-            gamma_array_DispX.setType('mpi')
-            gamma_array_DispY.setType('mpi')
-            gamma_array_DispZ.setType('mpi')
-            KSP_solver = PETSc.KSP().create(self.comm)
-          else:
-            gamma_array_DispX = PETSc.Vec().create()
-            gamma_array_DispY = PETSc.Vec().create()
-            gamma_array_DispZ = PETSc.Vec().create()
-            gamma_array_DispX.setType('seq')
-            gamma_array_DispY.setType('seq')
-            gamma_array_DispZ.setType('seq')
-            KSP_solver = PETSc.KSP().create()
-          gamma_array_DispX.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_DispY.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_DispZ.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_DispX.set(0.0)
-          gamma_array_DispY.set(0.0)
-          gamma_array_DispZ.set(0.0)
-          KSP_solver.setType('fgmres')
-          KSP_solver.getPC().setType('jacobi')
-          KSP_solver.setOperators(self.MappingMatrixA)
-          KSP_solver.setFromOptions()
-          #print(KSP_solver.getInitialGuessNonzero())
-          KSP_solver.setInitialGuessNonzero(True)
-          #print(KSP_solver.getInitialGuessNonzero())
-          KSP_solver.solve(self.solidInterface_array_DispX, gamma_array_DispX)
-          KSP_solver.solve(self.solidInterface_array_DispY, gamma_array_DispY)
+          self.solveMappingSystem(self.MappingSolverA,
+                                  [self.solidInterface_array_DispX, self.solidInterface_array_DispY, self.solidInterface_array_DispZ],
+                                  [self.gamma_array_DispX, self.gamma_array_DispY, self.gamma_array_DispZ])
+          self.MappingMatrixB.mult(self.gamma_array_DispX, self.fluidInterface_array_DispX)
+          self.MappingMatrixB.mult(self.gamma_array_DispY, self.fluidInterface_array_DispY)
           if self.nDim==3:
-            KSP_solver.solve(self.solidInterface_array_DispZ, gamma_array_DispZ)
-          self.MappingMatrixB.mult(gamma_array_DispX, self.fluidInterface_array_DispX)
-          self.MappingMatrixB.mult(gamma_array_DispY, self.fluidInterface_array_DispY)
-          if self.nDim==3:
-            self.MappingMatrixB.mult(gamma_array_DispZ, self.fluidInterface_array_DispZ)
-          gamma_array_DispX.destroy()
-          gamma_array_DispY.destroy()
-          gamma_array_DispZ.destroy()
-          KSP_solver.destroy()
-          del gamma_array_DispX
-          del gamma_array_DispY
-          del gamma_array_DispZ
-          del KSP_solver
+            self.MappingMatrixB.mult(self.gamma_array_DispZ, self.fluidInterface_array_DispZ)
         else:
           self.MappingMatrix.mult(self.solidInterface_array_DispX, self.fluidInterface_array_DispX)
           self.MappingMatrix.mult(self.solidInterface_array_DispY, self.fluidInterface_array_DispY)
@@ -1285,48 +1373,13 @@ class Interface:
         # --- Interpolate (or map) in parallel the fluid interface loads on the solid interface ---
         #self.MappingMatrix.transpose()
         if FSI_config['MATCHING_MESH'] == 'NO' and (FSI_config['MESH_INTERP_METHOD'] == 'RBF' or FSI_config['MESH_INTERP_METHOD'] == 'TPS'):
-          if self.have_MPI == True:
-            gamma_array_LoadX = PETSc.Vec().create(self.comm)
-            gamma_array_LoadY = PETSc.Vec().create(self.comm)
-            gamma_array_LoadZ = PETSc.Vec().create(self.comm)
-            gamma_array_LoadX.setType('mpi')
-            gamma_array_LoadY.setType('mpi')
-            gamma_array_LoadZ.setType('mpi')
-            KSP_solver = PETSc.KSP().create(self.comm)
-          else:
-            gamma_array_LoadX = PETSc.Vec().create()
-            gamma_array_LoadY = PETSc.Vec().create()
-            gamma_array_LoadZ = PETSc.Vec().create()
-            gamma_array_LoadX.setType('seq')
-            gamma_array_LoadY.setType('seq')
-            gamma_array_LoadZ.setType('seq')
-            KSP_solver = PETSc.KSP().create()
-          gamma_array_LoadX.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_LoadY.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_LoadZ.setSizes(self.nSolidInterfacePhysicalNodes+self.d_RBF)
-          gamma_array_LoadX.set(0.0)
-          gamma_array_LoadY.set(0.0)
-          gamma_array_LoadZ.set(0.0)
-          KSP_solver.setType('fgmres')
-          KSP_solver.getPC().setType('jacobi')
-          KSP_solver.setOperators(self.MappingMatrixA_T)
-          KSP_solver.setFromOptions()
-          self.MappingMatrixB_T.mult(self.fluidLoads_array_X, gamma_array_LoadX)
-          self.MappingMatrixB_T.mult(self.fluidLoads_array_Y, gamma_array_LoadY)
+          self.MappingMatrixB_T.mult(self.fluidLoads_array_X, self.gamma_array_LoadX)
+          self.MappingMatrixB_T.mult(self.fluidLoads_array_Y, self.gamma_array_LoadY)
           if self.nDim==3:
-            self.MappingMatrixB_T.mult(self.fluidLoads_array_Z, gamma_array_LoadZ)
-          KSP_solver.solve(gamma_array_LoadX, self.solidLoads_array_X)
-          KSP_solver.solve(gamma_array_LoadY, self.solidLoads_array_Y)
-          if self.nDim==3:
-            KSP_solver.solve(gamma_array_LoadZ, self.solidLoads_array_Z)
-          gamma_array_LoadX.destroy()
-          gamma_array_LoadY.destroy()
-          gamma_array_LoadZ.destroy()
-          KSP_solver.destroy()
-          del gamma_array_LoadX
-          del gamma_array_LoadY
-          del gamma_array_LoadZ
-          del KSP_solver
+            self.MappingMatrixB_T.mult(self.fluidLoads_array_Z, self.gamma_array_LoadZ)
+          self.solveMappingSystem(self.MappingSolverA_T,
+                                  [self.gamma_array_LoadX, self.gamma_array_LoadY, self.gamma_array_LoadZ],
+                                  [self.solidLoads_array_X, self.solidLoads_array_Y, self.solidLoads_array_Z])
         else:
           self.MappingMatrix_T.mult(self.fluidLoads_array_X, self.solidLoads_array_X)
           self.MappingMatrix_T.mult(self.fluidLoads_array_Y, self.solidLoads_array_Y)
@@ -1417,22 +1470,16 @@ class Interface:
         else:
           myid = 0
 
-        # --- Get the solid interface position from the solid solver and directly fill the corresponding PETSc vector ---
-        GlobalIndex = int()
-        localIndex = 0
+        # --- Get the solid interface position from the solid solver and fill the corresponding PETSc vector at once ---
+        disp = self.solidInterfaceBuffer
         for iVertex in range(self.nLocalSolidInterfaceNodes):
-          GlobalIndex = SolidSolver.getInterfaceNodeGlobalIndex(self.solidInterfaceIdentifier, iVertex)
-          if GlobalIndex in self.SolidHaloNodeList[myid].keys():
-            pass
-          else:
-            newDispx = SolidSolver.getInterfaceNodeDispX(self.solidInterfaceIdentifier, iVertex)
-            newDispy = SolidSolver.getInterfaceNodeDispY(self.solidInterfaceIdentifier, iVertex)
-            newDispz = SolidSolver.getInterfaceNodeDispZ(self.solidInterfaceIdentifier, iVertex)
-            iGlobalVertex = self.__getGlobalIndex('solid', myid, localIndex)
-            self.solidInterface_array_DispX.setValues([iGlobalVertex],newDispx)
-            self.solidInterface_array_DispY.setValues([iGlobalVertex],newDispy)
-            self.solidInterface_array_DispZ.setValues([iGlobalVertex],newDispz)
-            localIndex += 1
+          disp[iVertex,0] = SolidSolver.getInterfaceNodeDispX(self.solidInterfaceIdentifier, iVertex)
+          disp[iVertex,1] = SolidSolver.getInterfaceNodeDispY(self.solidInterfaceIdentifier, iVertex)
+          disp[iVertex,2] = SolidSolver.getInterfaceNodeDispZ(self.solidInterfaceIdentifier, iVertex)
+        disp = disp[~self.solidInterfaceHaloMask]
+        self.solidInterface_array_DispX.setValues(self.solidInterfaceFSIIndices, disp[:,0])
+        self.solidInterface_array_DispY.setValues(self.solidInterfaceFSIIndices, disp[:,1])
+        self.solidInterface_array_DispZ.setValues(self.solidInterfaceFSIIndices, disp[:,2])
 
         self.solidInterface_array_DispX.assemblyBegin()
         self.solidInterface_array_DispX.assemblyEnd()
@@ -1450,24 +1497,18 @@ class Interface:
         else:
           myid = 0
 
-        localIndex = 0
-        FX = 0.0
-        FY = 0.0
+        # --- Get the fluid interface loads from the fluid solver and fill the corresponding PETSc vector at once ---
+        if self.nLocalFluidInterfaceNodes != 0:
+          FluidSolver.GetMarkerFlowLoads(self.fluidInterfaceIdentifier, self.fluidInterfaceBuffer)
+        loads = self.fluidInterfaceBuffer[~self.fluidInterfaceHaloMask]
+        self.fluidLoads_array_X.setValues(self.fluidInterfaceFSIIndices, loads[:,0])
+        self.fluidLoads_array_Y.setValues(self.fluidInterfaceFSIIndices, loads[:,1])
+        FX = loads[:,0].sum()
+        FY = loads[:,1].sum()
         FZ = 0.0
-
-        # --- Get the fluid interface loads from the fluid solver and directly fill the corresponding PETSc vector ---
-        for iVertex in range(self.nLocalFluidInterfaceNodes):
-            GlobalIndex = FluidSolver.GetVertexGlobalIndex(self.fluidInterfaceIdentifier, iVertex)
-            if GlobalIndex not in self.FluidHaloNodeList[myid].keys():
-              loadX, loadY, loadZ = FluidSolver.GetFlowLoad(self.fluidInterfaceIdentifier, iVertex)
-              iGlobalVertex = self.__getGlobalIndex('fluid', myid, localIndex)
-              self.fluidLoads_array_X.setValues([iGlobalVertex], loadX)
-              self.fluidLoads_array_Y.setValues([iGlobalVertex], loadY)
-              self.fluidLoads_array_Z.setValues([iGlobalVertex], loadZ)
-              FX += loadX
-              FY += loadY
-              FZ += loadZ
-              localIndex += 1
+        if self.nDim == 3:
+          self.fluidLoads_array_Z.setValues(self.fluidInterfaceFSIIndices, loads[:,2])
+          FZ = loads[:,2].sum()
 
         if self.have_MPI == True:
           FX = self.comm.allreduce(FX)
@@ -1497,18 +1538,19 @@ class Interface:
           myid = 0
 
         # --- Send the new fluid interface position to the fluid solver (on each partition, halo nodes included) ---
-        localIndex = 0
-        for iVertex in range(self.nLocalFluidInterfaceNodes):
-            GlobalIndex = FluidSolver.GetVertexGlobalIndex(self.fluidInterfaceIdentifier, iVertex)
-            if GlobalIndex in self.FluidHaloNodeList[myid].keys():
-              DispX, DispY, DispZ = self.haloNodesDisplacements[GlobalIndex]
-              FluidSolver.SetMeshDisplacement(self.fluidInterfaceIdentifier, int(iVertex), DispX, DispY, DispZ)
-            else:
-              DispX = self.localFluidInterface_array_DispX[localIndex]
-              DispY = self.localFluidInterface_array_DispY[localIndex]
-              DispZ = self.localFluidInterface_array_DispZ[localIndex]
-              FluidSolver.SetMeshDisplacement(self.fluidInterfaceIdentifier, int(iVertex), DispX, DispY, DispZ)
-              localIndex += 1
+        if self.nLocalFluidInterfaceNodes == 0:
+          return
+        disp = self.fluidInterfaceBuffer
+        haloMask = self.fluidInterfaceHaloMask
+        physicalMask = ~haloMask
+        disp[physicalMask,0] = self.localFluidInterface_array_DispX
+        disp[physicalMask,1] = self.localFluidInterface_array_DispY
+        if self.nDim == 3:
+          disp[physicalMask,2] = self.localFluidInterface_array_DispZ
+        for iVertex in np.flatnonzero(haloMask).tolist():
+          GlobalIndex = int(self.fluidInterfaceGlobalIndices[iVertex])
+          disp[iVertex] = self.haloNodesDisplacements[GlobalIndex][:self.nDim]
+        FluidSolver.SetMarkerMeshDisplacements(self.fluidInterfaceIdentifier, disp)
 
 
     def setSolidInterfaceLoads(self, SolidSolver, FSI_config):
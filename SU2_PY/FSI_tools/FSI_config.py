@@ -55,6 +55,7 @@ class FSIConfig:
     def __init__(self,FileName):
         self.ConfigFileName = FileName
         self._ConfigContent = {}
+        self._ConfigContent['MAPPING_SOLVER'] = 'ITERATIVE'	#default solver of the RBF/TPS interpolation system
         self.readConfig()
 
     def __str__(self):
@@ -116,6 +117,13 @@ class FSIConfig:
                     self._ConfigContent[this_param] = this_value
                     break
 
+            #solver of the interpolation system
+                if case("MAPPING_SOLVER")             :
+                    if this_value not in ['ITERATIVE', 'DIRECT']:
+                        raise Exception("MAPPING_SOLVER must be ITERATIVE or DIRECT, not " + this_value)
+                    self._ConfigContent[this_param] = this_value
+                    break
+
                 if case():
                     print(this_param + " is an invalid option !")
                     break
@@ -2,7 +2,7 @@
 from SU2.eval.functions import function as func
 from SU2.eval.functions import aerodynamics, geometry
 from SU2.eval.gradients import gradient as grad
-from SU2.eval.gradients import adjoint, findiff
+from SU2.eval.gradients import adjoint, adjoint_batch, findiff
 from SU2.eval.design import (Design,
      obj_f, obj_df,
      con_ceq, con_dceq,
@@ -33,7 +33,8 @@ import os, copy
 from .. import io   as su2io
 from .  import func as su2func
 from .  import grad as su2grad
-from ..io import redirect_folder, save_data
+from .  import adjoint_batch as su2adjoint_batch
+from ..io import redirect_folder, save_data, work_path
 
 # todo:
 # shouldnt be needed, but self.append_state() (ie after initialization)
@@ -44,12 +45,14 @@ from ..io import redirect_folder, save_data
 # ----------------------------------------------------------------------
 
 class Design(object):
-    """ SU2.eval.Design(config,state=None,folder='DESIGNS/DSN_*')
+    """ SU2.eval.Design(config,state=None,folder='DESIGNS/DSN_*',store=None)
     
         Starts a design class, which manages a config and state.
         Will run design in folder, and with self indexing name if '*' is
         included in the folder name.
         Methods are wrappers for SU2.eval.func() and SU2.eval.grad()
+        The design is saved to the project store if one is given, 
+        otherwise to design.pkl in the design folder.
        
         Attributes:
             state  - design state
@@ -58,6 +61,11 @@ class Design(object):
             folder - design folder
             funcs  - design function value bunch
             grads  - design gradient values bunch
+            store  - project store, or None
+            seed   - folder of the design that seeded the restart
+                     files, or None
+            warm_start - list of the solutions restarted from the
+                     seed, DIRECT and ADJOINT_*, see WARM_START
         
         Methods:
             Optimizer Interface
@@ -79,7 +87,11 @@ class Design(object):
             grad(func_name,method='CONTINUOUS_ADJOINT') - gradient of specified name
     """
     
-    def __init__(self, config, state=None, folder='DESIGNS/DSN_*'):
+    store = None
+    seed  = None
+    warm_start = ()
+    
+    def __init__(self, config, state=None, folder='DESIGNS/DSN_*', store=None):
         """ Initializes an SU2 Design """
         
         ## ???: Move to Project, no next folder here
@@ -97,6 +109,7 @@ class Design(object):
         self.funcs  = state.FUNCTIONS
         self.grads  = state.GRADIENTS
         self.folder = folder
+        self.store  = store
         
         self.filename = 'design.pkl'
 
@@ -104,8 +117,8 @@ class Design(object):
         pull,link = state.pullnlink(config)
         with redirect_folder(folder,pull,link,force=True):
             # save design, config
-            save_data(self.filename,self)
-            config.dump('config_DSN.cfg')
+            self.save()
+            config.dump(work_path('config_DSN.cfg'))
         
     def _eval(self,eval_func,*args):
         """ Evaluates an SU2 Design 
@@ -116,11 +129,9 @@ class Design(object):
         state  = self.state
         files  = self.files
         folder = self.folder
-        
-        filename = self.filename
 
         # check folder
-        assert os.path.exists(folder) , 'cannot find design folder %s' % folder
+        assert os.path.exists(work_path(folder)) , 'cannot find design folder %s' % folder
         
         konfig = copy.deepcopy(config)
 
@@ -148,7 +159,7 @@ class Design(object):
             
             # save design
             if state.toc(timestamp):
-                save_data(filename,self)
+                self.save()
             
         #: with redirect folder
         
@@ -157,6 +168,15 @@ class Design(object):
         
         return vals
     
+    def save(self):
+        """ saves the design to the project store, 
+            or to design.pkl in the current folder
+        """
+        if self.store is None:
+            save_data(self.filename,self)
+        else:
+            self.store.save_design(self.folder,self)
+    
     def obj_f(self,dvs):
         """ Evaluates SU2 Design Objectives """
         return self._eval(obj_f,dvs)
@@ -328,26 +348,16 @@ def obj_df(dvs,config,state=None):
     dv_scales = config['DEFINITION_DV']['SCALE']
     dv_size   = config['DEFINITION_DV']['SIZE']
     
+    # adjoints of all objectives and constraints at once
+    plan_gradients(config,state)
+    
     # evaluate each objective
     vals_out = []
     if (combine_obj and n_obj>1):
         # Evaluate objectives all-at-once; for adjoint methods this results in a 
         # single, combined objective.
-        scale = [1.0]*n_obj
-        obj_list=['DRAG']*n_obj	
-        for i_obj,this_obj in enumerate(objectives):
-            obj_list[i_obj]=this_obj
-            scale[i_obj] = def_objs[this_obj]['SCALE']
-            if def_objs[this_obj]['OBJTYPE']== 'DEFAULT':
-                # Standard case
-                sign = su2io.get_objectiveSign(this_obj)
-                scale[i_obj] *= sign 
-            else:
-                # For a penalty function, the term is scaled by the partial derivative
-                # d p(j) / dx = (dj / dx) * ( dp / dj)  
-                scale[i_obj]*=obj_dp(config, state, this_obj, def_objs)
-
-        config['OBJECTIVE_WEIGHT']=','.join(map(str,scale))
+        obj_list,weights = _combo_objective(config,state)
+        config['OBJECTIVE_WEIGHT'] = weights
         grad= su2grad(obj_list,grad_method,config,state)
         # scaling : obj scale  and sign are accounted for in combo gradient, dv scale now applied
         global_factor = float(config['OPT_GRADIENT_FACTOR'])            
@@ -387,6 +397,8 @@ def obj_df(dvs,config,state=None):
                     k = k + 1
             
             vals_out.append(grad)
+        
+        config['MARKER_MONITORING'] = marker_monitored
     
     #: for each objective
     
@@ -394,6 +406,77 @@ def obj_df(dvs,config,state=None):
 
 #: def obj_df()
 
+def _combo_objective(config,state):
+    """ obj_list,weights = _combo_objective(config,state)
+        objectives and OBJECTIVE_WEIGHT of the combined objective,
+        with the sign or penalty derivative of each objective
+    """
+    
+    def_objs   = config['OPT_OBJECTIVE']
+    objectives = def_objs.keys()
+    n_obj      = len( objectives )
+    
+    scale = [1.0]*n_obj
+    obj_list=['DRAG']*n_obj	
+    for i_obj,this_obj in enumerate(objectives):
+        obj_list[i_obj]=this_obj
+        scale[i_obj] = def_objs[this_obj]['SCALE']
+        if def_objs[this_obj]['OBJTYPE']== 'DEFAULT':
+            # Standard case
+            sign = su2io.get_objectiveSign(this_obj)
+            scale[i_obj] *= sign 
+        else:
+            # For a penalty function, the term is scaled by the partial derivative
+            # d p(j) / dx = (dj / dx) * ( dp / dj)  
+            scale[i_obj]*=obj_dp(config, state, this_obj, def_objs)
+    
+    return obj_list, ','.join(map(str,scale))
+
+#: def _combo_objective()
+
+def plan_gradients(config,state=None):
+    """ grads = SU2.eval.design.plan_gradients(config,state=None)
+    
+        Evaluates the adjoint gradients of all objectives and 
+        constraints of a design together, with SU2.eval.adjoint_batch(),
+        so that they share one direct solution and run ADJOINT_JOBS 
+        at once. Called by obj_df(), con_dceq() and con_dcieq(), which 
+        then find the gradients in state.
+        Only for GRADIENT_METHOD CONTINUOUS_ADJOINT or DISCRETE_ADJOINT.
+    """
+    
+    state = su2io.State(state)
+    grad_method = config.get('GRADIENT_METHOD','CONTINUOUS_ADJOINT')
+    if not grad_method in ['CONTINUOUS_ADJOINT','DISCRETE_ADJOINT']:
+        return {}
+    
+    def_objs    = config['OPT_OBJECTIVE']
+    objectives  = list(def_objs.keys())
+    n_obj       = len( objectives )
+    combine_obj = (config['OPT_COMBINE_OBJECTIVE']=="YES") 
+    
+    tasks = []
+    
+    # objectives, as in obj_df()
+    if (combine_obj and n_obj>1):
+        obj_list,weights = _combo_objective(config,state)
+        tasks.append( (obj_list, {'OBJECTIVE_WEIGHT':weights}) )
+    else:
+        marker_monitored = config['MARKER_MONITORING']
+        for i_obj,this_obj in enumerate(objectives):
+            options = {}
+            if (n_obj>1): options['MARKER_MONITORING'] = marker_monitored[i_obj]
+            tasks.append( (this_obj, options) )
+    
+    # constraints
+    for kind in ['EQUALITY','INEQUALITY']:
+        for this_con in config['OPT_CONSTRAINT'][kind].keys():
+            tasks.append( (this_con, {}) )
+    
+    return su2adjoint_batch(tasks,grad_method,config,state)
+
+#: def plan_gradients()
+
 def con_ceq(dvs,config,state=None):
     """ vals = SU2.eval.con_ceq(dvs,config,state=None)
     
@@ -460,6 +543,9 @@ def con_dceq(dvs,config,state=None):
     
     dv_scales = config['DEFINITION_DV']['SCALE']
     dv_size   = config['DEFINITION_DV']['SIZE']
+    
+    # adjoints of all objectives and constraints at once
+    plan_gradients(config,state)
 
     # evaluate each constraint
     vals_out = []
@@ -555,6 +641,9 @@ def con_dcieq(dvs,config,state=None):
     
     dv_scales = config['DEFINITION_DV']['SCALE']
     dv_size   = config['DEFINITION_DV']['SIZE']
+    
+    # adjoints of all objectives and constraints at once
+    plan_gradients(config,state)
 
     # evaluate each constraint
     vals_out = []
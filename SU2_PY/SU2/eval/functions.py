@@ -54,6 +54,7 @@ def function( func_name, config, state=None ):
             Mesh need not be deformed.
             Updates config and state by reference.
             Redundancy if state.FUNCTIONS is not empty.
+            Results are cached in RESULT_CACHE, see SU2.io.ResultCache.
         
         Executes in:
             ./DIRECT or ./GEOMETRY
@@ -80,6 +81,14 @@ def function( func_name, config, state=None ):
     func_name_string = func_name
     if multi_objective:   func_name_string = func_name[0]  
 
+    # result cache, results of an earlier run with the same design
+    cache = None
+    if not func_name_string in state['FUNCTIONS']:
+        cache = su2io.result_cache(config)
+        if cache is not None:
+            cache_key = cache.key(config)
+            cache.load(cache_key,state)
+
     # redundancy check
     if not func_name_string in state['FUNCTIONS']:
 
@@ -106,6 +115,9 @@ def function( func_name, config, state=None ):
         else:
             raise Exception('unknown function name, %s. Please check config_template.cfg for updated list of function names' % func_name)
         
+        if cache is not None:
+            cache.save(cache_key,config,state)
+        
     #: if not redundant
 
     # prepare output
@@ -146,6 +158,7 @@ def aerodynamics( config, state=None ):
             Mesh may or may not be deformed.
             Updates config and state by reference.
             Redundancy if state.FUNCTIONS is not empty.
+            Restarts from state.FILES.DIRECT if WARM_START=YES.
             
         Executes in:
             ./DIRECT
@@ -198,10 +211,7 @@ def aerodynamics( config, state=None ):
     # ----------------------------------------------------    
     #  Direct Solution
     # ----------------------------------------------------    
-    opt_names = []
-    for key in su2io.historyOutFields:
-        if su2io.historyOutFields[key]['TYPE'] == 'COEFFICIENT':
-            opt_names.append(key)
+    opt_names = list(su2io.optnames_aero)
 
     # redundancy check
     direct_done = all([key in state.FUNCTIONS for key in opt_names])
@@ -244,6 +254,8 @@ def aerodynamics( config, state=None ):
         name = su2io.expand_time(name,config)
         link.extend( name )
         ##config['RESTART_SOL'] = 'YES' # don't override config file
+        if warm_start(config):
+            config['RESTART_SOL'] = 'YES'
     else:
         if config.get('TIME_DOMAIN', 'NO') != 'YES': #rules out steady state optimization special cases.
             config['RESTART_SOL'] = 'NO' #for shape optimization with restart files.
@@ -325,7 +337,21 @@ def aerodynamics( config, state=None ):
 # ----------------------------------------------------------------------
 
 def stability( config, state=None, step=1e-2 ):
-   
+    """ vals = SU2.eval.stability(config,state=None,step=1e-2)
+
+        Evaluates the angle of attack derivatives of the aerodynamics,
+        by finite differencing with STABILITY_SCHEME, FORWARD (default) 
+        or CENTRAL. 
+
+        The perturbed points restart from the direct solution of the 
+        central point. If state has a direct solution, all points are 
+        run at once, otherwise the perturbed points wait for the central 
+        point. STABILITY_JOBS points are run at once, default 1.
+        All of optnames_stab come from the same perturbed points.
+
+        Executes in:
+            ./DIRECT and ./STABILITY, ./STABILITY_M
+    """
     
     folder = 'STABILITY' # os.path.join('STABILITY',func_name) #STABILITY/D_MOMENT_Y_D_ALPHA/
     
@@ -337,13 +363,16 @@ def stability( config, state=None, step=1e-2 ):
     state = su2io.State(state)
     if not 'MESH' in state.FILES:
         state.FILES.MESH = config['MESH_FILENAME']
-    special_cases = su2io.get_specialCases(config)
     
     # console output
     if config.get('CONSOLE','VERBOSE') in ['QUIET','CONCISE']:
         log_direct = 'log_Direct.out'
     else:
         log_direct = None
+
+    # differencing scheme and jobs
+    steps, folders = _stability_steps(config,step,folder)
+    n_jobs = int(config.get('STABILITY_JOBS',1))
     
     # ----------------------------------------------------    
     #  Update Mesh
@@ -354,34 +383,108 @@ def stability( config, state=None, step=1e-2 ):
     info = update_mesh(config,state) 
     
     # ----------------------------------------------------    
-    #  CENTRAL POINT
+    #  Central and Perturbed Points
     # ----------------------------------------------------    
     
-    # will run in DIRECT/
-    func_0 = aerodynamics(config,state)      
+    # central point will run in DIRECT/
     
+    if 'DIRECT' in state.FILES:
+        # all points at once, restart from the current solution,
+        # copied before the central point rewrites it
+        konfig = copy.deepcopy(config)
+        ztate  = copy.deepcopy(state)
+        for folder_i in folders:
+            name = su2io.expand_time(ztate.FILES['DIRECT'],konfig)
+            with redirect_folder(folder_i,pull=name,chdir=False):
+                pass
+        def run_point(i):
+            if i == 0:
+                return aerodynamics(config,state)
+            return _stability_point(konfig,ztate,folders[i-1],steps[i-1],log_direct,copied=True)
+        func = _run_points(run_point,len(steps)+1,n_jobs)
+
+    else:
+        # perturbed points restart from the central solution
+        func = [ aerodynamics(config,state) ]
+        def run_point(i):
+            return _stability_point(config,state,folders[i],steps[i],log_direct)
+        func.extend( _run_points(run_point,len(steps),n_jobs) )
     
     # ----------------------------------------------------    
-    #  Run Forward Point
-    # ----------------------------------------------------   
+    #  DIFFERENCING
+    # ----------------------------------------------------
+        
+    for derv_name in su2io.optnames_stab:
+
+        matches = [ k for k in su2io.optnames_aero if k in derv_name ]
+        if not len(matches) == 1: continue
+        func_name = matches[0]
+
+        obj_func = _stability_difference( [ f[func_name] for f in func ], steps )
+        
+        state.FUNCTIONS[derv_name] = obj_func
     
+
+    # return output 
+    funcs = su2util.ordered_bunch()
+    for key in su2io.optnames_stab:
+        if key in state['FUNCTIONS']:
+            funcs[key] = state['FUNCTIONS'][key]    
+    
+    return funcs
+
+#: def stability()
+
+def _stability_steps( config, step, folder ):
+    """ steps, folders = _stability_steps(config,step,folder)
+        angle of attack steps and folders of the perturbed points
+    """
+    scheme = config.get('STABILITY_SCHEME','FORWARD')
+    if scheme == 'FORWARD':
+        return [ step ], [ folder ]
+    elif scheme == 'CENTRAL':
+        return [ step, -step ], [ folder, folder + '_M' ]
+    else:
+        raise Exception('unknown STABILITY_SCHEME %s' % scheme)
+
+def _stability_difference( values, steps ):
+    """ derivative = _stability_difference(values,steps)
+        values of the central point and of each perturbed point
+    """
+    if len(steps) == 1:
+        return ( values[1] - values[0] ) / steps[0]
+    else:
+        return ( values[1] - values[2] ) / ( steps[0] - steps[1] )
+
+def _stability_point( config, state, folder, step, log_direct, copied=False ):
+    """ func = _stability_point(config,state,folder,step,log_direct,copied=False)
+        runs the aerodynamics at AOA+step in folder, restarting 
+        from the direct solution of state, linked into folder, 
+        or already copied there if copied is True
+    """
+
+    special_cases = su2io.get_specialCases(config)
+    
+    konfig = copy.deepcopy(config)
+    ztate  = copy.deepcopy(state)
+
     # files to pull
-    files = state.FILES
+    files = ztate.FILES
     pull = []; link = []
     
     # files: mesh
     name = files['MESH']
-    name = su2io.expand_part(name,config)
+    name = su2io.expand_part(name,konfig)
     link.extend(name)
     
     # files: direct solution
     if 'DIRECT' in files:
         name = files['DIRECT']
-        name = su2io.expand_time(name,config)
-        link.extend( name )
-        ##config['RESTART_SOL'] = 'YES' # don't override config file
+        name = su2io.expand_time(name,konfig)
+        if not copied: link.extend( name )
+        konfig['RESTART_SOL'] = 'YES'
     else:
-        config['RESTART_SOL'] = 'NO'
+        konfig['RESTART_SOL'] = 'NO'
         
     # files: target equivarea distribution
     if ( 'EQUIV_AREA' in special_cases and 
@@ -402,47 +505,15 @@ def stability( config, state=None, step=1e-2 ):
     with redirect_folder( folder, pull, link ) as push:
         with redirect_output(log_direct):     
             
-            konfig = copy.deepcopy(config)
-            ztate  = copy.deepcopy(state)
-            
             # TODO: GENERALIZE
             konfig.AOA = konfig.AOA + step
             ztate.FUNCTIONS.clear()
             
-            func_1 = aerodynamics(konfig,ztate)
-                        
-            ## direct files to store
-            #name = ztate.FILES['DIRECT']
-            #if not 'STABILITY' in state.FILES:
-                #state.FILES.STABILITY = su2io.ordered_bunch()
-            #state.FILES.STABILITY['DIRECT'] = name
-            
-            ## equivarea files to store
-            #if 'WEIGHT_NF' in ztate.FILES:
-                #state.FILES.STABILITY['WEIGHT_NF'] = ztate.FILES['WEIGHT_NF']
-    
-    # ----------------------------------------------------    
-    #  DIFFERENCING
-    # ----------------------------------------------------
-        
-    for derv_name in su2io.optnames_stab:
+            func = aerodynamics(konfig,ztate)
 
-        matches = [ k for k in su2io.optnames_aero if k in derv_name ]
-        if not len(matches) == 1: continue
-        func_name = matches[0]
-
-        obj_func = ( func_1[func_name] - func_0[func_name] ) / step
-        
-        state.FUNCTIONS[derv_name] = obj_func
-    
+    return func
 
-    # return output 
-    funcs = su2util.ordered_bunch()
-    for key in su2io.optnames_stab:
-        if key in state['FUNCTIONS']:
-            funcs[key] = state['FUNCTIONS'][key]    
-    
-    return funcs
+#: def _stability_point()
 
 
 # ----------------------------------------------------------------------
@@ -450,6 +521,19 @@ def stability( config, state=None, step=1e-2 ):
 # ----------------------------------------------------------------------
 
 def multipoint( config, state=None, step=1e-2 ):
+    """ vals = SU2.eval.multipoint(config,state=None)
+
+        Evaluates the aerodynamics at each point of the
+        MULTIPOINT_* lists and their weighted sums.
+
+        The points are independent after the mesh update, 
+        MULTIPOINT_JOBS points are run at once, each with 
+        MULTIPOINT_NUMBER_PART partitions (default NUMBER_PART).
+        The deformed mesh is linked into each point folder.
+
+        Executes in:
+            ./DIRECT and ./MULTIPOINT_*
+    """
 
     mach_list = config['MULTIPOINT_MACH_NUMBER'].replace("(", "").replace(")", "").split(',')
     reynolds_list = config['MULTIPOINT_REYNOLDS_NUMBER'].replace("(", "").replace(")", "").split(',')
@@ -465,19 +549,13 @@ def multipoint( config, state=None, step=1e-2 ):
     restart_sol = config['RESTART_SOL']
     dv_value_old = config['DV_VALUE_OLD'];
 
-    func = []
-    folder = []
-    for i in range(len(weight_list)):
-        func.append(0)
-        folder.append(0)
+    n_points = len(weight_list)
+    n_jobs = int(config.get('MULTIPOINT_JOBS',1))
+    n_part = int(config.get('MULTIPOINT_NUMBER_PART',config.NUMBER_PART))
 
-    for i in range(len(weight_list)):
-        folder[i] = 'MULTIPOINT_' + str(i)
+    folder = [ 'MULTIPOINT_' + str(i) for i in range(n_points) ]
 
-    opt_names = []
-    for key in su2io.historyOutFields:
-        if su2io.historyOutFields[key]['TYPE'] == 'COEFFICIENT':
-            opt_names.append(key)
+    opt_names = list(su2io.optnames_aero)
 
     # ----------------------------------------------------
     #  Initialize
@@ -506,12 +584,10 @@ def multipoint( config, state=None, step=1e-2 ):
 
     # does decomposition and deformation
     info = update_mesh(config,state)
-  
+
     # ----------------------------------------------------
-    #  FIRST POINT
+    #  Setup Points
     # ----------------------------------------------------
-    
-    # will run in DIRECT/
 
     config.AOA = aoa_list[0]
     config.SIDESLIP_ANGLE = sideslip_list[0]
@@ -526,24 +602,127 @@ def multipoint( config, state=None, step=1e-2 ):
     config.MARKER_OUTLET = new_marker_outlet
     config.SOLUTION_FILENAME = solution_flow_list[0]
 
+    # configs and states of the other points, 
+    # copied before the first point updates config and state
+    konfigs = [ config ]
+    ztates  = [ state ]
+    for i in range(1,n_points):
+
+        konfig = copy.deepcopy(config)
+        ztate  = copy.deepcopy(state)
+
+        konfig.SOLUTION_FILENAME = solution_flow_list[i]
+        konfig.NUMBER_PART = n_part
+
+        # delete direct solution file of the first point
+        if 'DIRECT' in ztate.FILES:
+            del ztate.FILES.DIRECT
+
+        if 'FLOW_META' in ztate.FILES:
+            del ztate.FILES.FLOW_META
+
+        # use direct solution file from relevant point
+        if 'MULTIPOINT_DIRECT' in state.FILES and state.FILES.MULTIPOINT_DIRECT[i]: 
+            ztate.FILES['DIRECT'] = state.FILES.MULTIPOINT_DIRECT[i]
+
+        # use flow.meta file from relevant point
+        if 'MULTIPOINT_FLOW_META' in state.FILES and state.FILES.MULTIPOINT_FLOW_META[i]:
+            ztate.FILES['FLOW_META'] = state.FILES.MULTIPOINT_FLOW_META[i]
+
+        # use mesh file from relevant point
+        if 'MULTIPOINT_MESH_FILENAME' in ztate.FILES:
+            ztate.FILES.MESH = ztate.FILES.MULTIPOINT_MESH_FILENAME[i]
+            konfig.MESH_FILENAME= ztate.FILES.MULTIPOINT_MESH_FILENAME[i]
+            konfig['DV_VALUE_OLD'] = dv_value_old
+
+        # Update config values
+        konfig.AOA = aoa_list[i]
+        konfig.SIDESLIP_ANGLE = sideslip_list[i]
+        konfig.MACH_NUMBER = mach_list[i]
+        konfig.REYNOLDS_NUMBER = reynolds_list[i]
+        konfig.FREESTREAM_TEMPERATURE = freestream_temp_list[i]
+        konfig.FREESTREAM_PRESSURE = freestream_press_list[i]
+        konfig.TARGET_CL = target_cl_list[i]
+        new_marker_outlet = "(" + orig_marker_outlet[0] + "," + outlet_value_list[i] + ")"
+        konfig.MARKER_OUTLET = new_marker_outlet
+
+        ztate.FUNCTIONS.clear()
+
+        konfigs.append(konfig)
+        ztates.append(ztate)
+
+    # ----------------------------------------------------
+    #  Run Points
+    # ----------------------------------------------------
+
+    def run_point(i):
+        if i == 0:
+            return _multipoint_first(konfigs[0],ztates[0],folder[0],
+                                     flow_meta_list[0],restart_sol,n_part)
+        else:
+            return _multipoint_point(konfigs[i],ztates[i],folder[i],flow_meta_list[i],
+                                     restart_sol,log_direct,'MULTIPOINT_MESH_FILENAME' in state.FILES)
+
+    func = _run_points(run_point,n_points,n_jobs)
+
+    # Update MULTIPOINT_DIRECT in state.FILES
+    state.FILES.MULTIPOINT_DIRECT = solution_flow_list
+    if 'FLOW_META' in state.FILES:
+        state.FILES.MULTIPOINT_FLOW_META = flow_meta_list
+      
+    # ----------------------------------------------------
+    #  WEIGHT FUNCTIONS
+    # ----------------------------------------------------
+        
+    for derv_name in su2io.optnames_multi:
+        matches = [ k for k in opt_names if k in derv_name ]
+        if not len(matches) == 1: continue
+        func_name = matches[0]
+        obj_func = 0.0
+        for i in range(len(weight_list)):
+            obj_func = obj_func + float(weight_list[i])*func[i][func_name]
+        
+        state.FUNCTIONS[derv_name] = obj_func
+
+    # return output
+    funcs = su2util.ordered_bunch()
+    for key in su2io.optnames_multi:
+        if key in state['FUNCTIONS']:
+            funcs[key] = state['FUNCTIONS'][key]
+    
+    return funcs
+
+#: def multipoint()
+
+def _multipoint_first( config, state, folder, flow_meta, restart_sol, n_part ):
+    """ func = _multipoint_first(config,state,folder,flow_meta,restart_sol,n_part)
+        runs the first point in ./DIRECT, updates config and state,
+        and links ./DIRECT into the point folder
+    """
+
     # If solution file for the first point is available, use it
     if 'MULTIPOINT_DIRECT' in state.FILES and state.FILES.MULTIPOINT_DIRECT[0]: 
         state.FILES['DIRECT'] = state.FILES.MULTIPOINT_DIRECT[0]
 
     # If flow.meta file for the first point is available, rename it before using it
     if 'MULTIPOINT_FLOW_META' in state.FILES and state.FILES.MULTIPOINT_FLOW_META[0]:
-        os.rename(state.FILES.MULTIPOINT_FLOW_META[0], 'flow.meta')
+        os.rename(su2io.work_path(state.FILES.MULTIPOINT_FLOW_META[0]), su2io.work_path('flow.meta'))
         state.FILES['FLOW_META'] = 'flow.meta'
 
-    func[0] = aerodynamics(config,state)
+    # point partitions, config is updated by reference
+    number_part = config.NUMBER_PART
+    config.NUMBER_PART = n_part
+    try:
+        func = aerodynamics(config,state)
+    finally:
+        config.NUMBER_PART = number_part
     
     # change name of flow.meta back to multipoint name
-    if os.path.exists('flow.meta'):
-        os.rename('flow.meta', flow_meta_list[0])
-        state.FILES['FLOW_META'] = flow_meta_list[0]
+    if os.path.exists(su2io.work_path('flow.meta')):
+        os.rename(su2io.work_path('flow.meta'), su2io.work_path(flow_meta))
+        state.FILES['FLOW_META'] = flow_meta
 
-    src = os.getcwd()
-    src = os.path.abspath(src).rstrip('/')+'/DIRECT/'
+    src = su2io.work_path('DIRECT')
 
     # files to pull
     files = state.FILES
@@ -565,6 +744,8 @@ def multipoint( config, state=None, step=1e-2 ):
     # files: meta data for the flow    
     if 'FLOW_META' in files:
         pull.append(files['FLOW_META'])
+
+    special_cases = su2io.get_specialCases(config)
     
     # files: target equivarea distribution
     if ( 'EQUIV_AREA' in special_cases and
@@ -582,170 +763,130 @@ def multipoint( config, state=None, step=1e-2 ):
         pull.append( files['TARGET_HEATFLUX'] )
 
     # pull needed files, start folder_0
-    with redirect_folder( folder[0], pull, link ) as push:
-        with redirect_output(log_direct):
+    with redirect_folder( folder, pull, link ) as push:
 
-            konfig = copy.deepcopy(config)
-            ztate  = copy.deepcopy(state)
-            # Reset restart to original value 
-            konfig['RESTART_SOL'] = restart_sol
+        # make unix link
+        dst = su2io.work_path('DIRECT')
+        if not os.path.lexists(dst):
+            os.symlink(src,dst)
 
-            dst = os.getcwd()
-            dst = os.path.abspath(dst).rstrip('/')+'/'+'DIRECT'
+    return func
 
-            # make unix link
-            string = "ln -s " + src + " " + dst
-            stringlist = string.split()
-            subprocess.Popen(stringlist)
+#: def _multipoint_first()
 
-    for i in range(len(weight_list)-1):
+def _multipoint_point( konfig, ztate, folder, flow_meta, restart_sol, log_direct, multi_mesh ):
+    """ func = _multipoint_point(konfig,ztate,folder,flow_meta,restart_sol,log_direct,multi_mesh)
+        runs one of the other points in its folder, and links its 
+        solution into the working folder
+    """
 
-        konfig = copy.deepcopy(config)
-        ztate  = copy.deepcopy(state)
+    # Reset restart to original value
+    konfig['RESTART_SOL'] = restart_sol
 
-        konfig.SOLUTION_FILENAME = solution_flow_list[i+1]
+    files = ztate.FILES
+    link = []
+    pull = []
 
-        # delete direct solution file from previous point
-        if 'DIRECT' in ztate.FILES:
-            del ztate.FILES.DIRECT
+    # files: mesh
+    name = files['MESH']
+    name = su2io.expand_part(name,konfig)
+    link.extend(name)
 
-        if 'FLOW_META' in ztate.FILES:
-            del ztate.FILES.FLOW_META
+    # files: direction solution
+    if 'DIRECT' in files:
+        name = files['DIRECT']
+        name = su2io.expand_time(name,konfig)
+        link.extend( name )
+    else:
+        konfig['RESTART_SOL'] = 'NO'
 
-        # use direct solution file from relevant point
-        if 'MULTIPOINT_DIRECT' in state.FILES and state.FILES.MULTIPOINT_DIRECT[i+1]: 
-            ztate.FILES['DIRECT'] = state.FILES.MULTIPOINT_DIRECT[i+1]
+    # files: meta data for the flow
+    if 'FLOW_META' in files:
+        pull.append(files['FLOW_META'])
 
-        # use flow.meta file from relevant point
-        if 'MULTIPOINT_FLOW_META' in state.FILES and state.FILES.MULTIPOINT_FLOW_META[i+1]:
-            ztate.FILES['FLOW_META'] = state.FILES.MULTIPOINT_FLOW_META[i+1]
+    # pull needed files, start folder
+    with redirect_folder( folder, pull, link ) as push:
+        with redirect_output(log_direct):
 
-        # use mesh file from relevant point
-        if 'MULTIPOINT_MESH_FILENAME' in ztate.FILES:
-            ztate.FILES.MESH = ztate.FILES.MULTIPOINT_MESH_FILENAME[i+1]
-            konfig.MESH_FILENAME= ztate.FILES.MULTIPOINT_MESH_FILENAME[i+1]
-            konfig['DV_VALUE_OLD'] = dv_value_old
+            # Perform deformation on multipoint mesh
+            if multi_mesh:
+                info = update_mesh(konfig,ztate)
 
-        files = ztate.FILES
-        link = []
-        pull = []
+            # rename meta data to flow.meta
+            if 'FLOW_META' in ztate.FILES:
+                os.rename(su2io.work_path(ztate.FILES.FLOW_META), su2io.work_path('flow.meta'))
+                ztate.FILES['FLOW_META'] = 'flow.meta'
 
-        # files: mesh
-        name = files['MESH']
-        name = su2io.expand_part(name,konfig)
-        link.extend(name)
+            func = aerodynamics(konfig,ztate)
+
+            dst = su2io.getcwd()
 
-        # files: direction solution
-        if 'DIRECT' in files:
-            name = files['DIRECT']
+            # revert name of flow.meta file to multipoint name
+            if os.path.exists(su2io.work_path('flow.meta')):
+                os.rename(su2io.work_path('flow.meta'), su2io.work_path(flow_meta))
+                ztate.FILES['FLOW_META'] = flow_meta
+                push.append(ztate.FILES['FLOW_META'])
+            
+            # direct files to push
+            name = ztate.FILES['DIRECT']
+            name = su2io.expand_zones(name,konfig)
             name = su2io.expand_time(name,konfig)
-            link.extend( name )
-        else:
-            konfig['RESTART_SOL'] = 'NO'
+            push.extend(name)
 
-        # files: meta data for the flow
-        if 'FLOW_META' in files:
-            pull.append(files['FLOW_META'])
+            if multi_mesh:
+                # Mesh files to push
+                name = ztate.FILES['MESH']
+                name = su2io.expand_part(name,konfig)
+                push.extend(name)
 
-        # pull needed files, start folder_1
-        with redirect_folder( folder[i+1], pull, link ) as push:
-            with redirect_output(log_direct):
+    # Link the pushed files back into the MULTIPOINT_# folder
+    names = [ ztate.FILES['DIRECT'] ]
+    if multi_mesh:
+        names.append(ztate.FILES['MESH'])
+    if 'FLOW_META' in ztate.FILES:
+        names.append(ztate.FILES['FLOW_META'])
 
-                # Perform deformation on multipoint mesh
-                if 'MULTIPOINT_MESH_FILENAME' in state.FILES:
-                    info = update_mesh(konfig,ztate)
-                
-                # Update config values
-                konfig.AOA = aoa_list[i+1]
-                konfig.SIDESLIP_ANGLE = sideslip_list[i+1]
-                konfig.MACH_NUMBER = mach_list[i+1]
-                konfig.REYNOLDS_NUMBER = reynolds_list[i+1]
-                konfig.FREESTREAM_TEMPERATURE = freestream_temp_list[i+1]
-                konfig.FREESTREAM_PRESSURE = freestream_press_list[i+1]
-                konfig.TARGET_CL = target_cl_list[i+1]
-                orig_marker_outlet = config['MARKER_OUTLET']
-                orig_marker_outlet = orig_marker_outlet.replace("(", "").replace(")", "").split(',')
-                new_marker_outlet = "(" + orig_marker_outlet[0] + "," + outlet_value_list[i+1] + ")"
-                konfig.MARKER_OUTLET = new_marker_outlet
-
-                ztate.FUNCTIONS.clear()
-
-                # rename meta data to flow.meta
-                if 'FLOW_META' in ztate.FILES:
-                    ztate.FILES['FLOW_META'] = 'flow.meta'
-                    os.rename(ztate.FILES.MULTIPOINT_FLOW_META[i+1], 'flow.meta')
-
-                func[i+1] = aerodynamics(konfig,ztate)
-
-                dst = os.getcwd()
-
-                # revert name of flow.meta file to multipoint name
-                if os.path.exists('flow.meta'):
-                    os.rename('flow.meta', flow_meta_list[i+1])
-                    ztate.FILES['FLOW_META'] = flow_meta_list[i+1]
-                    dst_flow_meta = os.path.abspath(dst).rstrip('/')+'/'+ztate.FILES['FLOW_META']
-                    push.append(ztate.FILES['FLOW_META'])
-                
-                # direct files to push
-                dst_direct = os.path.abspath(dst).rstrip('/')+'/'+ztate.FILES['DIRECT']
-                name = ztate.FILES['DIRECT']
-                name = su2io.expand_zones(name,konfig)
-                name = su2io.expand_time(name,konfig)
-                push.extend(name)
+    for name in names:
+        src = su2io.work_path(name)
+        dst_name = os.path.join(dst,name)
+        if os.path.exists(src) and not os.path.lexists(dst_name):
+            os.symlink(src, dst_name)
 
-                if 'MULTIPOINT_MESH_FILENAME' in state.FILES:
-                    # Mesh files to push
-                    dst_mesh = os.path.abspath(dst).rstrip('/')+'/'+ztate.FILES['MESH']
-                    name = ztate.FILES['MESH']
-                    name = su2io.expand_part(name,konfig)
-                    push.extend(name)
+    return func
 
+#: def _multipoint_point()
 
-        # Link direct solution to MULTIPOINT_# folder
-        src = os.getcwd()
-        src_direct = os.path.abspath(src).rstrip('/')+'/'+ztate.FILES['DIRECT']
+def _run_points( run_point, n_points, n_jobs ):
+    """ results = _run_points(run_point,n_points,n_jobs)
+        calls run_point(i) for each point, n_jobs at a time, 
+        the points run in the working folder of the caller
+    """
 
-        # make unix link
-        os.symlink(src_direct, dst_direct)
-        
-        # If the mesh doesn't already exist, link it
-        if 'MULTIPOINT_MESH_FILENAME' in state.FILES:
-            src_mesh = os.path.abspath(src).rstrip('/')+'/'+ztate.FILES['MESH']
-            if not os.path.exists(src_mesh): 
-                os.symlink(src_mesh, dst_mesh)
-
-        # link flow.meta
-        if 'MULTIPOINT_FLOW_META' in state.FILES:
-            src_flow_meta = os.path.abspath(src).rstrip('/')+'/'+ztate.FILES['FLOW_META']
-            if not os.path.exists(src_flow_meta): 
-                os.symlink(src_flow_meta, dst_flow_meta)
+    if n_jobs <= 1:
+        return [ run_point(i) for i in range(n_points) ]
 
-    # Update MULTIPOINT_DIRECT in state.FILES
-    state.FILES.MULTIPOINT_DIRECT = solution_flow_list
-    if 'FLOW_META' in state.FILES:
-        state.FILES.MULTIPOINT_FLOW_META = flow_meta_list
-      
-    # ----------------------------------------------------
-    #  WEIGHT FUNCTIONS
-    # ----------------------------------------------------
-        
-    for derv_name in su2io.optnames_multi:
-        matches = [ k for k in opt_names if k in derv_name ]
-        if not len(matches) == 1: continue
-        func_name = matches[0]
-        obj_func = 0.0
-        for i in range(len(weight_list)):
-            obj_func = obj_func + float(weight_list[i])*func[i][func_name]
-        
-        state.FUNCTIONS[derv_name] = obj_func
+    origin = su2io.getcwd()
 
-    # return output
-    funcs = su2util.ordered_bunch()
-    for key in su2io.optnames_multi:
-        if key in state['FUNCTIONS']:
-            funcs[key] = state['FUNCTIONS'][key]
-    
-    return funcs
+    def run_in_origin(i):
+        with redirect_folder(origin,chdir=False):
+            return run_point(i)
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        return list(executor.map(run_in_origin,range(n_points)))
+
+#: def _run_points()
+
+def warm_start( config ):
+    """ warm = SU2.eval.functions.warm_start(config)
+        True if the direct and adjoint solutions of a design restart 
+        from the solution files in its state, set by WARM_START=YES.
+        Only for steady problems, unsteady restarts follow RESTART_SOL.
+    """
+    return ( config.get('WARM_START','NO') == 'YES' and 
+             config.get('TIME_DOMAIN','NO') != 'YES' )
+
+#: def warm_start()
 
 
 # ----------------------------------------------------------------------
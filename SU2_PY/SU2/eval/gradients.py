@@ -33,7 +33,8 @@ import os, sys, shutil, copy, subprocess
 from .. import run  as su2run
 from .. import io   as su2io
 from .. import util as su2util
-from .functions import function, update_mesh
+from .functions import function, update_mesh, warm_start, _run_points
+from .functions import _stability_steps, _stability_difference
 from ..io import redirect_folder, redirect_output
 from SU2.eval import functions
 
@@ -55,6 +56,7 @@ def gradient( func_name, method, config, state=None ):
             Mesh need not be deformed.
             Updates config and state by reference.
             Redundancy if state.GRADIENTS has the key func_name.
+            Results are cached in RESULT_CACHE, see SU2.io.ResultCache.
 
         Executes in:
             ./ADJOINT_* or ./FINDIFF
@@ -84,6 +86,14 @@ def gradient( func_name, method, config, state=None ):
         config.OPT_COMBINE_OBJECTIVE="NO"
         config.OBJECTIVE_WEIGHT = "1.0"
 
+    # result cache, results of an earlier run with the same design
+    cache = None
+    if not func_output in state['GRADIENTS']:
+        cache = su2io.result_cache(config)
+        if cache is not None:
+            cache_key = cache.key(config)
+            cache.load(cache_key,state,method)
+
     # redundancy check
     if not func_output in state['GRADIENTS']:
 
@@ -126,6 +136,9 @@ def gradient( func_name, method, config, state=None ):
         
         # store
         state['GRADIENTS'].update(grads)
+        
+        if cache is not None:
+            cache.save(cache_key,config,state,grads,method)
 
     # if not redundant
 
@@ -157,6 +170,7 @@ def adjoint( func_name, config, state=None ):
             Updates config and state by reference.
             Adjoint Redundancy if state.GRADIENTS has key func_name.
             Direct Redundancy if state.FUNCTIONS has key func_name.
+            Restarts from state.FILES.ADJOINT_<func_name> if WARM_START=YES.
 
         Executes in:
             ./ADJOINT_<func_name>
@@ -264,6 +278,8 @@ def adjoint( func_name, config, state=None ):
         name = su2io.expand_zones(name,konfig)
         name = su2io.expand_time(name,konfig)
         link.extend(name)       
+        if warm_start(konfig):
+            konfig['RESTART_SOL'] = 'YES'
     else:
         config['RESTART_SOL'] = 'NO' #Can this be deleted?
         if config.get('TIME_DOMAIN', 'NO') != 'YES':  # rules out steady state optimization special cases.
@@ -339,13 +355,102 @@ def adjoint( func_name, config, state=None ):
 
 #: def adjoint()
 
+def adjoint_batch( tasks, method, config, state=None ):
+    """ grads = SU2.eval.adjoint_batch(tasks,method,config,state=None)
+
+        Evaluates the adjoint gradients of several functions of one 
+        design, all sharing one direct solution.
+
+        The direct solution is run first, with config. Then the 
+        adjoints are run, ADJOINT_JOBS at once, default 1, each in 
+        its ./ADJOINT_<func_name> folder with SU2.eval.grad() and a 
+        copy of config updated with the options of its task.
+
+        Assumptions:
+            Updates state by reference, with the gradients and 
+            adjoint files of all tasks.
+            Functions with a gradient in state, or that are not solved
+            with an adjoint, are skipped.
+
+        Inputs:
+            tasks     - list of (func_name,options), options is a dict
+                        of config options of the adjoint of func_name,
+                        such as the MARKER_MONITORING of the function
+            method    - 'CONTINUOUS_ADJOINT' or 'DISCRETE_ADJOINT'
+            config    - an SU2 config, for the direct solution
+            state     - optional, an SU2 state
+
+        Outputs:
+            A Bunch() with keys of objective function names
+            and values of list of floats of gradient values
+    """
+
+    state = su2io.State(state)
+    grads = su2util.ordered_bunch()
+
+    # adjoints to run, one for each output
+    todo = []
+    for func_name,options in tasks:
+        func_output = func_name
+        if type(func_name) == list:
+            func_output = 'COMBO'
+            combine_obj = options.get('OPT_COMBINE_OBJECTIVE',config.get('OPT_COMBINE_OBJECTIVE','NO'))
+            if combine_obj != 'YES': continue
+        elif not ( func_name in su2io.historyOutFields and 
+                   su2io.historyOutFields[func_name]['TYPE'] == 'COEFFICIENT' ):
+            continue
+        if func_output in state['GRADIENTS']: continue
+        if func_output in [ output for output,_,_ in todo ]: continue
+        todo.append( (func_output,func_name,options) )
+
+    if not todo:
+        return grads
+
+    # direct solution, shared by the adjoints
+    # updates config with the deformed mesh
+    function( todo[0][1], config, state )
+
+    n_jobs = int(config.get('ADJOINT_JOBS',1))
+
+    def run_point(i):
+        func_output,func_name,options = todo[i]
+        konfig = copy.deepcopy(config)
+        konfig.update(options)
+        ztate  = copy.deepcopy(state)
+        gradient( func_name, method, konfig, ztate )
+        return ztate
+
+    ztates = _run_points(run_point,len(todo),n_jobs)
+
+    # merge, in task order
+    for (func_output,func_name,options),ztate in zip(todo,ztates):
+        state.update(ztate)
+        grads[func_output] = state['GRADIENTS'][func_output]
+
+    return grads
+
+#: def adjoint_batch()
+
 
 # ----------------------------------------------------------------------
 #  Stability Functions
 # ----------------------------------------------------------------------
 
 def stability( func_name, config, state=None, step=1e-2 ):
+    """ vals = SU2.eval.gradients.stability(func_name,config,state=None,step=1e-2)
+
+        Evaluates the gradient of an angle of attack derivative, by
+        finite differencing the adjoint gradients with STABILITY_SCHEME.
+        Uses the direct solutions of SU2.eval.stability().
 
+        The adjoints of the perturbed points restart from the adjoint 
+        solution of the central point. If state has an adjoint solution, 
+        all points are run at once, otherwise the perturbed points wait 
+        for the central point. STABILITY_JOBS points are run at once.
+
+        Executes in:
+            ./ADJOINT_* and ./STABILITY, ./STABILITY_M
+    """
 
     folder = 'STABILITY' # os.path.join('STABILITY',func_name) #STABILITY/D_MOMENT_Y_D_ALPHA/
 
@@ -357,7 +462,6 @@ def stability( func_name, config, state=None, step=1e-2 ):
     state = su2io.State(state)
     if not 'MESH' in state.FILES:
         state.FILES.MESH = config['MESH_FILENAME']
-    special_cases = su2io.get_specialCases(config)
 
     # find base func name
     matches = [ k for k in su2io.optnames_aero if k in func_name ]
@@ -373,6 +477,10 @@ def stability( func_name, config, state=None, step=1e-2 ):
     else:
         log_direct = None
 
+    # differencing scheme and jobs
+    steps, folders = _stability_steps(config,step,folder)
+    n_jobs = int(config.get('STABILITY_JOBS',1))
+
     # ----------------------------------------------------    
     #  Update Mesh
     # ----------------------------------------------------
@@ -381,24 +489,66 @@ def stability( func_name, config, state=None, step=1e-2 ):
     info = update_mesh(config,state) 
 
     # ----------------------------------------------------    
-    #  CENTRAL POINT
+    #  Central and Perturbed Points
     # ----------------------------------------------------    
 
-    # will run in ADJOINT/
-    grads_0 = gradient(base_name,'CONTINUOUS_ADJOINT',config,state)
+    # central point will run in ADJOINT/
+
+    if ADJ_NAME in state.FILES:
+        # all points at once, restart from the current adjoint,
+        # copied before the central point rewrites it
+        konfig = copy.deepcopy(config)
+        ztate  = copy.deepcopy(state)
+        for folder_i in folders:
+            name = su2io.expand_time(ztate.FILES[ADJ_NAME],konfig)
+            with redirect_folder(folder_i,pull=name,chdir=False):
+                pass
+        def run_point(i):
+            if i == 0:
+                return gradient(base_name,'CONTINUOUS_ADJOINT',config,state)
+            return _stability_point(base_name,konfig,ztate,folders[i-1],steps[i-1],log_direct,copied=True)
+        grads = _run_points(run_point,len(steps)+1,n_jobs)
 
+    else:
+        # perturbed points restart from the central adjoint
+        grads = [ gradient(base_name,'CONTINUOUS_ADJOINT',config,state) ]
+        def run_point(i):
+            return _stability_point(base_name,config,state,folders[i],steps[i],log_direct)
+        grads.extend( _run_points(run_point,len(steps),n_jobs) )
 
     # ----------------------------------------------------    
-    #  Run Forward Point
-    # ----------------------------------------------------   
+    #  DIFFERENCING
+    # ----------------------------------------------------
+
+    grads = [ _stability_difference(values,steps) for values in zip(*grads) ]
+
+    state.GRADIENTS[func_name] = grads
+    grads_out = su2util.ordered_bunch()
+    grads_out[func_name] = grads
+
+    return grads_out
+
+#: def stability()
+
+def _stability_point( base_name, config, state, folder, step, log_direct, copied=False ):
+    """ grad = _stability_point(base_name,config,state,folder,step,log_direct,copied=False)
+        runs the adjoint at AOA+step in folder, restarting from the 
+        adjoint solution of state, linked into folder, or already 
+        copied there if copied is True
+    """
+
+    ADJ_NAME = 'ADJOINT_'+base_name
+
+    konfig = copy.deepcopy(config)
+    ztate  = copy.deepcopy(state)
 
     # files to pull
-    files = state.FILES
+    files = ztate.FILES
     pull = []; link = []
 
     # files: mesh
     name = files['MESH']
-    name = su2io.expand_part(name,config)
+    name = su2io.expand_part(name,konfig)
     link.extend(name)
 
     # files: direct solution
@@ -407,10 +557,10 @@ def stability( func_name, config, state=None, step=1e-2 ):
     # files: adjoint solution
     if ADJ_NAME in files:
         name = files[ADJ_NAME]
-        name = su2io.expand_time(name,config)
-        link.extend(name)       
+        name = su2io.expand_time(name,konfig)
+        if not copied: link.extend(name)
     else:
-        config['RESTART_SOL'] = 'NO'        
+        konfig['RESTART_SOL'] = 'NO'        
 
     # files: target equivarea adjoint weights
     ## DO NOT PULL EQUIVAREA WEIGHTS, use the one in STABILITY/
@@ -420,32 +570,19 @@ def stability( func_name, config, state=None, step=1e-2 ):
     with redirect_folder( folder, pull, link ) as push:
         with redirect_output(log_direct):     
 
-            konfig = copy.deepcopy(config)
-            ztate  = copy.deepcopy(state)
-
             # TODO: GENERALIZE
             konfig.AOA = konfig.AOA + step
 
             # let's start somethin somthin
-            del ztate.GRADIENTS[base_name]
+            ztate.GRADIENTS.pop(base_name,None)
             #ztate.find_files(konfig)
 
             # the gradient
-            grads_1 = gradient(base_name,'CONTINUOUS_ADJOINT',konfig,ztate)
+            grad = gradient(base_name,'CONTINUOUS_ADJOINT',konfig,ztate)
 
+    return grad
 
-    # ----------------------------------------------------    
-    #  DIFFERENCING
-    # ----------------------------------------------------
-
-    grads = [ ( g_1 - g_0 ) / step 
-              for g_1,g_0 in zip(grads_1,grads_0) ]
-
-    state.GRADIENTS[func_name] = grads
-    grads_out = su2util.ordered_bunch()
-    grads_out[func_name] = grads
-
-    return grads_out
+#: def _stability_point()
 
 
 # ----------------------------------------------------------------------
@@ -453,7 +590,18 @@ def stability( func_name, config, state=None, step=1e-2 ):
 # ----------------------------------------------------------------------
 
 def multipoint( func_name, config, state=None, step=1e-2 ):
-  
+    """ vals = SU2.eval.gradients.multipoint(func_name,config,state=None)
+
+        Evaluates the adjoint gradient at each point of the
+        MULTIPOINT_* lists and their weighted sum.
+
+        MULTIPOINT_JOBS points are run at once, each with
+        MULTIPOINT_NUMBER_PART partitions (default NUMBER_PART).
+
+        Executes in:
+            ./ADJOINT_* and ./MULTIPOINT_*
+    """
+
     mach_list = config['MULTIPOINT_MACH_NUMBER'].replace("(", "").replace(")", "").split(',')
     reynolds_list = config['MULTIPOINT_REYNOLDS_NUMBER'].replace("(", "").replace(")", "").split(',')
     freestream_temp_list = config['MULTIPOINT_FREESTREAM_TEMPERATURE'].replace("(", "").replace(")", "").split(',')    
@@ -466,19 +614,14 @@ def multipoint( func_name, config, state=None, step=1e-2 ):
     solution_adj_list = su2io.expand_multipoint(config.SOLUTION_ADJ_FILENAME, config)
     flow_meta_list = su2io.expand_multipoint('flow.meta', config)
     restart_sol = config['RESTART_SOL']
-    grads = []
-    folder = []
-    for i in range(len(weight_list)):
-        grads.append(0)
-        folder.append(0)
-
-    for i in range(len(weight_list)):
-        folder[i] = 'MULTIPOINT_' + str(i)
-
-    opt_names = []
-    for key in su2io.historyOutFields:
-        if su2io.historyOutFields[key]['TYPE'] == 'COEFFICIENT':
-            opt_names.append(key)
+
+    n_points = len(weight_list)
+    n_jobs = int(config.get('MULTIPOINT_JOBS',1))
+    n_part = int(config.get('MULTIPOINT_NUMBER_PART',config.NUMBER_PART))
+
+    folder = [ 'MULTIPOINT_' + str(i) for i in range(n_points) ]
+
+    opt_names = list(su2io.optnames_aero)
     
     # ----------------------------------------------------
     #  Initialize
@@ -513,11 +656,9 @@ def multipoint( func_name, config, state=None, step=1e-2 ):
 #    info = update_mesh(config,state)
     
     # ----------------------------------------------------
-    #  FIRST POINT
+    #  Setup Points
     # ----------------------------------------------------
     
-    # will run in ADJOINT/
-    
     config.AOA = aoa_list[0]
     config.SIDESLIP_ANGLE = sideslip_list[0]
     config.MACH_NUMBER = mach_list[0]
@@ -530,25 +671,128 @@ def multipoint( func_name, config, state=None, step=1e-2 ):
     if MULTIPOINT_ADJ_NAME in state.FILES and state.FILES[MULTIPOINT_ADJ_NAME][0]:
         state.FILES[ADJ_NAME] = state.FILES[MULTIPOINT_ADJ_NAME][0]
 
-    # If flow.meta file for the first point is available, rename it before using it
-    if os.path.exists(flow_meta_list[0]):
-        os.rename(flow_meta_list[0], 'flow.meta')
-        state.FILES['FLOW_META'] = 'flow.meta'
+    # configs and states of the other points,
+    # copied before the first point updates config and state
+    konfigs = [ config ]
+    ztates  = [ state ]
+    for i in range(1,n_points):
+        
+        konfig = copy.deepcopy(config)
+        ztate  = copy.deepcopy(state)
+        # Reset RESTART_SOL to original value
+        konfig['RESTART_SOL'] = restart_sol
+        konfig.NUMBER_PART = n_part
+        # Set correct config option names
+        konfig.SOLUTION_FILENAME = solution_flow_list[i]
+        konfig.SOLUTION_ADJ_FILENAME = solution_adj_list[i]
+        
+        # Delete file of the first point
+        if ADJ_NAME in ztate.FILES:
+            del ztate.FILES[ADJ_NAME]
 
-    grads[0] = gradient(base_name,'DISCRETE_ADJOINT',config,state)
+        if 'FLOW_META' in ztate.FILES:
+            del ztate.FILES['FLOW_META']
 
-    src = os.getcwd()
-    src = os.path.abspath(src).rstrip('/') + '/' + ADJ_NAME + '/'
+        # Update ADJOINT filename with MULTIPOINT_ADJOINT filename
+        if MULTIPOINT_ADJ_NAME in state.FILES and state.FILES[MULTIPOINT_ADJ_NAME][i]:
+            ztate.FILES[ADJ_NAME] = state.FILES[MULTIPOINT_ADJ_NAME][i]
 
-    # change name of flow.meta back to multipoint name
-    if os.path.exists('flow.meta'):
-        os.rename('flow.meta',flow_meta_list[0])
-        state.FILES['FLOW_META'] = flow_meta_list[0]
+        if 'MULTIPOINT_MESH_FILENAME' in ztate.FILES:
+            if 'deform' in ztate.FILES.MESH:
+                ztate.FILES.MESH = su2io.add_suffix(ztate.FILES.MULTIPOINT_MESH_FILENAME[i],'deform')
+                konfig.MESH_FILENAME= su2io.add_suffix(ztate.FILES.MULTIPOINT_MESH_FILENAME[i],'deform')
+            else:
+                ztate.FILES.MESH = ztate.FILES.MULTIPOINT_MESH_FILENAME[i]
+                konfig.MESH_FILENAME= ztate.FILES.MULTIPOINT_MESH_FILENAME[i]
+
+        # use flow.meta file from relevant point
+        if 'MULTIPOINT_FLOW_META' in state.FILES and state.FILES.MULTIPOINT_FLOW_META[i]:
+            ztate.FILES['FLOW_META'] = state.FILES.MULTIPOINT_FLOW_META[i]
+
+        ztate.FILES['DIRECT'] = state.FILES.MULTIPOINT_DIRECT[i]
+
+        # Set the multipoint options   
+        konfig.AOA = aoa_list[i]
+        konfig.SIDESLIP_ANGLE = sideslip_list[i]
+        konfig.MACH_NUMBER = mach_list[i]
+        konfig.REYNOLDS_NUMBER = reynolds_list[i]
+        konfig.FREESTREAM_TEMPERATURE = freestream_temp_list[i]
+        konfig.FREESTREAM_PRESSURE = freestream_press_list[i]
+        konfig.TARGET_CL = target_cl_list[i]
+
+        # let's start somethin somthin
+        ztate.GRADIENTS.clear()
+
+        konfigs.append(konfig)
+        ztates.append(ztate)
+
+    # ----------------------------------------------------
+    #  Run Points
+    # ----------------------------------------------------
+
+    def run_point(i):
+        if i == 0:
+            return _multipoint_first(base_name,konfigs[0],ztates[0],folder[0],
+                                     flow_meta_list[0],solution_adj_list,n_part)
+        else:
+            return _multipoint_point(base_name,konfigs[i],ztates[i],folder[i],
+                                     flow_meta_list[i],solution_adj_list,i,log_direct)
+
+    grads = _run_points(run_point,n_points,n_jobs)
+    
+    # Update MULTPOINT_ADJOINT files in state.FILES
+    state.FILES[MULTIPOINT_ADJ_NAME] = solution_adj_list
 
     # ----------------------------------------------------
-    #  Run Multipoint
+    #  WEIGHT FUNCTIONS
     # ----------------------------------------------------
     
+    grad = []
+    for variable in range(len(grads[0])):
+        grad.append(0)
+
+    for variable in range(len(grads[0])):
+        grad[variable] = 0.0
+        for point in range(len(weight_list)):
+            grad[variable] = grad[variable] + float(weight_list[point])*grads[point][variable]
+      
+    state.GRADIENTS[func_name] = grad
+    grads_out = su2util.ordered_bunch()
+    grads_out[func_name] = grad
+                 
+    return grads_out
+
+#: def multipoint()
+
+
+def _multipoint_first( base_name, config, state, folder, flow_meta, solution_adj_list, n_part ):
+    """ grad = _multipoint_first(base_name,config,state,folder,flow_meta,solution_adj_list,n_part)
+        runs the adjoint of the first point in ./ADJOINT_*, updates 
+        config and state, and links ./ADJOINT_* into the point folder
+    """
+
+    ADJ_NAME = 'ADJOINT_' + base_name
+
+    # If flow.meta file for the first point is available, rename it before using it
+    if os.path.exists(su2io.work_path(flow_meta)):
+        os.rename(su2io.work_path(flow_meta), su2io.work_path('flow.meta'))
+        state.FILES['FLOW_META'] = 'flow.meta'
+
+    # point partitions, config is updated by reference
+    number_part = config.NUMBER_PART
+    config.NUMBER_PART = n_part
+    try:
+        grad = gradient(base_name,'DISCRETE_ADJOINT',config,state)
+    finally:
+        config.NUMBER_PART = number_part
+
+    src = su2io.work_path(ADJ_NAME)
+
+    # change name of flow.meta back to multipoint name
+    if os.path.exists(su2io.work_path('flow.meta')):
+        os.rename(su2io.work_path('flow.meta'),su2io.work_path(flow_meta))
+        state.FILES['FLOW_META'] = flow_meta
+
     # files to pull
     files = state.FILES
     pull = []; link = []
@@ -574,144 +818,86 @@ def multipoint( func_name, config, state=None, step=1e-2 ):
     ## DO NOT PULL EQUIVAREA WEIGHTS, use the one in MULTIPOINT/
 
     # pull needed files, start folder
-    with redirect_folder( folder[0], pull, link ) as push:
-        with redirect_output(log_direct):
+    with redirect_folder( folder, pull, link ) as push:
 
-            konfig = copy.deepcopy(config)
-            ztate  = copy.deepcopy(state)
+        # make unix link
+        dst = su2io.work_path(ADJ_NAME)
+        if not os.path.lexists(dst):
+            os.symlink(src,dst)
 
-            dst = os.getcwd()
-            dst = os.path.abspath(dst).rstrip('/')+'/'
+    return grad
 
-            # make unix link
-            string = "ln -s " + src + " " + dst
-            string_list = string.split()
-            subprocess.Popen(string_list)
+#: def _multipoint_first()
 
-    for i in range(len(weight_list)-1):
-        
-        konfig = copy.deepcopy(config)
-        ztate  = copy.deepcopy(state)
-        # Reset RESTART_SOL to original value
-        konfig['RESTART_SOL'] = restart_sol
-        # Set correct config option names
-        konfig.SOLUTION_FILENAME = solution_flow_list[i+1]
-        konfig.SOLUTION_ADJ_FILENAME = solution_adj_list[i+1]
-        
-        # Delete file run in previous case
-        if ADJ_NAME in ztate.FILES:
-            del ztate.FILES[ADJ_NAME]
+def _multipoint_point( base_name, konfig, ztate, folder, flow_meta, solution_adj_list, i, log_direct ):
+    """ grad = _multipoint_point(base_name,konfig,ztate,folder,flow_meta,solution_adj_list,i,log_direct)
+        runs the adjoint of one of the other points in its folder,
+        and links its solution into the working folder
+    """
 
-        # Update ADJOINT filename with MULTIPOINT_ADJOINT filename
-        if MULTIPOINT_ADJ_NAME in state.FILES and state.FILES[MULTIPOINT_ADJ_NAME][i+1]:
-            ztate.FILES[ADJ_NAME] = state.FILES[MULTIPOINT_ADJ_NAME][i+1]
+    ADJ_NAME = 'ADJOINT_' + base_name
 
-        if 'MULTIPOINT_MESH_FILENAME' in ztate.FILES:
-            if 'deform' in ztate.FILES.MESH:
-                ztate.FILES.MESH = su2io.add_suffix(ztate.FILES.MULTIPOINT_MESH_FILENAME[i+1],'deform')
-                konfig.MESH_FILENAME= su2io.add_suffix(ztate.FILES.MULTIPOINT_MESH_FILENAME[i+1],'deform')
-            else:
-                ztate.FILES.MESH = ztate.FILES.MULTIPOINT_MESH_FILENAME[i+1]
-                konfig.MESH_FILENAME= ztate.FILES.MULTIPOINT_MESH_FILENAME[i+1]
+    files = ztate.FILES
+    link = []
+    pull = []
 
-        # use flow.meta file from relevant point
-        if 'MULTIPOINT_FLOW_META' in state.FILES and state.FILES.MULTIPOINT_FLOW_META[i+1]:
-            ztate.FILES['FLOW_META'] = state.FILES.MULTIPOINT_FLOW_META[i+1]
+    # files: mesh
+    name = files['MESH']
+    name = su2io.expand_part(name,konfig)
+    link.extend(name)
 
-        files = ztate.FILES
-        link = []
-        files['DIRECT'] = state.FILES.MULTIPOINT_DIRECT[i+1]
+    # files: direct solution
+    if 'DIRECT' in files:
+        name = files['DIRECT']
+        name = su2io.expand_time(name,konfig)
+        link.extend( name )
 
-        # files: mesh
-        name = files['MESH']
-        name = su2io.expand_part(name,konfig)
+    # files: adjoint solution
+    if ADJ_NAME in files:
+        name = files[ADJ_NAME]
+        name = su2io.expand_time(name,konfig)
         link.extend(name)
+    else:
+        konfig['RESTART_SOL'] = 'NO'
 
-        # files: direct solution
-        if 'DIRECT' in files:
-            name = files['DIRECT']
-            name = su2io.expand_time(name,konfig)
-            link.extend( name )
+    # files: meta data of solution
+    if 'FLOW_META' in files:
+        pull.append(files['FLOW_META'])
+
+    # pull needed files, start folder
+    with redirect_folder( folder, pull, link ) as push:
+        with redirect_output(log_direct):
+            
+            # rename meta data to flow.meta
+            if 'FLOW_META' in ztate.FILES:
+                os.rename(su2io.work_path(ztate.FILES.FLOW_META), su2io.work_path('flow.meta'))
+                ztate.FILES['FLOW_META'] = 'flow.meta'
+
+            # the gradient
+            grad = gradient(base_name,'DISCRETE_ADJOINT',konfig,ztate)
+
+            # rename meta data to multipoint name
+            if os.path.exists(su2io.work_path('flow.meta')):
+                os.rename(su2io.work_path('flow.meta'), su2io.work_path(flow_meta))
 
-        # files: adjoint solution
-        if ADJ_NAME in files:
-            name = files[ADJ_NAME]
+            # adjoint files to push
+            dst = su2io.work_path(ztate.FILES[ADJ_NAME])
+            name = ztate.FILES[ADJ_NAME]
+            solution_adj_list[i] = name
+            name = su2io.expand_zones(name,konfig)
             name = su2io.expand_time(name,konfig)
-            link.extend(name)
-        else:
-            konfig['RESTART_SOL'] = 'NO'
+            push.extend(name)
 
-        # files: meta data of solution
-        if 'FLOW_META' in files:
-            pull.append(files['FLOW_META'])
+    # Link adjoint solution to MULTIPOINT_# folder
+    src = su2io.work_path(ztate.FILES[ADJ_NAME])
+    if not os.path.lexists(dst):
+        os.symlink(src,dst)
 
-        # pull needed files, start folder
-        with redirect_folder( folder[i+1], pull, link ) as push:
-            with redirect_output(log_direct):
-                
-                # Set the multipoint options   
-                konfig.AOA = aoa_list[i+1]
-                konfig.SIDESLIP_ANGLE = sideslip_list[i+1]
-                konfig.MACH_NUMBER = mach_list[i+1]
-                konfig.REYNOLDS_NUMBER = reynolds_list[i+1]
-                konfig.FREESTREAM_TEMPERATURE = freestream_temp_list[i+1]
-                konfig.FREESTREAM_PRESSURE = freestream_press_list[i+1]
-                konfig.TARGET_CL = target_cl_list[i+1]  
-
-                # rename meta data to flow.meta
-                if 'FLOW_META' in ztate.FILES:
-                    os.rename(ztate.FILES.MULTIPOINT_FLOW_META[i+1], 'flow.meta')
-                    ztate.FILES['FLOW_META'] = 'flow.meta'
- 
-                # let's start somethin somthin
-                ztate.GRADIENTS.clear()
-
-                # the gradient
-                grads[i+1] = gradient(base_name,'DISCRETE_ADJOINT',konfig,ztate)
-
-                # rename meta data to multipoint name
-                if os.path.exists('flow.meta'):
-                    os.rename('flow.meta', flow_meta_list[i+1])
-
-                # adjoint files to push
-                dst = os.getcwd()
-                dst = os.path.abspath(dst).rstrip('/')+'/'+ztate.FILES[ADJ_NAME]
-                name = ztate.FILES[ADJ_NAME]
-                solution_adj_list[i+1] = name
-                name = su2io.expand_zones(name,konfig)
-                name = su2io.expand_time(name,konfig)
-                push.extend(name)
-
-        # Link adjoint solution to MULTIPOINT_# folder
-        src = os.getcwd()
-        src = os.path.abspath(src).rstrip('/')+'/'+ztate.FILES[ADJ_NAME]
-      
-        # make unix link
-        string = "ln -s " + src + " " + dst
-        string_list = string.split()
-        subprocess.Popen(string_list)
-    
-    # Update MULTPOINT_ADJOINT files in state.FILES
-    state.FILES[MULTIPOINT_ADJ_NAME] = solution_adj_list
+    return grad
+
+#: def _multipoint_point()
 
-    # ----------------------------------------------------
-    #  WEIGHT FUNCTIONS
-    # ----------------------------------------------------
-    
-    grad = []
-    for variable in range(len(grads[0])):
-        grad.append(0)
 
-    for variable in range(len(grads[0])):
-        grad[variable] = 0.0
-        for point in range(len(weight_list)):
-            grad[variable] = grad[variable] + float(weight_list[point])*grads[point][variable]
-      
-    state.GRADIENTS[func_name] = grad
-    grads_out = su2util.ordered_bunch()
-    grads_out[func_name] = grad
-                 
-    return grads_out
 
 
 # ----------------------------------------------------------------------
@@ -727,6 +913,10 @@ def findiff( config, state=None ):
             SU2.run.deform()
             SU2.run.direct()
 
+        Each step is run in its own folder, FIN_DIFF_JOBS steps 
+        at a time, and each step runs SU2 with NUMBER_PART partitions.
+        Rows of the gradient file are written as variables complete.
+
         Assumptions:
             Config is already setup for deformation.
             Mesh may or may not be deformed.
@@ -735,7 +925,14 @@ def findiff( config, state=None ):
             Direct Redundancy if state.FUNCTIONS has key func_name.
 
         Executes in:
-            ./FINDIFF
+            ./FINDIFF/STEP_*
+
+        Config options:
+            FIN_DIFF_STEP    - step length, default 0.001
+            FIN_DIFF_SCHEME  - FORWARD (default) or CENTRAL
+            FIN_DIFF_JOBS    - number of steps run at once, default 1
+            FIN_DIFF_RESTART - YES, steps start from the base direct 
+                               solution, default NO
 
         Inputs:
             config - an SU2 config
@@ -767,15 +964,19 @@ def findiff( config, state=None ):
     else:
         step = 0.001 
 
+    # differencing scheme and jobs
+    scheme     = config.get('FIN_DIFF_SCHEME','FORWARD')
+    n_jobs     = int(config.get('FIN_DIFF_JOBS',1))
+    warm_start = config.get('FIN_DIFF_RESTART','NO') == 'YES'
+    assert scheme in ['FORWARD','CENTRAL'] , 'unknown FIN_DIFF_SCHEME %s' % scheme
+    assert n_jobs > 0 , 'FIN_DIFF_JOBS must be positive'
+
     # ----------------------------------------------------
     #  Redundancy Check
     # ----------------------------------------------------    
 
     # master redundancy check
-    opt_names = []
-    for key in sorted(su2io.historyOutFields):  
-        if su2io.historyOutFields[key]['TYPE'] == 'COEFFICIENT':
-            opt_names.append(key)
+    opt_names = sorted(su2io.optnames_aero)
     findiff_todo = all([key in state.GRADIENTS for key in opt_names])
     if findiff_todo:
         grads = state['GRADIENTS']
@@ -797,6 +998,7 @@ def findiff( config, state=None ):
     output_format  = config['TABULAR_FORMAT']
     plot_extension = su2io.get_extension(output_format)    
     grad_filename  = grad_filename + '_findiff' + plot_extension
+    grad_filename  = su2io.work_path(grad_filename)
 
     # ----------------------------------------------------
     #  Finite Difference Steps
@@ -814,7 +1016,12 @@ def findiff( config, state=None ):
     else:
         dvs_base = konfig['DV_VALUE_NEW']
 
+    # warm start from the base solution
+    if warm_start and 'DIRECT' in state.FILES:
+        konfig['RESTART_SOL'] = 'YES'
+
     # initialize gradients
+    opt_names = [ key for key in opt_names if key in func_base ]
     func_keys = ['VARIABLE'] + opt_names + ['FINDIFF_STEP']
     grads = su2util.ordered_bunch.fromkeys(func_keys)
     for key in grads.keys(): grads[key] = []
@@ -851,57 +1058,73 @@ def findiff( config, state=None ):
         pull.append(files['TARGET_HEATFLUX'])
 
        
+    # step jobs, each (i_dv,this_step)
+    if scheme == 'CENTRAL':
+        signs = [ 1.0, -1.0 ]
+    else:
+        signs = [ 1.0 ]
+    jobs = [ (i_dv,sign*step[i_dv]) for i_dv in range(n_dv) for sign in signs ]
+
+    # functions of the steps of each dv
+    func_steps = [ [] for i_dv in range(n_dv) ]
+
     # output redirection
     with redirect_folder('FINDIFF',pull,link) as push:
         with redirect_output(log_findiff):
 
-            # iterate each dv    
-            for i_dv in range(n_dv):
+            # steps link the files of this folder
+            origin = su2io.getcwd()
+            step_link = [ os.path.join(origin,os.path.split(name)[-1]) for name in pull+link ]
 
-                this_step = step[i_dv]
-                temp_config_name = 'config_FINDIFF_%i.cfg' % i_dv 
+            # plot header, rows are appended as each dv completes
+            su2util.write_plot(grad_filename,output_format,grads)
 
-                this_dvs    = copy.deepcopy(dvs_base)
-                this_konfig = copy.deepcopy(konfig)
-                this_dvs[i_dv] = this_dvs[i_dv] + this_step
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
 
-                this_state = su2io.State()
-                this_state.FILES = copy.deepcopy( state.FILES )
-                this_konfig.unpack_dvs(this_dvs,dvs_base)
+                # submit each step
+                futures = {}
+                for i_job, (i_dv,this_step) in enumerate(jobs):
 
-                this_konfig.dump(temp_config_name)
+                    this_dvs    = copy.deepcopy(dvs_base)
+                    this_konfig = copy.deepcopy(konfig)
+                    this_dvs[i_dv] = this_dvs[i_dv] + this_step
 
-                # Direct Solution, findiff step
-                func_step = function( 'ALL', this_konfig, this_state )
+                    this_state = su2io.State()
+                    this_state.FILES = copy.deepcopy( state.FILES )
+                    this_konfig.unpack_dvs(this_dvs,dvs_base)
 
-                # remove deform step files
-                meshfiles = this_state.FILES.MESH
-                meshfiles = su2io.expand_part(meshfiles,this_konfig)
-                for name in meshfiles: os.remove(name)
-                        
-                for key in grads.keys():
-                    if key == 'VARIABLE' or key == 'FINDIFF_STEP':
-                        pass
-                    elif not key in func_step:
-                        del grads[key]  
+                    step_folder = os.path.join(origin,'STEP_%03i' % i_job)
+                    future = executor.submit( _findiff_step, step_folder, step_link, 
+                                              this_konfig, this_state )
+                    futures[future] = (i_dv,this_step)
+
+                # collect steps as they complete
+                for future in as_completed(futures):
+                    i_dv, this_step = futures[future]
+                    func_steps[i_dv].append( (this_step,future.result()) )
+                    if len(func_steps[i_dv]) < len(signs): continue
+
+                    # calc finite difference and store
+                    row = _findiff_row(i_dv,step[i_dv],func_steps[i_dv],func_base,grads.keys())
+                    su2util.write_plot(grad_filename,output_format,row,append=True)
+
+                #: for each step
+
+            #: with executor
 
-                # calc finite difference and store
+            # gradient file in dv order
+            for i_dv in range(n_dv):
+                row = _findiff_row(i_dv,step[i_dv],func_steps[i_dv],func_base,grads.keys())
                 for key in grads.keys():
-                    if key == 'VARIABLE': 
-                        grads[key].append(i_dv)
-                    elif key == 'FINDIFF_STEP': 
-                        grads[key].append(this_step)
-                    else:
-                        this_grad = ( func_step[key] - func_base[key] ) / this_step
-                        grads[key].append(this_grad)
-                        
-                   
-                #: for each grad name
-                    
-                su2util.write_plot(grad_filename,output_format,grads)
-                os.remove(temp_config_name)
+                    grads[key].append(row[key][0])
 
-            #: for each dv
+            # remove functions not returned by a step
+            for key in opt_names:
+                if any([ not key in func_step for this_dv in func_steps for this_step,func_step in this_dv ]):
+                    del grads[key]
+
+            su2util.write_plot(grad_filename,output_format,grads)
 
     #: with output redirection
 
@@ -916,6 +1139,55 @@ def findiff( config, state=None ):
 
 #: def findiff()
 
+def _findiff_step( folder, link, config, state ):
+    """ func_step = _findiff_step(folder,link,config,state)
+        runs one finite difference step in folder, without changing
+        the working folder of the process, removes the step mesh
+    """
+
+    with redirect_folder(folder,link=link,chdir=False):
+
+        config.dump(su2io.work_path('config_FINDIFF.cfg'))
+
+        # Direct Solution, findiff step
+        func_step = function( 'ALL', config, state )
+
+        # remove deform step files
+        meshfiles = state.FILES.MESH
+        meshfiles = su2io.expand_part(meshfiles,config)
+        for name in meshfiles: os.remove(su2io.work_path(name))
+
+    return func_step
+
+#: def _findiff_step()
+
+def _findiff_row( i_dv, step, func_steps, func_base, keys ):
+    """ row = _findiff_row(i_dv,step,func_steps,func_base,keys)
+        one gradient file row of a dv, from a forward step or 
+        from the two steps of a central difference
+    """
+
+    if len(func_steps) == 2:
+        (step_a,func_a), (step_b,func_b) = func_steps
+    else:
+        (step_a,func_a), = func_steps
+        step_b, func_b = 0.0, func_base
+
+    row = su2util.ordered_bunch()
+    for key in keys:
+        if key == 'VARIABLE':
+            row[key] = [i_dv]
+        elif key == 'FINDIFF_STEP':
+            row[key] = [step]
+        elif key in func_a and key in func_b:
+            row[key] = [ ( func_a[key] - func_b[key] ) / ( step_a - step_b ) ]
+        else:
+            row[key] = [ float('nan') ]
+
+    return row
+
+#: def _findiff_row()
+
 
 # ----------------------------------------------------------------------
 #  Geometric Gradients
@@ -1074,10 +1346,7 @@ def directdiff( config, state=None ):
     # ----------------------------------------------------
 
     # master redundancy check
-    opt_names = []
-    for key in sorted(su2io.historyOutFields):
-        if su2io.historyOutFields[key]['TYPE'] == 'COEFFICIENT':
-            opt_names.append(key)
+    opt_names = sorted(su2io.optnames_aero)
 
     directdiff_todo = all([key in state.GRADIENTS for key in opt_names])
     if directdiff_todo:
@@ -1093,6 +1362,7 @@ def directdiff( config, state=None ):
     output_format  = config.get('TABULAR_FORMAT', 'CSV')
     plot_extension = su2io.get_extension(output_format)
     grad_filename  = grad_filename + '_directdiff' + plot_extension
+    grad_filename  = su2io.work_path(grad_filename)
 
     # ----------------------------------------------------
     # Direct Differentiation Evaluation
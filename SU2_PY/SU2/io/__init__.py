@@ -3,9 +3,14 @@
 from .tools    import *
 from .redirect import output as redirect_output
 from .redirect import folder as redirect_folder
+from .redirect import getcwd, work_path, output_streams
 from .data     import load_data, save_data
 from .filelock import filelock
+from .history  import HistoryTail
+from .restart  import BinaryRestart, read_restart, write_restart
+from .store    import ProjectStore, DesignList
+from .cache    import ResultCache, result_cache
 
-from .config   import Config
+from .config   import Config, write_configs
 from .state    import State_Factory as State
 from .historyMap import history_header_map as historyOutFields
@@ -0,0 +1,381 @@
+#!/usr/bin/env python
+
+## \file cache.py
+#  \brief python package for the persistent result cache
+#  \author T. Lukaczyk, F. Palacios
+#  \version 7.0.6 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------
+#  Imports
+# -------------------------------------------------------------------
+
+import os, sys, shutil, copy, hashlib, threading
+if sys.version_info[0] > 2:
+    import pickle
+else:
+    import cPickle as pickle
+
+from .filelock import filelock
+from .redirect import work_path
+from .tools import expand_part, expand_zones, expand_time
+from SU2.util import ordered_bunch
+
+# -------------------------------------------------------------------
+#  Cache Format
+# -------------------------------------------------------------------
+#  each entry is a folder named by its key, with
+#    entry.pkl       functions, gradients by method, variables,
+#                    history and the state names of the cached files
+#    restart files   solutions and deformed meshes, hard links to the
+#                    files of the design when possible, copies otherwise
+#  the modification time of entry.pkl is the last use of the entry.
+
+_entry_name = 'entry.pkl'
+
+# seconds to wait for the cache lock, saves may copy large files
+_lock_timeout = 600
+
+# options that do not change the results of a design, the objective
+# options stay in the key, they set the combined COMBO function and gradient
+_ignored_options = set([
+    'CONSOLE', 'NUMBER_PART', 'DECOMPOSED', 'RESTART_SOL', 'WARM_START',
+    'MATH_PROBLEM', 'OPT_ITERATIONS', 'OPT_ACCURACY',
+    'OPT_BOUND_UPPER', 'OPT_BOUND_LOWER', 'OPT_GRADIENT_FACTOR',
+    'OPT_RELAX_FACTOR', 'HISTORY_OUTPUT', 'SCREEN_OUTPUT', 'VOLUME_OUTPUT',
+    'OUTPUT_FILES', 'MESH_FILENAME', 'FIN_DIFF_JOBS', 'MULTIPOINT_JOBS',
+    'MULTIPOINT_NUMBER_PART', 'STABILITY_JOBS',
+    'RESULT_CACHE', 'RESULT_CACHE_SIZE' ])
+
+# checksums of mesh files, by path, size and modification time
+_checksums = {}
+_checksums_lock = threading.Lock()
+
+
+# -------------------------------------------------------------------
+#  Result Cache Class
+# -------------------------------------------------------------------
+
+class ResultCache(object):
+    """ cache = SU2.io.ResultCache(folder,max_size=10240.)
+
+        persistent cache of design results, shared by all projects
+        and processes that use the same folder.
+
+        an entry is found by a key, the hash of the config options
+        that change the results, the checksum of the mesh files and
+        the design vector. it holds the functions, the gradients of
+        each gradient method and the solution files of a design.
+
+        Example:
+            cache = SU2.io.ResultCache('/scratch/su2_cache')
+            key = cache.key(config)
+            if not cache.load(key,state):
+                # run SU2
+                cache.save(key,config,state)
+
+        Inputs:
+            folder   - cache folder, the absolute path is kept
+            max_size - disk budget in MB, the least recently used
+                       entries are removed when it is exceeded
+
+        Methods:
+            key(config)                    - key of the results of a config
+            load(key,state,method=None)    - restores an entry to a state
+            save(key,config,state,grads=None,method=None)
+                                           - saves the results of a state
+            evict(keep=None)               - removes entries over the budget
+
+        The cache pickles as a reference to its folder.
+    """
+
+    def __init__(self, folder, max_size=10240.):
+        self.folder   = os.path.abspath(folder)
+        self.max_size = float(max_size)
+        if not os.path.exists(self.folder):
+            os.makedirs(self.folder)
+        self._lock_name = os.path.join(self.folder,'cache')
+
+    def key(self, config):
+        """ key = cache.key(config)
+            hash of the options, mesh files and design vector of a
+            config, the mesh files are found in SU2.io.getcwd().
+            None if a mesh file is missing.
+        """
+
+        digest = hashlib.sha1()
+
+        # solver options, including DV_VALUE_NEW, the weights only
+        # change the results of combined objectives
+        ignored = _ignored_options
+        if config.get('OPT_COMBINE_OBJECTIVE','NO') != 'YES':
+            ignored = ignored | set(['OBJECTIVE_WEIGHT'])
+        options = [ (name,_canonical(config[name])) for name in sorted(config.keys())
+                    if not name in ignored ]
+        digest.update( repr(options).encode() )
+
+        # mesh files
+        for name in expand_part(config['MESH_FILENAME'],config):
+            name = work_path(name)
+            if not os.path.exists(name):
+                return None
+            digest.update( _file_checksum(name).encode() )
+
+        return digest.hexdigest()
+
+    def load(self, key, state, method=None):
+        """ found = cache.load(key,state,method=None)
+            restores the functions of an entry to a state, and the
+            gradients of a gradient method. the cached files are linked
+            into SU2.io.getcwd() and replace the state files.
+            returns False if there is no entry for the key.
+        """
+
+        if key is None:
+            return False
+
+        folder = os.path.join(self.folder,key)
+
+        with filelock(self._lock_name,_lock_timeout,shared=True):
+
+            entry = _read_entry(folder)
+            if entry is None:
+                return False
+
+            # all cached files must still exist
+            files = entry.FILES
+            for names in files.values():
+                for name in names:
+                    if not os.path.exists(os.path.join(folder,name)):
+                        return False
+
+            for names in files.values():
+                for name in names:
+                    _link_file(os.path.join(folder,name),work_path(name))
+
+            # last use
+            os.utime(os.path.join(folder,_entry_name),None)
+
+        for name,value in entry.STATE_FILES.items():
+            state.FILES[name] = value
+        state.FUNCTIONS.update(entry.FUNCTIONS)
+        state.VARIABLES.update(entry.VARIABLES)
+        state.HISTORY.update(entry.HISTORY)
+        state.WND_CAUCHY_DATA.update(entry.WND_CAUCHY_DATA)
+        if method is not None:
+            state.GRADIENTS.update(entry.GRADIENTS.get(method,{}))
+        state.set_timestamp()
+
+        return True
+
+    def save(self, key, config, state, grads=None, method=None):
+        """ cache.save(key,config,state,grads=None,method=None)
+            adds the results of a state to the entry of a key, the
+            gradients grads are saved for the gradient method.
+            the solution files and the deformed mesh of the state are
+            cached from SU2.io.getcwd().
+        """
+
+        if key is None:
+            return
+
+        folder = os.path.join(self.folder,key)
+
+        with filelock(self._lock_name,_lock_timeout):
+
+            entry = _read_entry(folder)
+            if entry is None:
+                entry = _new_entry()
+                if not os.path.exists(folder):
+                    os.makedirs(folder)
+
+            # files
+            for name,value in state.FILES.items():
+                names = _cached_files(name,value,config)
+                if not names:
+                    continue
+                for path in names:
+                    _link_file(work_path(path),os.path.join(folder,os.path.basename(path)))
+                entry.FILES[name] = [ os.path.basename(path) for path in names ]
+                if isinstance(value,list):
+                    entry.STATE_FILES[name] = [ os.path.basename(elem) for elem in value ]
+                else:
+                    entry.STATE_FILES[name] = os.path.basename(value)
+
+            # values
+            entry.FUNCTIONS.update(state.FUNCTIONS)
+            entry.VARIABLES.update(state.VARIABLES)
+            entry.HISTORY.update(state.HISTORY)
+            entry.WND_CAUCHY_DATA.update(state.WND_CAUCHY_DATA)
+            if grads:
+                if not method in entry.GRADIENTS:
+                    entry.GRADIENTS[method] = ordered_bunch()
+                entry.GRADIENTS[method].update(grads)
+
+            _write_entry(folder,entry)
+
+            self.evict(keep=key,locked=True)
+
+    def evict(self, keep=None, locked=False):
+        """ cache.evict(keep=None)
+            removes the least recently used entries until the cache
+            is within max_size, except the entry of key keep
+        """
+
+        if not locked:
+            with filelock(self._lock_name,_lock_timeout):
+                return self.evict(keep,locked=True)
+
+        entries = []
+        total = 0
+        for key in os.listdir(self.folder):
+            folder = os.path.join(self.folder,key)
+            entry_name = os.path.join(folder,_entry_name)
+            if not os.path.exists(entry_name):
+                continue
+            size = sum( os.path.getsize(os.path.join(folder,name))
+                        for name in os.listdir(folder) )
+            entries.append( (os.path.getmtime(entry_name),key,size) )
+            total += size
+
+        max_size = self.max_size * 1024.**2
+        for last_use,key,size in sorted(entries):
+            if total <= max_size:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(os.path.join(self.folder,key),ignore_errors=True)
+            total -= size
+
+    def __reduce__(self):
+        return self.__class__, (self.folder,self.max_size)
+
+    def __repr__(self):
+        return '<ResultCache> %s' % self.folder
+
+#: class ResultCache
+
+
+def result_cache(config):
+    """ cache = SU2.io.result_cache(config)
+        the ResultCache of the RESULT_CACHE folder of a config,
+        with RESULT_CACHE_SIZE in MB, or None if RESULT_CACHE is
+        not set or NONE
+    """
+    folder = config.get('RESULT_CACHE','NONE')
+    if not folder or folder == 'NONE':
+        return None
+    max_size = config.get('RESULT_CACHE_SIZE',10240.)
+    return ResultCache(folder,max_size)
+
+#: def result_cache()
+
+
+# -------------------------------------------------------------------
+#  Helper Functions
+# -------------------------------------------------------------------
+
+def _canonical(value):
+    """ a value that has the same repr for equal option values """
+    if isinstance(value,bool):
+        return value
+    if isinstance(value,(int,float)):
+        return float(value)
+    if hasattr(value,'items'):
+        return sorted( (str(k),_canonical(v)) for k,v in value.items() )
+    if isinstance(value,(list,tuple)):
+        return [ _canonical(v) for v in value ]
+    return value
+
+def _file_checksum(name):
+    """ sha1 of a file, computed once for each size and modification time """
+    path = os.path.realpath(name)
+    stat = os.stat(path)
+    index = (path,stat.st_size,stat.st_mtime)
+    with _checksums_lock:
+        if index in _checksums:
+            return _checksums[index]
+    digest = hashlib.sha1()
+    with open(path,'rb') as mesh_file:
+        for block in iter(lambda: mesh_file.read(1<<20), b''):
+            digest.update(block)
+    checksum = digest.hexdigest()
+    with _checksums_lock:
+        _checksums[index] = checksum
+    return checksum
+
+def _cached_files(name,value,config):
+    """ files of a state file entry that are cached, [] if none,
+        or if one of them does not exist
+    """
+    if name == 'MESH':
+        # only deformed meshes, the mesh is part of the key
+        if value != config.get('MESH_OUT_FILENAME'):
+            return []
+        names = expand_part(value,config)
+    elif name == 'DIRECT' or name == 'FLOW_META' or name.startswith('ADJOINT_'):
+        names = expand_time(expand_zones(value,config),config)
+    elif name.startswith('MULTIPOINT_') and name != 'MULTIPOINT_MESH_FILENAME':
+        names = expand_time(expand_zones(value,config),config)
+    else:
+        return []
+    names = [ elem for elem in names if elem ]
+    if not all( os.path.exists(work_path(elem)) for elem in names ):
+        return []
+    return names
+
+def _link_file(source,target):
+    """ hard links a file, or copies it across file systems """
+    source = os.path.realpath(source)
+    if os.path.lexists(target):
+        if os.path.exists(target) and os.path.samefile(source,target):
+            return
+        os.remove(target)
+    try:
+        os.link(source,target)
+    except (OSError,AttributeError):
+        shutil.copy(source,target)
+
+def _new_entry():
+    entry = ordered_bunch()
+    entry.FUNCTIONS       = ordered_bunch()
+    entry.GRADIENTS       = ordered_bunch()
+    entry.VARIABLES       = ordered_bunch()
+    entry.HISTORY         = ordered_bunch()
+    entry.WND_CAUCHY_DATA = ordered_bunch()
+    entry.FILES           = ordered_bunch() # cached file names
+    entry.STATE_FILES     = ordered_bunch() # state names of the files
+    return entry
+
+def _read_entry(folder):
+    name = os.path.join(folder,_entry_name)
+    if not os.path.exists(name):
+        return None
+    with open(name,'rb') as entry_file:
+        return pickle.load(entry_file)
+
+def _write_entry(folder,entry):
+    name = os.path.join(folder,_entry_name)
+    temp = name + '.tmp'
+    with open(temp,'wb') as entry_file:
+        pickle.dump(entry,entry_file,protocol=2)
+    os.rename(temp,name)
@@ -29,10 +29,10 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import os, sys, shutil, copy
+import os, sys, shutil, copy, uuid
 from .historyMap import history_header_map as historyOutFields
 import numpy as np
-from ..util import ordered_bunch, switch
+from ..util import ordered_bunch, cow_bunch
 from .tools import *
 from .config_options import *
 
@@ -45,11 +45,12 @@ inf = 1.0e20
 #  Configuration Class
 # ----------------------------------------------------------------------
 
-class Config(ordered_bunch):
+class Config(cow_bunch):
     """ config = SU2.io.Config(filename="")
         
         Starts a config class, an extension of 
-        ordered_bunch()
+        ordered_bunch(). copies of a config share their immutable
+        values, see SU2.util.cow_bunch
         
         use 1: initialize by reading config file
             config = SU2.io.Config('filename')
@@ -324,8 +325,54 @@ class Config(ordered_bunch):
 #  Get SU2 Configuration Parameters
 # -------------------------------------------------------------------
 
+# parsed config files, keyed by absolute file name, 
+# holds the modification stamp and the parsed dictionary
+_config_cache = {}
+
 def read_config(filename):
-    """ reads a config file """
+    """ reads a config file 
+        files are parsed once and cached by file name and modification 
+        time, each call returns an independent copy of the parameters
+    """
+    
+    filename = os.path.abspath(filename)
+    
+    # modification stamp
+    stat  = os.stat(filename)
+    stamp = ( getattr(stat,'st_mtime_ns',stat.st_mtime), stat.st_size )
+    
+    # parse if not cached or changed
+    cached = _config_cache.get(filename)
+    if cached is None or cached[0] != stamp:
+        data_dict = parse_config(filename)
+        _config_cache[filename] = (stamp,data_dict)
+    else:
+        data_dict = cached[1]
+    
+    # break pointers
+    return _copy_config(data_dict)
+
+#: def read_config()
+
+
+def _copy_config(value):
+    """ copies the nested lists and dictionaries of parsed parameters,
+        faster than copy.deepcopy() for these plain containers
+    """
+    if isinstance(value,list):
+        return [ _copy_config(item) for item in value ]
+    if isinstance(value,dict):
+        new_value = value.__class__()
+        for key,item in value.items():
+            new_value[key] = _copy_config(item)
+        return new_value
+    return value
+
+#: def _copy_config()
+
+
+def parse_config(filename):
+    """ parses a config file, without caching """
       
     # initialize output dictionary
     data_dict = OrderedDict()
@@ -340,7 +387,7 @@ def read_config(filename):
             break
         
         # remove line returns
-        line = line.strip('\r\n').strip()
+        line = line.strip()
 
         if (len(line) == 0):
             continue
@@ -354,14 +401,13 @@ def read_config(filename):
         # If there is a statement after a cont. char
         # throw an error. ---*/
     
-        while(line[0].endswith('\\') or len(line.split('\\')) > 1):
+        while '\\' in line:
             tmp_line = input_file.readline()
             tmp_line = tmp_line.strip()
-            assert len(tmp_line.split('=')) <= 1, ('Statement found after line '
-                                                   'continuation character in config file %s' % tmp_line)
+            assert not '=' in tmp_line, ('Statement found after line '
+                                         'continuation character in config file %s' % tmp_line)
             if (not tmp_line.startswith('%')):
-                line = line.split('\\')[0]
-                line += ' ' + tmp_line
+                line = line.split('\\',1)[0] + ' ' + tmp_line
 
         # split across equals sign
         line = line.split("=",1)
@@ -369,278 +415,17 @@ def read_config(filename):
         this_value = line[1].strip()
         
         assert this_param not in data_dict, ('Config file has multiple specifications of %s' % this_param )
-        for case in switch(this_param):
-            
-            # comma delimited lists of strings with or without paren's
-            if case("MARKER_EULER")      or\
-               case("MARKER_FAR")        or\
-               case("MARKER_PLOTTING")   or\
-               case("MARKER_MONITORING") or\
-               case("MARKER_SYM")        or\
-               case("DV_KIND")           : 
-                # remove white space
-                this_value = ''.join(this_value.split())   
-                # remove parens
-                this_value = this_value.strip('()')
-                # split by comma
-                data_dict[this_param] = this_value.split(",")
-                break
-
-            # semicolon delimited lists of comma delimited lists of floats
-            if case("DV_PARAM"):
-                # remove white space
-                info_General = ''.join(this_value.split())
-                # split by semicolon
-                info_General = info_General.split(';')
-                # build list of dv params, convert string to float
-                dv_Parameters = []
-                dv_FFDTag     = []
-                dv_Size       = []
-
-                for this_dvParam in info_General:
-                    this_dvParam = this_dvParam.strip('()')
-                    this_dvParam = this_dvParam.split(",")
-                    this_dvSize  = 1
-
-                    # if FFD change the first element to work with numbers and float(x)
-                    if data_dict["DV_KIND"][0] in ['FFD_SETTING','FFD_ANGLE_OF_ATTACK','FFD_CONTROL_POINT','FFD_NACELLE','FFD_GULL','FFD_TWIST_2D','FFD_TWIST','FFD_ROTATION','FFD_CAMBER','FFD_THICKNESS','FFD_CONTROL_POINT_2D','FFD_CAMBER_2D','FFD_THICKNESS_2D']:
-                        this_dvFFDTag = this_dvParam[0]
-                        this_dvParam[0] = '0'
-                    else:
-                        this_dvFFDTag = []
-
-                    if not data_dict["DV_KIND"][0] in ['NO_DEFORMATION']:
-                        this_dvParam = [ float(x) for x in this_dvParam ]
-
-                    if data_dict["DV_KIND"][0] in ['FFD_CONTROL_POINT_2D']:
-                        if this_dvParam[3] == 0 and this_dvParam[4] == 0:
-                            this_dvSize = 2
-
-                    if data_dict["DV_KIND"][0]in ['FFD_CONTROL_POINT']:
-                        if this_dvParam[4] == 0 and this_dvParam[5] == 0 and this_dvParam[6] == 0:
-                            this_dvSize = 3
-
-                    dv_FFDTag     = dv_FFDTag     + [this_dvFFDTag]
-                    dv_Parameters = dv_Parameters + [this_dvParam]
-                    dv_Size       = dv_Size       + [this_dvSize]
-            
-            # store in a dictionary
-                dv_Definitions = { 'FFDTAG' : dv_FFDTag     ,
-                                   'PARAM'  : dv_Parameters ,
-                                   'SIZE'   : dv_Size}
-
-                data_dict[this_param] = dv_Definitions
-                break
-            
-            # comma delimited lists of floats
-            if case("DV_VALUE_OLD")    or\
-               case("DV_VALUE_NEW")    or\
-               case("DV_VALUE")        :           
-                # remove white space
-                this_value = ''.join(this_value.split())                
-                # split by comma, map to float, store in dictionary
-                data_dict[this_param] = list(map(float,this_value.split(",")))
-                break              
-
-            # float parameters
-            if case("MACH_NUMBER")            or\
-               case("AOA")                    or\
-               case("FIN_DIFF_STEP")          or\
-               case("CFL_NUMBER")             or\
-               case("HB_PERIOD")              or\
-               case("WRT_SOL_FREQ")           :
-                data_dict[this_param] = float(this_value)
-                break   
-            
-            # int parameters
-            if case("NUMBER_PART")            or\
-               case("AVAILABLE_PROC")         or\
-               case("ITER")               or\
-               case("TIME_INSTANCES")         or\
-               case("UNST_ADJOINT_ITER")      or\
-               case("ITER_AVERAGE_OBJ")       or\
-               case("INNER_ITER")             or\
-               case("OUTER_ITER")             or\
-               case("TIME_ITER")             or\
-               case("ADAPT_CYCLES")           :
-                data_dict[this_param] = int(this_value)
-                break                
-            
-            if case("OUTPUT_FILES"):
-                data_dict[this_param] = this_value.strip("()").split(",")
-                data_dict[this_param] = [i.strip(" ") for i in data_dict[this_param]]
-                break
-            if case("HISTORY_OUTPUT"):
-                data_dict[this_param] = this_value.strip("()").split(",")
-                data_dict[this_param] = [i.strip(" ") for i in data_dict[this_param]]
-                break
-            
-            # unitary design variable definition
-            if case("DEFINITION_DV"):
-                # remove white space
-                this_value = ''.join(this_value.split())                
-                # split into unitary definitions
-                info_Unitary = this_value.split(";")
-                # process each Design Variable
-                dv_Kind       = []
-                dv_Scale      = []
-                dv_Markers    = []
-                dv_FFDTag     = []
-                dv_Parameters = []
-                dv_Size       = []
-
-                for this_General in info_Unitary:
-                    if not this_General: continue
-                    # split each unitary definition into one general definition
-                    info_General = this_General.strip("()").split("|") # check for needed strip()?
-                    # split information for dv Kinds
-                    info_Kind    = info_General[0].split(",")
-                    # pull processed dv values
-                    this_dvKind       = get_dvKind( int( info_Kind[0] ) )     
-                    this_dvScale      = float( info_Kind[1] )
-                    this_dvMarkers    = info_General[1].split(",")
-                    this_dvSize       = 1
-
-                    if this_dvKind=='MACH_NUMBER' or this_dvKind=='AOA':
-                        this_dvParameters = []
-                    else:
-                        this_dvParameters = info_General[2].split(",")
-                        # if FFD change the first element to work with numbers and float(x), save also the tag
-                        if this_dvKind in ['FFD_SETTING','FFD_ANGLE_OF_ATTACK','FFD_CONTROL_POINT','FFD_NACELLE','FFD_GULL','FFD_TWIST','FFD_TWIST_2D','FFD_TWIST_ANGLE','FFD_ROTATION','FFD_CAMBER','FFD_THICKNESS','FFD_CONTROL_POINT_2D','FFD_CAMBER_2D','FFD_THICKNESS_2D']:
-                          this_dvFFDTag = this_dvParameters[0]
-                          this_dvParameters[0] = '0'
-                        else:
-                          this_dvFFDTag = []
-                        
-                        this_dvParameters = [ float(x) for x in this_dvParameters ]
-
-                        if this_dvKind in ['FFD_CONTROL_POINT_2D']:
-                            if this_dvParameters[3] == 0 and this_dvParameters[4] == 0:
-                                this_dvSize = 2
-
-                        if this_dvKind in ['FFD_CONTROL_POINT']:
-                            if this_dvParameters[4] == 0 and this_dvParameters[5] == 0 and this_dvParameters[6] == 0:
-                                this_dvSize = 3
-
-                    # add to lists
-                    dv_Kind       = dv_Kind       + [this_dvKind]
-                    dv_Scale      = dv_Scale      + [this_dvScale]
-                    dv_Markers    = dv_Markers    + [this_dvMarkers]
-                    dv_FFDTag     = dv_FFDTag     + [this_dvFFDTag]
-                    dv_Parameters = dv_Parameters + [this_dvParameters]
-                    dv_Size       = dv_Size       + [this_dvSize]
-                # store in a dictionary
-                dv_Definitions = { 'KIND'   : dv_Kind       ,
-                                   'SCALE'  : dv_Scale      ,
-                                   'MARKER' : dv_Markers    ,
-                                   'FFDTAG' : dv_FFDTag     ,
-                                   'PARAM'  : dv_Parameters ,
-                                   'SIZE'   : dv_Size}
-
-                # save to output dictionary
-                data_dict[this_param] = dv_Definitions
-                break  
-            
-            # unitary objective definition
-            if case('OPT_OBJECTIVE'):
-                # remove white space
-                this_value = ''.join(this_value.split())
-                #split by ; 
-                this_def=OrderedDict()
-                this_value = this_value.split(";")
-                
-                for  this_obj in this_value:       
-                    # split by scale
-                    this_obj = this_obj.split("*")
-                    this_name  = this_obj[0]
-                    this_scale = 1.0
-                    if len(this_obj) > 1:
-                        this_scale = float( this_obj[1] )
-                    # check for penalty-based constraint function 
-                    for this_sgn in ['<','>','=']:
-                        if this_sgn in this_name: break
-                    this_obj = this_name.strip('()').split(this_sgn)
-                    if len(this_obj)>1:
-                        this_type = this_sgn
-                        this_val = this_obj[1]
-                    else:
-                        this_type = 'DEFAULT'
-                        this_val  = 0.0 
-                    this_name = this_obj[0]
-                    # Print an error and exit if the same key appears twice
-                    if (this_name in this_def):
-                      raise SystemExit('Multiple occurrences of the same objective in the OPT_OBJECTIVE definition are not currently supported. To evaluate one objective over multiple surfaces, list the objective once.')
-                    # Set up dict for objective, including scale, whether it is a penalty, and constraint value 
-                    this_def.update({ this_name : {'SCALE':this_scale, 'OBJTYPE':this_type, 'VALUE':this_val} })
-                    if (len(data_dict['MARKER_MONITORING'])>1):
-                        this_def[this_name]['MARKER'] = data_dict['MARKER_MONITORING'][len(this_def)-1]
-                    else:
-                        this_def[this_name]['MARKER'] = data_dict['MARKER_MONITORING'][0]
-
-                # save to output dictionary
-                data_dict[this_param] = this_def
-                break
-            
-            # unitary constraint definition
-            if case('OPT_CONSTRAINT'):
-                # remove white space
-                this_value = ''.join(this_value.split())                    
-                # check for none case
-                if this_value == 'NONE':
-                    data_dict[this_param] = {'EQUALITY':OrderedDict(), 'INEQUALITY':OrderedDict()}
-                    break                    
-                # split definitions
-                this_value = this_value.split(';')
-                this_def = OrderedDict()
-                for this_con in this_value:
-                    if not this_con: continue # if no definition
-                    # defaults
-                    this_obj = 'NONE'
-                    this_sgn = '='
-                    this_scl = 1.0
-                    this_val = 0.0
-                    # split scale if present
-                    this_con = this_con.split('*')
-                    if len(this_con) > 1:
-                        this_scl = float( this_con[1] )
-                    this_con = this_con[0]
-                    # find sign
-                    for this_sgn in ['<','>','=']:
-                        if this_sgn in this_con: break
-                    # split sign, store objective and value
-                    this_con = this_con.strip('()').split(this_sgn)
-                    assert len(this_con) == 2 , 'incorrect constraint definition'
-                    this_obj = this_con[0]
-                    this_val = float( this_con[1] )
-                    # store in dictionary
-                    this_def[this_obj] = { 'SIGN'  : this_sgn ,
-                                           'VALUE' : this_val ,
-                                           'SCALE' : this_scl  }
-                #: for each constraint definition
-                # sort constraints by type
-                this_sort = { 'EQUALITY'   : OrderedDict() ,
-                              'INEQUALITY' : OrderedDict()  }
-                for key,value in this_def.items():
-                    if value['SIGN'] == '=':
-                        this_sort['EQUALITY'][key]   = value
-                    else:
-                        this_sort['INEQUALITY'][key] = value
-                #: for each definition                
-                # save to output dictionary
-                data_dict[this_param] = this_sort
-                break
-            
-            # otherwise
-            # string parameters
-            if case():
-                data_dict[this_param] = this_value
-                break              
-            
-            #: if case DEFINITION_DV
-                        
-        #: for case
+        
+        # dispatch on the option type, strings otherwise
+        read_option = _option_readers.get( option_types.get(this_param) )
+        if read_option is None:
+            data_dict[this_param] = this_value
+        else:
+            data_dict[this_param] = read_option(this_value,data_dict)
         
     #: for line
+    
+    input_file.close()
 
     if 'OPT_CONSTRAINT' in data_dict: 
         if 'BUFFET' in data_dict['OPT_CONSTRAINT']['EQUALITY'] or 'BUFFET' in data_dict['OPT_CONSTRAINT']['INEQUALITY']:
@@ -816,7 +601,257 @@ def read_config(filename):
  
     return data_dict
     
-#: def read_config()
+#: def parse_config()
+
+# -------------------------------------------------------------------
+#  Option Readers
+# -------------------------------------------------------------------
+
+def _read_name_list(this_value,data_dict):
+    """ comma delimited lists of strings with or without paren's """
+    # remove white space
+    this_value = ''.join(this_value.split())   
+    # remove parens
+    this_value = this_value.strip('()')
+    # split by comma
+    return this_value.split(",")
+
+def _read_float_list(this_value,data_dict):
+    """ comma delimited lists of floats """
+    # remove white space
+    this_value = ''.join(this_value.split())                
+    # split by comma, map to float
+    return list(map(float,this_value.split(",")))
+
+def _read_float(this_value,data_dict):
+    return float(this_value)
+
+def _read_int(this_value,data_dict):
+    return int(this_value)
+
+def _read_dv_param(this_value,data_dict):
+    """ semicolon delimited lists of comma delimited lists of floats """
+    
+    # the design variable kind decides the format of all params
+    dv_kind = data_dict["DV_KIND"][0]
+    is_ffd  = dv_kind in ffd_dv_kinds
+    
+    # remove white space
+    info_General = ''.join(this_value.split())
+    # split by semicolon
+    info_General = info_General.split(';')
+    # build list of dv params, convert string to float
+    dv_Parameters = []
+    dv_FFDTag     = []
+    dv_Size       = []
+
+    for this_dvParam in info_General:
+        this_dvParam = this_dvParam.strip('()')
+        this_dvParam = this_dvParam.split(",")
+        this_dvSize  = 1
+
+        # if FFD change the first element to work with numbers and float(x)
+        if is_ffd:
+            this_dvFFDTag = this_dvParam[0]
+            this_dvParam[0] = '0'
+        else:
+            this_dvFFDTag = []
+
+        if not dv_kind == 'NO_DEFORMATION':
+            this_dvParam = [ float(x) for x in this_dvParam ]
+
+        if dv_kind == 'FFD_CONTROL_POINT_2D':
+            if this_dvParam[3] == 0 and this_dvParam[4] == 0:
+                this_dvSize = 2
+
+        if dv_kind == 'FFD_CONTROL_POINT':
+            if this_dvParam[4] == 0 and this_dvParam[5] == 0 and this_dvParam[6] == 0:
+                this_dvSize = 3
+
+        dv_FFDTag.append(this_dvFFDTag)
+        dv_Parameters.append(this_dvParam)
+        dv_Size.append(this_dvSize)
+
+    # store in a dictionary
+    dv_Definitions = { 'FFDTAG' : dv_FFDTag     ,
+                       'PARAM'  : dv_Parameters ,
+                       'SIZE'   : dv_Size}
+
+    return dv_Definitions
+
+#: def _read_dv_param()
+
+def _read_definition_dv(this_value,data_dict):
+    """ unitary design variable definition """
+    
+    # remove white space
+    this_value = ''.join(this_value.split())                
+    # split into unitary definitions
+    info_Unitary = this_value.split(";")
+    # process each Design Variable
+    dv_Kind       = []
+    dv_Scale      = []
+    dv_Markers    = []
+    dv_FFDTag     = []
+    dv_Parameters = []
+    dv_Size       = []
+
+    for this_General in info_Unitary:
+        if not this_General: continue
+        # split each unitary definition into one general definition
+        info_General = this_General.strip("()").split("|") # check for needed strip()?
+        # split information for dv Kinds
+        info_Kind    = info_General[0].split(",")
+        # pull processed dv values
+        this_dvKind       = get_dvKind( int( info_Kind[0] ) )     
+        this_dvScale      = float( info_Kind[1] )
+        this_dvMarkers    = info_General[1].split(",")
+        this_dvSize       = 1
+
+        if this_dvKind=='MACH_NUMBER' or this_dvKind=='AOA':
+            this_dvParameters = []
+            this_dvFFDTag     = []
+        else:
+            this_dvParameters = info_General[2].split(",")
+            # if FFD change the first element to work with numbers and float(x), save also the tag
+            if this_dvKind in ffd_dv_kinds:
+              this_dvFFDTag = this_dvParameters[0]
+              this_dvParameters[0] = '0'
+            else:
+              this_dvFFDTag = []
+            
+            this_dvParameters = [ float(x) for x in this_dvParameters ]
+
+            if this_dvKind == 'FFD_CONTROL_POINT_2D':
+                if this_dvParameters[3] == 0 and this_dvParameters[4] == 0:
+                    this_dvSize = 2
+
+            if this_dvKind == 'FFD_CONTROL_POINT':
+                if this_dvParameters[4] == 0 and this_dvParameters[5] == 0 and this_dvParameters[6] == 0:
+                    this_dvSize = 3
+
+        # add to lists
+        dv_Kind.      append(this_dvKind)
+        dv_Scale.     append(this_dvScale)
+        dv_Markers.   append(this_dvMarkers)
+        dv_FFDTag.    append(this_dvFFDTag)
+        dv_Parameters.append(this_dvParameters)
+        dv_Size.      append(this_dvSize)
+    
+    # store in a dictionary
+    dv_Definitions = { 'KIND'   : dv_Kind       ,
+                       'SCALE'  : dv_Scale      ,
+                       'MARKER' : dv_Markers    ,
+                       'FFDTAG' : dv_FFDTag     ,
+                       'PARAM'  : dv_Parameters ,
+                       'SIZE'   : dv_Size}
+
+    return dv_Definitions
+
+#: def _read_definition_dv()
+
+def _read_opt_objective(this_value,data_dict):
+    """ unitary objective definition """
+    
+    # remove white space
+    this_value = ''.join(this_value.split())
+    #split by ; 
+    this_def=OrderedDict()
+    this_value = this_value.split(";")
+    
+    for  this_obj in this_value:       
+        # split by scale
+        this_obj = this_obj.split("*")
+        this_name  = this_obj[0]
+        this_scale = 1.0
+        if len(this_obj) > 1:
+            this_scale = float( this_obj[1] )
+        # check for penalty-based constraint function 
+        for this_sgn in ['<','>','=']:
+            if this_sgn in this_name: break
+        this_obj = this_name.strip('()').split(this_sgn)
+        if len(this_obj)>1:
+            this_type = this_sgn
+            this_val = this_obj[1]
+        else:
+            this_type = 'DEFAULT'
+            this_val  = 0.0 
+        this_name = this_obj[0]
+        # Print an error and exit if the same key appears twice
+        if (this_name in this_def):
+          raise SystemExit('Multiple occurrences of the same objective in the OPT_OBJECTIVE definition are not currently supported. To evaluate one objective over multiple surfaces, list the objective once.')
+        # Set up dict for objective, including scale, whether it is a penalty, and constraint value 
+        this_def.update({ this_name : {'SCALE':this_scale, 'OBJTYPE':this_type, 'VALUE':this_val} })
+        if (len(data_dict['MARKER_MONITORING'])>1):
+            this_def[this_name]['MARKER'] = data_dict['MARKER_MONITORING'][len(this_def)-1]
+        else:
+            this_def[this_name]['MARKER'] = data_dict['MARKER_MONITORING'][0]
+
+    return this_def
+
+#: def _read_opt_objective()
+
+def _read_opt_constraint(this_value,data_dict):
+    """ unitary constraint definition """
+    
+    # remove white space
+    this_value = ''.join(this_value.split())                    
+    # check for none case
+    if this_value == 'NONE':
+        return {'EQUALITY':OrderedDict(), 'INEQUALITY':OrderedDict()}
+    # split definitions
+    this_value = this_value.split(';')
+    this_def = OrderedDict()
+    for this_con in this_value:
+        if not this_con: continue # if no definition
+        # defaults
+        this_obj = 'NONE'
+        this_sgn = '='
+        this_scl = 1.0
+        this_val = 0.0
+        # split scale if present
+        this_con = this_con.split('*')
+        if len(this_con) > 1:
+            this_scl = float( this_con[1] )
+        this_con = this_con[0]
+        # find sign
+        for this_sgn in ['<','>','=']:
+            if this_sgn in this_con: break
+        # split sign, store objective and value
+        this_con = this_con.strip('()').split(this_sgn)
+        assert len(this_con) == 2 , 'incorrect constraint definition'
+        this_obj = this_con[0]
+        this_val = float( this_con[1] )
+        # store in dictionary
+        this_def[this_obj] = { 'SIGN'  : this_sgn ,
+                               'VALUE' : this_val ,
+                               'SCALE' : this_scl  }
+    #: for each constraint definition
+    # sort constraints by type
+    this_sort = { 'EQUALITY'   : OrderedDict() ,
+                  'INEQUALITY' : OrderedDict()  }
+    for key,value in this_def.items():
+        if value['SIGN'] == '=':
+            this_sort['EQUALITY'][key]   = value
+        else:
+            this_sort['INEQUALITY'][key] = value
+    #: for each definition                
+    
+    return this_sort
+
+#: def _read_opt_constraint()
+
+# option type -> reader( this_value, data_dict )
+_option_readers = { 'MARKER_LIST'    : _read_name_list      ,
+                    'OUTPUT_LIST'    : _read_name_list      ,
+                    'NAME_LIST'      : _read_name_list      ,
+                    'FLOAT_LIST'     : _read_float_list     ,
+                    'FLOAT'          : _read_float          ,
+                    'INT'            : _read_int            ,
+                    'DV_PARAM'       : _read_dv_param       ,
+                    'DEFINITION_DV'  : _read_definition_dv  ,
+                    'OPT_OBJECTIVE'  : _read_opt_objective  ,
+                    'OPT_CONSTRAINT' : _read_opt_constraint  }
 
 
 
@@ -825,22 +860,40 @@ def read_config(filename):
 # -------------------------------------------------------------------
 
 def write_config(filename,param_dict):
-    """ updates an existing config file """
+    """ updates an existing config file 
+        the file is rewritten in memory and replaced atomically
+    """
+    
+    # read the existing file once
+    config_file = open(filename)
+    config_lines = config_file.readlines()
+    config_file.close()
+    
+    text = _update_config(config_lines,param_dict)
     
-    temp_filename = "temp.cfg"
-    shutil.copy(filename,temp_filename)
-    output_file = open(filename,"w")
+    replace_file(filename,text)
+    
+#: def write_config()
 
-    # break pointers
-    param_dict = copy.deepcopy(param_dict)
+
+def _update_config(config_lines,param_dict):
+    """ text = _update_config(config_lines,param_dict)
+        replaces the values of the parameters in param_dict 
+        in the lines of a config file, returns the new text
+    """
     
-    for raw_line in open(temp_filename):
+    output = []
+
+    # parameters already written
+    written = set()
+    
+    for raw_line in config_lines:
         # remove line returns
         line = raw_line.strip('\r\n')
         
         # make sure it has useful data
         if not "=" in line:
-            output_file.write(raw_line)
+            output.append(raw_line)
             continue
         
         # split across equals sign
@@ -849,210 +902,24 @@ def write_config(filename,param_dict):
         old_value  = line[1].strip()
         
         # skip if parameter unwanted
-        if this_param not in param_dict:
-            output_file.write(raw_line)
+        if this_param not in param_dict or this_param in written:
+            output.append(raw_line)
             continue
         
-        # start writing parameter
-        new_value = param_dict[this_param] 
-        output_file.write(this_param + "= ")
-        
-        # handle parameter types
-        for case in switch(this_param):  
-              
-            # comma delimited list of floats
-            if case("DV_VALUE_NEW") : pass
-            if case("DV_VALUE_OLD") : pass
-            if case("DV_VALUE")     :           
-                n_lists = len(new_value)
-                for i_value in range(n_lists):
-                    output_file.write("%s" % new_value[i_value])
-                    if i_value+1 < n_lists:
-                        output_file.write(", ")               
-                break
-            
-            # comma delimited list of strings no paren's
-            if case("DV_KIND")            : pass
-            if case("TASKS")              : pass
-            if case("GRADIENTS")          :            
-                if not isinstance(new_value,list):
-                    new_value = [ new_value ]
-                n_lists = len(new_value)
-                for i_value in range(n_lists):
-                    output_file.write(new_value[i_value])
-                    if i_value+1 < n_lists:
-                        output_file.write(", ")               
-                break            
-            
-            # comma delimited list of strings inside paren's
-            if case("MARKER_EULER")      : pass
-            if case("MARKER_FAR")        : pass
-            if case("MARKER_PLOTTING")   : pass
-            if case("MARKER_MONITORING") : pass
-            if case("MARKER_SYM")        : pass            
-            if case("DV_MARKER") : 
-                if not isinstance(new_value,list):
-                    new_value = [ new_value ]                
-                output_file.write("( ")
-                n_lists = len(new_value)
-                for i_value in range(n_lists):
-                    output_file.write(new_value[i_value])
-                    if i_value+1 < n_lists:
-                        output_file.write(", ")
-                output_file.write(" )") 
-                break                
-            if case("OUTPUT_FILES"):
-                n_lists = len(new_value)
-                output_file.write("(")
-                for i_value in range(n_lists):
-                    output_file.write(new_value[i_value])
-                    if i_value+1 < n_lists:
-                        output_file.write(", ")
-                output_file.write(")")
-                break
-            
-            if case("HISTORY_OUTPUT"):
-                n_lists = len(new_value)
-                for i_value in range(n_lists):
-                    output_file.write(new_value[i_value])
-                    if i_value+1 < n_lists:
-                        output_file.write(", ")
-                break
-
-            # semicolon delimited lists of comma delimited lists
-            if case("DV_PARAM") :
-
-                assert isinstance(new_value['PARAM'],list) , 'incorrect specification of DV_PARAM'
-                if not isinstance(new_value['PARAM'][0],list): new_value = [ new_value ]
-                
-                for i_value in range(len(new_value['PARAM'])):
-
-                    output_file.write("( ")
-                    this_param_list = new_value['PARAM'][i_value]
-                    this_ffd_list = new_value['FFDTAG'][i_value]
-                    n_lists = len(this_param_list)
-                    
-                    if this_ffd_list != []:
-                      output_file.write("%s, " % this_ffd_list)
-                      for j_value in range(1,n_lists):
-                        output_file.write("%s" % this_param_list[j_value])
-                        if j_value+1 < n_lists:
-                          output_file.write(", ")
-                    else:
-                      for j_value in range(n_lists):
-                        output_file.write("%s" % this_param_list[j_value])
-                        if j_value+1 < n_lists:
-                          output_file.write(", ")
-
-                    output_file.write(") ")
-                    if i_value+1 < len(new_value['PARAM']):
-                        output_file.write("; ")
-                break
-            
-            # int parameters
-            if case("NUMBER_PART")            : pass
-            if case("ADAPT_CYCLES")           : pass
-            if case("TIME_INSTANCES")         : pass
-            if case("AVAILABLE_PROC")         : pass
-            if case("UNST_ADJOINT_ITER")      : pass
-            if case("ITER")              or\
-               case("TIME_ITER")         or\
-               case("INNER_ITER")        or\
-               case("OUTER_ITER"): 
-                output_file.write("%i" % new_value)
-                break
-                        
-            if case("DEFINITION_DV") :
-                n_dv = len(new_value['KIND'])
-                if not n_dv:
-                    output_file.write("NONE")
-                for i_dv in range(n_dv):
-                    this_kind = new_value['KIND'][i_dv]
-                    output_file.write("( ")
-                    output_file.write("%i , " % get_dvID(this_kind) )
-                    output_file.write("%s " % new_value['SCALE'][i_dv])
-                    output_file.write("| ")
-                    # markers                  
-                    n_mark = len(new_value['MARKER'][i_dv])
-                    for i_mark in range(n_mark):                       
-                        output_file.write("%s " % new_value['MARKER'][i_dv][i_mark])
-                        if i_mark+1 < n_mark:
-                            output_file.write(", ")
-                    #: for each marker
-                    if not this_kind in ['AOA','MACH_NUMBER']:
-                        output_file.write(" | ")
-                        # params
-                        if this_kind in ['FFD_SETTING','FFD_ANGLE_OF_ATTACK','FFD_CONTROL_POINT','FFD_NACELLE','FFD_GULL','FFD_TWIST_ANGLE','FFD_TWIST','FFD_TWIST_2D','FFD_ROTATION','FFD_CAMBER','FFD_THICKNESS','FFD_CONTROL_POINT_2D','FFD_CAMBER_2D','FFD_THICKNESS_2D']:
-                            n_param = len(new_value['PARAM'][i_dv])
-                            output_file.write("%s , " % new_value['FFDTAG'][i_dv])
-                            for i_param in range(1,n_param):
-                                output_file.write("%s " % new_value['PARAM'][i_dv][i_param])
-                                if i_param+1 < n_param:
-                                    output_file.write(", ")
-                        else:
-                            n_param = len(new_value['PARAM'][i_dv])
-                            for i_param in range(n_param):
-                                output_file.write("%s " % new_value['PARAM'][i_dv][i_param])
-                                if i_param+1 < n_param:
-                                    output_file.write(", ")
-                    
-                        #: for each param                    
-                    output_file.write(" )")
-                    if i_dv+1 < n_dv:
-                        output_file.write("; ")
-                #: for each dv
-                break
-            
-            if case("OPT_OBJECTIVE"):
-                n_obj = 0
-                for name,value in new_value.items():
-                    if n_obj>0: output_file.write("; ")
-                    if value['OBJTYPE']=='DEFAULT':
-                        output_file.write( "%s * %s " % (name,value['SCALE']) )
-                    else:
-                        output_file.write( "( %s %s %s ) * %s" 
-                                           % (name, value['OBJTYPE'], value['VALUE'], value['SCALE']) )
-                    n_obj += 1
-                break
-            
-            if case("OPT_CONSTRAINT"):
-                i_con = 0
-                for con_type in ['EQUALITY','INEQUALITY']:
-                    this_con = new_value[con_type]
-                    for name,value in this_con.items():
-                        if i_con>0: output_file.write("; ")
-                        output_file.write( "( %s %s %s ) * %s" 
-                                          % (name, value['SIGN'], value['VALUE'], value['SCALE']) ) 
-                        i_con += 1
-                    #: for each constraint
-                #: for each constraint type
-                if not i_con: output_file.write("NONE")
-                break
-            
-            # default, assume string, integer or unformatted float 
-            if case():
-                output_file.write('%s' % new_value)
-                break                         
-                
-        #: for case
-        
-        # remove from param dictionary
-        del param_dict[this_param]
-        
-        # next line
-        output_file.write("\n")        
+        # write parameter
+        output.append( this_param + "= " + format_option(this_param,param_dict[this_param]) + "\n" )
+        written.add(this_param)
         
     #: for each line
     
     # check that all params were used
     for this_param in param_dict.keys():
-        if not this_param in ['JOB_NUMBER']:
+        if not this_param in written and not this_param in ['JOB_NUMBER']:
             print('Warning: Parameter %s not found in config file and was not written' % (this_param))
-        
-    output_file.close()
-    os.remove(temp_filename)
     
-#: def write_config()
+    return ''.join(output)
+    
+#: def _update_config()
 
 
 def dump_config(filename,config):
@@ -1060,15 +927,212 @@ def dump_config(filename,config):
         and no comments
     '''
     
+    replace_file(filename,_dump_config(config))
+
+#: def dump_config()
+
+
+def _dump_config(config):
+    """ text = _dump_config(config)
+        one line per option, formatted as in write_config()
+    """
+    
     # HACK - twl
     if 'DV_VALUE_NEW' in config:
         config.DV_VALUE = config.DV_VALUE_NEW
+    
+    lines = [ '%s= %s\n' % (key,format_option(key,value)) 
+              for key,value in config.items() ]
+    
+    return ''.join(lines)
+
+#: def _dump_config()
+
+
+def write_configs(configs,template=None):
+    """ write_configs(configs,template=None)
+        writes many config files in one call, such as the configs 
+        of a batch of design points
         
-    config_file = open(filename,'w')
-    # write dummy file
-    for key in config.keys():
-        config_file.write( '%s= 0 \n' % key )
-    config_file.close()
-    # dump data
-    write_config(filename,config)    
+        Inputs:
+            configs  - list of (filename,config) pairs, or a dictionary
+                       of configs keyed by filename
+            template - optional config file, read once and updated with
+                       each config as in write_config(). if not given,
+                       each config is dumped as in dump_config()
+        
+        Each file is replaced atomically.
+    """
+    
+    if isinstance(configs,dict):
+        configs = list(configs.items())
+    
+    if template is not None:
+        config_file = open(template)
+        config_lines = config_file.readlines()
+        config_file.close()
+    
+    for filename, config in configs:
+        if template is None:
+            text = _dump_config(config)
+        else:
+            text = _update_config(config_lines,config)
+        replace_file(filename,text)
+    
+#: def write_configs()
+
+
+def replace_file(filename,text):
+    """ replace_file(filename,text)
+        writes text to a uniquely named temporary file next to filename,
+        then renames it over filename. readers see either the old or 
+        the new file, and concurrent writers do not share a temp file.
+    """
+    
+    # write through links, as open(filename,'w') would
+    filename = os.path.realpath(filename)
+    
+    folder, name = os.path.split(filename)
+    temp_filename = os.path.join( folder, '.%s.%i.%s.tmp' % (name,os.getpid(),uuid.uuid4().hex[:8]) )
+    
+    try:
+        temp_file = os.fdopen( os.open(temp_filename, os.O_WRONLY|os.O_CREAT|os.O_EXCL, 0o666), 'w' )
+        with temp_file:
+            temp_file.write(text)
+        if os.path.exists(filename):
+            shutil.copymode(filename,temp_filename)
+        os.replace(temp_filename,filename)
+    except:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+    
+#: def replace_file()
+
+
+def format_option(this_param,new_value):
+    """ text = format_option(this_param,new_value)
+        formats the value of a config option, as written by
+        write_config() and dump_config()
+    """
+    write_option = _option_writers.get( option_types.get(this_param) )
+    if write_option is None:
+        # default, assume string, integer or unformatted float 
+        return '%s' % new_value
+    return write_option(new_value)
+
+#: def format_option()
+
+
+# -------------------------------------------------------------------
+#  Option Writers
+# -------------------------------------------------------------------
 
+def _write_float_list(new_value):
+    """ comma delimited list of floats """
+    return ", ".join([ "%s" % value for value in new_value ])
+
+def _write_name_list(new_value):
+    """ comma delimited list of strings no paren's """
+    if not isinstance(new_value,list):
+        new_value = [ new_value ]
+    return ", ".join(new_value)
+
+def _write_marker_list(new_value):
+    """ comma delimited list of strings inside paren's """
+    return "( " + _write_name_list(new_value) + " )"
+
+def _write_output_list(new_value):
+    """ comma delimited list of strings inside paren's, no padding """
+    return "(" + ", ".join(new_value) + ")"
+
+def _write_int(new_value):
+    return "%i" % new_value
+
+def _write_dv_param(new_value):
+    """ semicolon delimited lists of comma delimited lists """
+    
+    assert isinstance(new_value['PARAM'],list) , 'incorrect specification of DV_PARAM'
+    dv_params = new_value['PARAM']
+    dv_tags   = new_value['FFDTAG']
+    if not isinstance(dv_params[0],list):
+        dv_params = [ dv_params ]
+        dv_tags   = [ dv_tags   ]
+    
+    dv_text = []
+    for this_param_list, this_ffd_list in zip(dv_params,dv_tags):
+        if this_ffd_list != []:
+            this_text = ["%s" % this_ffd_list] + [ "%s" % value for value in this_param_list[1:] ]
+        else:
+            this_text = [ "%s" % value for value in this_param_list ]
+        dv_text.append( "( " + ", ".join(this_text) + ") " )
+    
+    return "; ".join(dv_text)
+
+#: def _write_dv_param()
+
+def _write_definition_dv(new_value):
+    """ unitary design variable definition """
+    
+    n_dv = len(new_value['KIND'])
+    if not n_dv:
+        return "NONE"
+    
+    dv_text = []
+    for i_dv in range(n_dv):
+        this_kind = new_value['KIND'][i_dv]
+        this_text = "( %i , %s | " % ( get_dvID(this_kind), new_value['SCALE'][i_dv] )
+        # markers
+        this_text += ", ".join([ "%s " % marker for marker in new_value['MARKER'][i_dv] ])
+        # params
+        if not this_kind in ['AOA','MACH_NUMBER']:
+            this_text += " | "
+            this_params = new_value['PARAM'][i_dv]
+            if this_kind in ffd_dv_kinds:
+                this_text += "%s , " % new_value['FFDTAG'][i_dv]
+                this_params = this_params[1:]
+            this_text += ", ".join([ "%s " % param for param in this_params ])
+        this_text += " )"
+        dv_text.append(this_text)
+    #: for each dv
+    
+    return "; ".join(dv_text)
+
+#: def _write_definition_dv()
+
+def _write_opt_objective(new_value):
+    """ unitary objective definition """
+    obj_text = []
+    for name,value in new_value.items():
+        if value['OBJTYPE']=='DEFAULT':
+            obj_text.append( "%s * %s " % (name,value['SCALE']) )
+        else:
+            obj_text.append( "( %s %s %s ) * %s" 
+                             % (name, value['OBJTYPE'], value['VALUE'], value['SCALE']) )
+    return "; ".join(obj_text)
+
+def _write_opt_constraint(new_value):
+    """ unitary constraint definition """
+    con_text = []
+    for con_type in ['EQUALITY','INEQUALITY']:
+        this_con = new_value[con_type]
+        for name,value in this_con.items():
+            con_text.append( "( %s %s %s ) * %s" 
+                             % (name, value['SIGN'], value['VALUE'], value['SCALE']) ) 
+    #: for each constraint type
+    if not con_text: 
+        return "NONE"
+    return "; ".join(con_text)
+
+# option type -> writer( new_value ) 
+_option_writers = { 'MARKER_LIST'    : _write_marker_list    ,
+                    'MARKER'         : _write_marker_list    ,
+                    'OUTPUT_LIST'    : _write_output_list    ,
+                    'NAME_LIST'      : _write_name_list      ,
+                    'TASK_LIST'      : _write_name_list      ,
+                    'FLOAT_LIST'     : _write_float_list     ,
+                    'INT'            : _write_int            ,
+                    'DV_PARAM'       : _write_dv_param       ,
+                    'DEFINITION_DV'  : _write_definition_dv  ,
+                    'OPT_OBJECTIVE'  : _write_opt_objective  ,
+                    'OPT_CONSTRAINT' : _write_opt_constraint  }
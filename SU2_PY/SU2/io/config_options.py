@@ -156,3 +156,69 @@ class DV_KIND(ordered_bunch):
     self.PARAM. extend(new_dvs['PARAM'])
 
 #: class DV_KIND
+
+# -------------------------------------------------------------------
+#  Option Type Registry
+# -------------------------------------------------------------------
+#  shared by read_config() and write_config(), maps an option name 
+#  to the type used to parse and format its value. 
+#  options not listed here are kept as strings.
+#
+#  MARKER_LIST   - ( a, b ) <-> ['a','b']
+#  MARKER        - ( a, b ) <-> string, written with parens
+#  OUTPUT_LIST   - (a, b)   <-> ['a','b']
+#  NAME_LIST     - a, b     <-> ['a','b']
+#  TASK_LIST     - a, b     <-> string, written from a list
+#  FLOAT_LIST    - 1.0, 2.0 <-> [1.0,2.0]
+#  FLOAT, INT    - scalars
+#  DV_PARAM, DEFINITION_DV, OPT_OBJECTIVE, OPT_CONSTRAINT
+#                - structured definitions
+
+option_types = {}
+
+def register_option(option_type,*names):
+    """ register_option(option_type,name1,name2,...)
+        sets the type of one or more config options
+    """
+    for name in names:
+        option_types[name] = option_type
+
+#: def register_option()
+
+register_option( 'MARKER_LIST'    , 'MARKER_EULER', 'MARKER_FAR', 'MARKER_PLOTTING',
+                                    'MARKER_MONITORING', 'MARKER_SYM' )
+register_option( 'MARKER'         , 'DV_MARKER' )
+register_option( 'OUTPUT_LIST'    , 'OUTPUT_FILES' )
+register_option( 'NAME_LIST'      , 'DV_KIND', 'HISTORY_OUTPUT' )
+register_option( 'TASK_LIST'      , 'TASKS', 'GRADIENTS' )
+register_option( 'FLOAT_LIST'     , 'DV_VALUE_OLD', 'DV_VALUE_NEW', 'DV_VALUE' )
+register_option( 'FLOAT'          , 'MACH_NUMBER', 'AOA', 'FIN_DIFF_STEP', 'CFL_NUMBER',
+                                    'HB_PERIOD', 'WRT_SOL_FREQ', 'RESULT_CACHE_SIZE',
+                                    'SOLVER_TIMEOUT' )
+register_option( 'INT'            , 'NUMBER_PART', 'AVAILABLE_PROC', 'ITER', 'TIME_INSTANCES',
+                                    'UNST_ADJOINT_ITER', 'ITER_AVERAGE_OBJ', 'INNER_ITER',
+                                    'OUTER_ITER', 'TIME_ITER', 'ADAPT_CYCLES',
+                                    'FIN_DIFF_JOBS', 'MULTIPOINT_JOBS', 'MULTIPOINT_NUMBER_PART',
+                                    'STABILITY_JOBS', 'ADJOINT_JOBS' )
+register_option( 'DV_PARAM'       , 'DV_PARAM' )
+register_option( 'DEFINITION_DV'  , 'DEFINITION_DV' )
+register_option( 'OPT_OBJECTIVE'  , 'OPT_OBJECTIVE' )
+register_option( 'OPT_CONSTRAINT' , 'OPT_CONSTRAINT' )
+
+#: ffd_dv_kinds
+
+# design variable kinds whose first parameter is the FFD box tag
+ffd_dv_kinds = frozenset([ 'FFD_SETTING'          ,
+                           'FFD_ANGLE_OF_ATTACK'  ,
+                           'FFD_CONTROL_POINT'    ,
+                           'FFD_NACELLE'          ,
+                           'FFD_GULL'             ,
+                           'FFD_TWIST'            ,
+                           'FFD_TWIST_2D'         ,
+                           'FFD_TWIST_ANGLE'      ,
+                           'FFD_ROTATION'         ,
+                           'FFD_CAMBER'           ,
+                           'FFD_THICKNESS'        ,
+                           'FFD_CONTROL_POINT_2D' ,
+                           'FFD_CAMBER_2D'        ,
+                           'FFD_THICKNESS_2D'     ])
@@ -84,31 +84,9 @@ def load_data( file_name, var_names=None   ,
             file_format = 'pickle'
     assert file_format in ['matlab','pickle'] , 'unsupported file format'
         
-    # get filelock
-    with filelock(file_name):    
-    
-        # LOAD MATLAB
-        if file_format == 'matlab' and scipy_loaded:
-            input_data = scipy.io.loadmat( file_name        = file_name ,
-                                           squeeze_me       = False     ,
-                                           chars_as_strings = True      ,
-                                           struct_as_record = True       )
-            # pull core variable
-            assert (core_name in input_data) , 'core data not found'
-            input_data = input_data[core_name]
-            
-            # convert recarray to dictionary
-            input_data = rec2dict(input_data)
-            
-        # LOAD PICKLE
-        elif file_format == 'pickle':
-            input_data = load_pickle(file_name)
-            # pull core variable
-            assert (core_name in input_data) , 'core data not found'
-            input_data = input_data[core_name]
-            
-        #: if file_format
-        
+    # get shared filelock, other readers are not blocked
+    with filelock(file_name,shared=True):
+        input_data = _load_file(file_name,file_format,core_name,scipy_loaded)
     #: with filelock
     
     # load specified varname into dictionary
@@ -127,6 +105,37 @@ def load_data( file_name, var_names=None   ,
 #: def load()
 
 
+def _load_file(file_name,file_format,core_name,scipy_loaded):
+    """ loads the core data of a file, the caller holds the filelock """
+    
+    # LOAD MATLAB
+    if file_format == 'matlab' and scipy_loaded:
+        import scipy.io
+        input_data = scipy.io.loadmat( file_name        = file_name ,
+                                       squeeze_me       = False     ,
+                                       chars_as_strings = True      ,
+                                       struct_as_record = True       )
+        # pull core variable
+        assert (core_name in input_data) , 'core data not found'
+        input_data = input_data[core_name]
+        
+        # convert recarray to dictionary
+        input_data = rec2dict(input_data)
+        
+    # LOAD PICKLE
+    elif file_format == 'pickle':
+        input_data = load_pickle(file_name)
+        # pull core variable
+        assert (core_name in input_data) , 'core data not found'
+        input_data = input_data[core_name]
+        
+    #: if file_format
+    
+    return input_data
+
+#: def _load_file()
+
+
 
 # -------------------------------------------------------------------
 #  Save a Dictionary of Data
@@ -172,7 +181,7 @@ def save_data( file_name, data_dict, append=False ,
             file_format = 'pickle'
     assert file_format in ['matlab','pickle'] , 'unsupported file format'
 
-    # get filelock
+    # get exclusive filelock
     with filelock(file_name):
         
         # if appending needed 
@@ -182,12 +191,9 @@ def save_data( file_name, data_dict, append=False ,
             if not os.path.exists(file_name):
                 raise Exception('Cannot append, file does not exist: %s' % file_name)
             # load old data
-            data_dict_old = load( file_name   = file_name   ,
-                                  var_names   = None        ,
-                                  file_format = file_format ,
-                                  core_name   = core_name    )
+            data_dict_old = _load_file(file_name,file_format,core_name,scipy_loaded)
             # check for keys not in new data
-            for key,value in data_dict_old.iteritems():
+            for key,value in data_dict_old.items():
                 if not(key in data_dict):
                     data_dict[key] = value
             #: for each dict item
@@ -28,6 +28,12 @@
 import os, time, errno
 from random import random
 
+try:
+    import fcntl
+except ImportError:
+    # no advisory locks on this platform, use lock files
+    fcntl = None
+
 # -------------------------------------------------------------------
 #  File Lock Class
 # -------------------------------------------------------------------  
@@ -39,26 +45,39 @@ class filelock(object):
         with filelock("test.txt", timeout=2, delay=0.5):
             print("Lock acquired.")
             # Do something with the locked file
+        
+        with filelock("test.txt", shared=True):
+            # Read the file, other readers are not blocked
             
         Inputs:
-            file_name - filename to lock
+            file_name - filename to lock, the lock file is file_name.lock
+                        in the same folder
             timeout   - default 10sec, maximum timeout to wait for lock
-            delay     - default 0.05sec, delay between each attempt to lock
-                        number incremented with a random perturbation
+            delay     - default 0.05sec, initial delay between each attempt 
+                        to lock, doubled after each attempt up to 1sec, 
+                        with a random perturbation
+            shared    - default False, if True many shared locks can be 
+                        held at once, an exclusive lock waits for all of them
+        
+        Locks are taken with fcntl.flock() on the lock file. The operating 
+        system releases them when the holder exits, so a crashed process
+        does not leave a stale lock behind. Where fcntl is not available,
+        the lock is the existence of the lock file, always exclusive.
            
         original source: Evan Fosmark, BSD license
         http://www.evanfosmark.com/2009/01/cross-platform-file-locking-support-in-python/
     """
  
-    def __init__(self, file_name, timeout=10, delay=.05):
+    def __init__(self, file_name, timeout=10, delay=.05, shared=False):
         """ Prepare the file locker. Specify the file to lock and optionally
             the maximum timeout and the delay between each attempt to lock.
         """
         self.is_locked = False
-        self.lockfile = os.path.join(os.getcwd(), "%s.lock" % file_name)
+        self.lockfile = "%s.lock" % os.path.abspath(file_name)
         self.file_name = file_name
         self.timeout = timeout
         self.delay = delay
+        self.shared = shared and fcntl is not None
  
  
     def acquire(self):
@@ -68,28 +87,58 @@ class filelock(object):
             an exception.
         """
         start_time = time.time()
+        delay = self.delay
         while True:
+            if self._try_acquire():
+                break
+            if (time.time() - start_time) >= self.timeout:
+                raise FileLockException("FileLock timeout occured for %s" % self.lockfile)
+            time.sleep( delay*( 1. + 0.2*random() ) )
+            delay = min( 2.*delay, max(self.delay,1.0) )
+        self.is_locked = True
+    
+    
+    def _try_acquire(self):
+        """ one attempt to take the lock, returns True if taken """
+        
+        # lock file existence
+        if fcntl is None:
             try:
                 self.fd = os.open(self.lockfile, os.O_CREAT|os.O_EXCL|os.O_RDWR)
-                break;
             except OSError as e:
                 if e.errno != errno.EEXIST:
                     raise 
-                if (time.time() - start_time) >= self.timeout:
-                    raise FileLockException("FileLock timeout occured for %s" % self.lockfile)
-                delay = self.delay*( 1. + 0.2*random() )
-                time.sleep(delay)
-        self.is_locked = True
+                return False
+            return True
+        
+        # advisory lock
+        fd = os.open(self.lockfile, os.O_CREAT|os.O_RDWR, 0o666)
+        mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        try:
+            fcntl.flock(fd, mode|fcntl.LOCK_NB)
+        except (IOError, OSError) as e:
+            os.close(fd)
+            if e.errno not in (errno.EAGAIN, errno.EACCES, errno.EWOULDBLOCK):
+                raise
+            return False
+        self.fd = fd
+        return True
  
  
     def release(self):
-        """ Get rid of the lock by deleting the lockfile. 
+        """ Get rid of the lock. 
             When working in a `with` statement, this gets automatically 
             called at the end.
         """
         if self.is_locked:
-            os.close(self.fd)
-            os.unlink(self.lockfile)
+            if fcntl is None:
+                os.close(self.fd)
+                os.unlink(self.lockfile)
+            else:
+                # the lock file is kept, removing it could let two 
+                # processes lock different files of the same name
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+                os.close(self.fd)
             self.is_locked = False
  
  
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+## \file history.py
+#  \brief python package for following a growing history file
+#  \author T. Lukaczyk, F. Palacios
+#  \version 7.0.6 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------
+#  Imports
+# -------------------------------------------------------------------
+
+import os, warnings
+import numpy as np
+from SU2.util import ordered_bunch
+from .tools import history_header_index
+
+# -------------------------------------------------------------------
+#  History Tail Class
+# -------------------------------------------------------------------
+
+class HistoryTail(object):
+    """ history = SU2.io.HistoryTail(filename,map_headers=True)
+
+        follows a history file while the solver is still writing it.
+        each call to read() parses only the rows appended since the
+        previous call, so polling a running case costs O(new rows).
+
+        Example:
+            history = HistoryTail('history_direct.csv')
+            while running:
+                new_rows = history.read()
+                if len(new_rows['LIFT']): check(new_rows['LIFT'])
+
+        Inputs:
+            filename    - history or plot file, csv or tecplot
+            map_headers - if True, headers are mapped to the
+                          optimization names, as in read_history()
+
+        Attributes:
+            headers - list of (mapped) column names, None until
+                      the header of the file has been written
+            offset  - byte offset of the first unread line
+            n_rows  - number of rows read so far
+
+        A last line without a line ending is left in the file and
+        read on the next call, once the solver has finished it.
+        If the file is truncated or rewritten, reading restarts
+        from the beginning.
+    """
+
+    def __init__(self, filename, map_headers=True):
+        self.filename    = filename
+        self.map_headers = map_headers
+        self.reset()
+
+    def reset(self):
+        """ forget the header and restart from the beginning of the file """
+        self.headers  = None
+        self.offset   = 0
+        self.n_rows   = 0
+        self._pending = False # VARIABLES= seen, names on next line
+
+    def read(self):
+        """ new_rows = HistoryTail.read()
+            returns an ordered bunch with the column names for keys and
+            a numpy array of the rows appended since the last call.
+            returns an empty bunch if the header is not complete yet.
+        """
+
+        if not os.path.exists(self.filename):
+            return ordered_bunch()
+
+        # file was truncated or rewritten
+        if os.path.getsize(self.filename) < self.offset:
+            self.reset()
+
+        with open(self.filename,'rb') as history_file:
+            history_file.seek(self.offset)
+            chunk = history_file.read()
+
+        # only consume complete lines
+        end = chunk.rfind(b'\n')
+        if end < 0:
+            return self._empty()
+        self.offset += end + 1
+        lines = chunk[:end+1].decode().splitlines()
+
+        # header, possibly split over several polls
+        if self.headers is None:
+            lines = self._read_header(lines)
+            if self.headers is None:
+                return self._empty()
+
+        rows = [ line for line in lines
+                 if line.strip() and not line.startswith('ZONE') ]
+
+        return self._parse(rows)
+
+    #: def read()
+
+    def _read_header(self, lines):
+        """ consumes title and variable lines, returns the remaining lines """
+
+        for i_line, line in enumerate(lines):
+
+            if self._pending:
+                self._set_headers(line)
+            elif line.startswith('TITLE') or not line.strip():
+                continue
+            elif line.startswith('VARIABLES'):
+                line = line.split('=',1)[1]
+                if not line.strip():
+                    self._pending = True
+                    continue
+                self._set_headers(line)
+            else:
+                self._set_headers(line)
+
+            return lines[i_line+1:]
+
+        return []
+
+    def _set_headers(self, line):
+        headers = [ x.strip().strip('"') for x in line.split(',') ]
+        if self.map_headers:
+            headers = [ history_header_index.get(key,key) for key in headers ]
+        self.headers  = headers
+        self._pending = False
+
+    def _parse(self, rows):
+        """ parses complete data rows into one array per column """
+
+        n_Vars = len(self.headers)
+
+        if rows:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                data = np.loadtxt( rows, delimiter=',', dtype=float, ndmin=2 )
+            if data.shape[1] != n_Vars:
+                raise IOError('number of values does not match number of headers in %s' % self.filename)
+        else:
+            data = np.zeros([0,n_Vars])
+
+        self.n_rows += data.shape[0]
+
+        data = np.ascontiguousarray(data.T)
+
+        new_rows = ordered_bunch()
+        for i_Var, this_variable in enumerate(self.headers):
+            new_rows[this_variable] = data[i_Var]
+
+        return new_rows
+
+    def _empty(self):
+        if self.headers is None:
+            return ordered_bunch()
+        return self._parse([])
+
+#: class HistoryTail
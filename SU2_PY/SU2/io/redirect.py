@@ -30,8 +30,43 @@
 # ----------------------------------------------------------------------
 
 import os, sys, shutil, copy, glob
+import threading
 from .tools import add_suffix, make_link, expand_part
 
+# working folder and output streams of each thread,
+# set by folder(...,chdir=False) and output()
+_local = threading.local()
+
+# -------------------------------------------------------------------
+#  Working Folder
+# -------------------------------------------------------------------
+
+def getcwd():
+    """ folder = SU2.io.getcwd()
+        working folder of the SU2 tools in this thread, the folder of the
+        innermost redirect_folder(...,chdir=False), otherwise the working
+        folder of the process
+    """
+    folder = getattr(_local,'folder',None)
+    if folder is None:
+        folder = os.getcwd()
+    return folder
+
+def work_path(name):
+    """ path = SU2.io.work_path(name)
+        path of a file name relative to SU2.io.getcwd(),
+        absolute names are returned unchanged
+    """
+    return os.path.join(getcwd(),name)
+
+def output_streams():
+    """ stdout,stderr = SU2.io.output_streams()
+        output streams of this thread, set by redirect_output()
+    """
+    stdout = getattr(_local,'stdout',None) or sys.stdout
+    stderr = getattr(_local,'stderr',None) or sys.stderr
+    return stdout, stderr
+
 # -------------------------------------------------------------------
 #  Output Redirection 
 # -------------------------------------------------------------------
@@ -54,6 +89,11 @@ class output(object):
             stderr - None, a filename, or a file stream
         None will not redirect outptu
         
+        The streams are also set for this thread, see output_streams(), 
+        and are used by SU2.run.run_command(). Inside a 
+        redirect_folder(...,chdir=False), sys.stdout and sys.stderr 
+        are not changed, so that other threads are not redirected.
+        
     '''
     def __init__(self, stdout=None, stderr=None):
         
@@ -61,10 +101,10 @@ class output(object):
         _newerr = False
         
         if isinstance(stdout,str):
-            stdout = open(stdout,'a')
+            stdout = open(work_path(stdout),'a')
             _newout = True            
         if isinstance(stderr,str):
-            stderr = open(stderr,'a')
+            stderr = open(work_path(stderr),'a')
             _newerr = True                   
                 
         self._stdout = stdout or sys.stdout
@@ -73,14 +113,20 @@ class output(object):
         self._newerr = _newerr
 
     def __enter__(self):
-        self.old_stdout, self.old_stderr = sys.stdout, sys.stderr
-        self.old_stdout.flush(); self.old_stderr.flush()
-        sys.stdout, sys.stderr = self._stdout, self._stderr
+        self.old_local = output_streams()
+        self.global_streams = getattr(_local,'folder',None) is None
+        _local.stdout, _local.stderr = self._stdout, self._stderr
+        if self.global_streams:
+            self.old_stdout, self.old_stderr = sys.stdout, sys.stderr
+            self.old_stdout.flush(); self.old_stderr.flush()
+            sys.stdout, sys.stderr = self._stdout, self._stderr
 
     def __exit__(self, exc_type, exc_value, traceback):
         self._stdout.flush(); self._stderr.flush()
-        sys.stdout = self.old_stdout
-        sys.stderr = self.old_stderr
+        _local.stdout, _local.stderr = self.old_local
+        if self.global_streams:
+            sys.stdout = self.old_stdout
+            sys.stderr = self.old_stderr
         
         if self._newout:
             self._stdout.close()
@@ -125,6 +171,11 @@ class folder(object):
             pull   - list of files to pull (copy to working folder)
             link   - list of files to link (symbolic link in working folder)
             force  - True/False overwrite existing files in working folder
+            chdir  - True, changes the working folder of the process
+                     False, only sets the working folder of this thread,
+                     see SU2.io.getcwd(), the SU2 tools are run there
+                     None (default), False inside a redirection without 
+                     chdir, True otherwise
         
         Targets:
             push   - list of files to push (copy to originating path)
@@ -134,7 +185,7 @@ class folder(object):
             links in Windows not supported, will simply copy
     '''
     
-    def __init__(self, folder, pull=None, link=None, force=True ):
+    def __init__(self, folder, pull=None, link=None, force=True, chdir=None ):
         ''' folder redirection initialization
             see help( folder ) for more info
         '''
@@ -145,7 +196,11 @@ class folder(object):
         if not isinstance(pull,list) : pull = [pull]
         if not isinstance(link,list) : link = [link]
         
-        origin = os.getcwd()
+        if chdir is None:
+            chdir = getattr(_local,'folder',None) is None
+        
+        origin = getcwd()
+        folder = os.path.join(origin,folder)
         origin = os.path.abspath(origin).rstrip('/')+'/'
         folder = os.path.abspath(folder).rstrip('/')+'/'
         
@@ -155,6 +210,7 @@ class folder(object):
         self.push   = []
         self.link   = copy.deepcopy(link)
         self.force  = force
+        self.chdir  = chdir
 
     def __enter__(self): 
         
@@ -165,8 +221,12 @@ class folder(object):
         link   = self.link
         force  = self.force
         
+        self.old_folder = getattr(_local,'folder',None)
+        
         # check for no folder change
         if folder == origin:
+            if not self.chdir:
+                _local.folder = os.path.normpath(folder)
             return []
         
         # relative folder path
@@ -178,7 +238,7 @@ class folder(object):
         
         # copy pull files
         for name in pull:
-            old_name = os.path.abspath(name)
+            old_name = os.path.abspath(os.path.join(origin,name))
             new_name = os.path.split(name)[-1]
             new_name = os.path.join(folder,new_name)
             if old_name == new_name: continue
@@ -189,7 +249,7 @@ class folder(object):
 
         # make links
         for name in link:
-            old_name = os.path.abspath(name)
+            old_name = os.path.abspath(os.path.join(origin,name))
             new_name = os.path.split(name)[-1]
             new_name = os.path.join(folder,new_name)
             if old_name == new_name: continue
@@ -199,7 +259,12 @@ class folder(object):
             make_link(old_name,new_name)
             
         # change directory
-        os.chdir(folder)
+        if self.chdir:
+            self.old_cwd = os.getcwd()
+            os.chdir(folder)
+            _local.folder = None
+        else:
+            _local.folder = os.path.normpath(folder)
         
         # return empty list to append with files to push to super folder
         return push
@@ -213,12 +278,13 @@ class folder(object):
         
         # check for no folder change
         if folder == origin:
+            _local.folder = self.old_folder
             return
         
         # move assets
         for name in push:
             
-            old_name = os.path.abspath(name)
+            old_name = os.path.abspath(os.path.join(folder,name))
             name = os.path.split(name)[-1]
             new_name = os.path.join(origin,name)
             
@@ -240,6 +306,8 @@ class folder(object):
                 shutil.move(old_name,new_name)
             
         # change directory
-        os.chdir(origin)
+        if self.chdir:
+            os.chdir(self.old_cwd)
+        _local.folder = self.old_folder
         
 #: class folder()
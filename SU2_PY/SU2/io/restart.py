@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+
+## \file restart.py
+#  \brief python package for reading and writing binary restart files
+#  \author T. Lukaczyk, F. Palacios
+#  \version 7.0.6 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------
+#  Imports
+# -------------------------------------------------------------------
+
+import os
+import numpy as np
+
+# -------------------------------------------------------------------
+#  Binary Restart Format
+# -------------------------------------------------------------------
+#  layout written by CSU2BinaryFileWriter:
+#    int32[5]           magic number, nVar, nPoint, nInt, nDouble
+#    char[33] x nVar    field names, null padded (CGNS string size)
+#    float64[nPoint,nVar] data, one row per point
+#    int32[nInt]        trailing block, not read
+#    float64[nDouble]   trailing block, not read
+
+restart_magic_number = 535532
+restart_string_size  = 33
+
+# -------------------------------------------------------------------
+#  Binary Restart Class
+# -------------------------------------------------------------------
+
+class BinaryRestart(object):
+    """ restart = SU2.io.BinaryRestart(filename,mode='r')
+
+        memory-maps a binary SU2 restart file (.dat).
+        only the header is read when the file is opened, the point
+        data stays on disk and is paged in when a field is accessed.
+
+        Example:
+            restart = BinaryRestart('restart_flow.dat')
+            rho = restart['Density']        # view into the file
+            rho = restart.load('Density')   # contiguous copy in memory
+
+        Inputs:
+            filename - binary restart file
+            mode     - 'r'  read only
+                       'r+' changes to the data are written to the file
+                       'c'  copy-on-write, the file is not changed
+
+        Attributes:
+            fields    - list of field names, in file order
+            n_points  - number of points
+            data      - memory-mapped array of shape [n_points,n_fields]
+    """
+
+    def __init__(self, filename, mode='r'):
+
+        assert mode in ('r','r+','c') , 'unknown restart file mode %s' % mode
+
+        self.filename = filename
+
+        with open(filename,'rb') as restart_file:
+            header = np.fromfile(restart_file,dtype=np.int32,count=5)
+            if len(header) != 5 or header[0] != restart_magic_number:
+                raise IOError('%s is not a binary SU2 restart file' % filename)
+            magic, n_fields, n_points, n_int, n_double = [ int(x) for x in header ]
+
+            names = restart_file.read(restart_string_size*n_fields)
+            if len(names) != restart_string_size*n_fields:
+                raise IOError('error reading restart file %s' % filename)
+
+        self.fields = [ _decode_name(names[i*restart_string_size:(i+1)*restart_string_size])
+                        for i in range(n_fields) ]
+        self.n_points = n_points
+
+        # byte offsets of each block
+        offset = 5*4 + restart_string_size*n_fields
+        size   = n_points*n_fields*8
+        if os.path.getsize(filename) < offset + size + n_int*4 + n_double*8:
+            raise IOError('restart file %s is truncated' % filename)
+
+        # zero-copy access to the data block
+        if size:
+            self.data = np.memmap( filename, dtype=np.float64, mode=mode,
+                                   offset=offset, shape=(n_points,n_fields) )
+        else:
+            self.data = np.zeros([n_points,n_fields])
+
+    #: def __init__()
+
+    def __getitem__(self, field):
+        """ column view of one field, no data is copied """
+        return self.data[:,self.index(field)]
+
+    def __setitem__(self, field, value):
+        self.data[:,self.index(field)] = value
+
+    def __contains__(self, field):
+        return field in self.fields
+
+    def __len__(self):
+        return self.n_points
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def keys(self):
+        return list(self.fields)
+
+    def index(self, field):
+        if not field in self.fields:
+            raise KeyError('field %s not found in %s' % (field,self.filename))
+        return self.fields.index(field)
+
+    def load(self, field):
+        """ values = BinaryRestart.load(field)
+            reads one field into a contiguous array in memory
+        """
+        return np.array(self[field])
+
+    def flush(self):
+        """ writes changes to the file, if opened with mode 'r+' """
+        if isinstance(self.data,np.memmap):
+            self.data.flush()
+
+    def close(self):
+        self.flush()
+        self.data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+#: class BinaryRestart
+
+
+# -------------------------------------------------------------------
+#  Read Binary Restart File
+# -------------------------------------------------------------------
+
+def read_restart( filename, mode='r' ):
+    """ restart = read_restart(filename,mode='r')
+        opens a binary restart file, see BinaryRestart
+    """
+    return BinaryRestart(filename,mode)
+
+#: def read_restart()
+
+
+# -------------------------------------------------------------------
+#  Write Binary Restart File
+# -------------------------------------------------------------------
+
+def write_restart( filename, data, fields=None ):
+    """ write_restart(filename,data,fields=None)
+        writes a binary restart file in the format of SU2_CFD
+
+        Inputs:
+            filename  - output file, overwritten if it exists
+            data      - dictionary of equal length columns, such as
+                        the output of read_plot() or a BinaryRestart,
+                        or a 2D array of shape [n_points,n_fields]
+            fields    - field names, required if data is an array
+
+        the data block is written through a memory map one field
+        at a time, so the columns are never stacked in memory.
+    """
+
+    # columns of the data
+    if isinstance(data,np.ndarray):
+        assert data.ndim == 2 , 'restart data must be a 2D array'
+        assert fields is not None , 'field names are required for array data'
+        columns = [ data[:,i] for i in range(data.shape[1]) ]
+    else:
+        if fields is None:
+            fields = list(data.keys())
+        columns = [ data[field] for field in fields ]
+
+    fields   = list(fields)
+    n_fields = len(fields)
+    n_points = len(columns[0]) if columns else 0
+    assert len(columns) == n_fields , 'number of fields does not match the data'
+    for column in columns:
+        assert len(column) == n_points , 'restart fields must have the same length'
+
+    # header, without a trailing block
+    with open(filename,'wb') as restart_file:
+        header = np.array([restart_magic_number,n_fields,n_points,0,0],dtype=np.int32)
+        header.tofile(restart_file)
+        for field in fields:
+            name = field.encode()[:restart_string_size-1]
+            restart_file.write(name.ljust(restart_string_size,b'\0'))
+        offset = restart_file.tell()
+
+        # reserve the data block
+        size = n_points*n_fields*8
+        restart_file.seek(offset+size)
+        restart_file.truncate()
+
+    # data, one field at a time
+    if size:
+        restart_data = np.memmap( filename, dtype=np.float64, mode='r+',
+                                  offset=offset, shape=(n_points,n_fields) )
+        for i_field, column in enumerate(columns):
+            restart_data[:,i_field] = column
+        restart_data.flush()
+        del restart_data
+
+    return
+
+#: def write_restart()
+
+
+def _decode_name( name ):
+    """ field name from a null padded string """
+    return name.split(b'\0',1)[0].decode()
@@ -33,7 +33,7 @@ import os, sys, shutil, copy, time
 from ..io   import expand_part, expand_zones, expand_time, get_adjointSuffix, add_suffix, \
                    get_specialCases, Config, expand_multipoint, optnames_multi
 from ..util import bunch
-from ..util import ordered_bunch
+from ..util import ordered_bunch, cow_bunch
 
 
 # ----------------------------------------------------------------------
@@ -124,7 +124,7 @@ def State_Factory(state=None,config=None):
 #  State Class
 # ----------------------------------------------------------------------
 
-class State(ordered_bunch):
+class State(cow_bunch):
     """ state = SU2.io.state.State()
         
         This is the State class that should be generated with the 
@@ -0,0 +1,395 @@
+#!/usr/bin/env python
+
+## \file store.py
+#  \brief python package for the append-only project store
+#  \author T. Lukaczyk, F. Palacios
+#  \version 7.0.6 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# -------------------------------------------------------------------
+#  Imports
+# -------------------------------------------------------------------
+
+import os, sys, copy, struct
+if sys.version_info[0] > 2:
+    import pickle
+else:
+    import cPickle as pickle
+
+from .filelock import filelock
+from SU2.util.ordered_dict import OrderedDict
+
+# -------------------------------------------------------------------
+#  Store Format
+# -------------------------------------------------------------------
+#  the store is a log of records, each record is
+#    uint32, uint64     key length, value length
+#    char[key length]   key, utf-8
+#    char[value length] value, pickled
+#  records are only appended, a key written again gets a new version.
+#  a record that is not complete, after a crash, is ignored and is
+#  overwritten by the next append.
+
+_record_header = struct.Struct('<IQ')
+
+_config_key = 'PROJECT_CONFIG'
+
+
+# -------------------------------------------------------------------
+#  Project Store Class
+# -------------------------------------------------------------------
+
+class ProjectStore(object):
+    """ store = SU2.io.ProjectStore(filename)
+
+        append-only store of the designs of a project.
+        each save appends one record to the end of the file, earlier
+        records are never rewritten, so the cost of a save does not
+        grow with the number of designs.
+
+        the index of the file is built from the record headers only,
+        values are unpickled when they are loaded.
+
+        Example:
+            store = ProjectStore('project.store')
+            store.save_config(config)
+            store.save_design(design.folder,design)
+            design = store.load_design('DESIGNS/DSN_001')
+
+        Inputs:
+            filename - store file, the absolute path is kept so the
+                       store can be used from any working folder
+
+        Methods:
+            append(key,value)      - appends a new version of a key
+            load(key,version=-1)   - loads a version of a key
+            versions(key)          - number of versions of a key
+            keys()                 - keys in order of first appearance
+            refresh()              - indexes records appended by others
+            clear()                - removes all records
+            save_config(config)    - saves the base config of the project
+            save_design(key,design)- saves a design, with its config as
+                                     a difference to the base config
+            load_design(key)       - rebuilds a saved design
+            design_keys()          - keys of all saved designs
+
+        The store pickles as a reference to its file.
+    """
+
+    def __init__(self, filename):
+        self.filename = os.path.abspath(filename)
+        self._reset()
+
+    def _reset(self):
+        self._index   = OrderedDict() # key -> list of (offset,size)
+        self._end     = 0             # end of the last complete record
+        self._scanned = False
+        self._config  = None          # cached base config
+
+    # -------------------------------------------------------------------
+    #  Index
+
+    def refresh(self):
+        """ store.refresh()
+            adds records appended since the last scan to the index,
+            reads only the record headers
+        """
+
+        self._scanned = True
+        if not os.path.exists(self.filename):
+            return
+
+        file_size = os.path.getsize(self.filename)
+        if file_size < self._end:
+            # store was cleared
+            self._reset()
+            self._scanned = True
+
+        with open(self.filename,'rb') as store_file:
+            position = self._end
+            while position + _record_header.size <= file_size:
+                store_file.seek(position)
+                key_size, value_size = _record_header.unpack(store_file.read(_record_header.size))
+                offset = position + _record_header.size + key_size
+                if offset + value_size > file_size:
+                    break
+                key = store_file.read(key_size).decode()
+                self._index.setdefault(key,[]).append( (offset,value_size) )
+                position = offset + value_size
+            self._end = position
+
+    #: def refresh()
+
+    def _check_index(self):
+        if not self._scanned:
+            self.refresh()
+
+    def keys(self):
+        self._check_index()
+        return list(self._index.keys())
+
+    def __contains__(self, key):
+        self._check_index()
+        return key in self._index
+
+    def __len__(self):
+        self._check_index()
+        return len(self._index)
+
+    def versions(self, key):
+        self._check_index()
+        return len(self._index.get(key,[]))
+
+    # -------------------------------------------------------------------
+    #  Records
+
+    def append(self, key, value):
+        """ store.append(key,value)
+            appends a new version of key to the end of the store
+        """
+
+        data = pickle.dumps(value,protocol=pickle.HIGHEST_PROTOCOL)
+        name = key.encode()
+
+        with filelock(self.filename):
+
+            # records appended by other processes
+            self.refresh()
+
+            mode = 'r+b' if os.path.exists(self.filename) else 'wb'
+            with open(self.filename,mode) as store_file:
+                # drop an incomplete record
+                store_file.truncate(self._end)
+                store_file.seek(self._end)
+                store_file.write(_record_header.pack(len(name),len(data)))
+                store_file.write(name)
+                store_file.write(data)
+
+            offset = self._end + _record_header.size + len(name)
+            self._index.setdefault(key,[]).append( (offset,len(data)) )
+            self._end = offset + len(data)
+
+        #: with filelock
+
+        return
+
+    #: def append()
+
+    def load(self, key, version=-1):
+        """ value = store.load(key,version=-1)
+            unpickles a version of key, by default the latest
+        """
+
+        self._check_index()
+        if not key in self._index:
+            self.refresh()
+        if not key in self._index:
+            raise KeyError('%s not found in store %s' % (key,self.filename))
+
+        offset, size = self._index[key][version]
+        with open(self.filename,'rb') as store_file:
+            store_file.seek(offset)
+            data = store_file.read(size)
+
+        return pickle.loads(data)
+
+    def clear(self):
+        """ store.clear()
+            removes the store file and all its records
+        """
+        with filelock(self.filename):
+            if os.path.exists(self.filename):
+                os.remove(self.filename)
+            self._reset()
+
+    # -------------------------------------------------------------------
+    #  Designs
+
+    def save_config(self, config):
+        """ store.save_config(config)
+            saves the base config, designs are saved relative to it
+        """
+        self.append(_config_key,config)
+        self._config = copy.deepcopy(config)
+
+    @property
+    def config(self):
+        """ the base config of the project """
+        if self._config is None:
+            self._config = self.load(_config_key)
+        return self._config
+
+    def save_design(self, key, design):
+        """ store.save_design(key,design)
+            appends the attributes of a design, its config is
+            saved as the keys that differ from the base config
+        """
+
+        record = design.__dict__.copy()
+        record.pop('store',None)
+        if _config_key in self:
+            record['config'] = _config_delta(design.config,self.config)
+
+        self.append(key, (design.__class__,record) )
+
+    def load_design(self, key):
+        """ design = store.load_design(key)
+            rebuilds a design saved with save_design()
+        """
+
+        design_class, record = self.load(key)
+
+        config = record['config']
+        if isinstance(config,_ConfigDelta):
+            record['config'] = config.apply(self.config)
+
+        design = design_class.__new__(design_class)
+        design.__dict__.update(record)
+        design.store = self
+
+        return design
+
+    def design_keys(self):
+        return [ key for key in self.keys() if key != _config_key ]
+
+    def __reduce__(self):
+        return self.__class__, (self.filename,)
+
+    def __repr__(self):
+        return '<ProjectStore> %s' % self.filename
+
+#: class ProjectStore
+
+
+# -------------------------------------------------------------------
+#  Design List Class
+# -------------------------------------------------------------------
+
+class DesignList(object):
+    """ designs = SU2.io.DesignList(store,keys=None)
+
+        list of the designs of a project, each design is loaded
+        from the store the first time it is accessed.
+        pickles as the store and the design keys only.
+    """
+
+    def __init__(self, store, keys=None):
+        if keys is None: keys = []
+        self.store   = store
+        self._keys   = list(keys)
+        self._values = [None] * len(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __getitem__(self, index):
+        if isinstance(index,slice):
+            return [ self[i] for i in range(*index.indices(len(self))) ]
+        design = self._values[index]
+        if design is None:
+            design = self.store.load_design(self._keys[index])
+            self._values[index] = design
+        return design
+
+    def __setitem__(self, index, design):
+        self._keys[index]   = design.folder
+        self._values[index] = design
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, design):
+        self._keys.append(design.folder)
+        self._values.append(design)
+
+    def keys(self):
+        return list(self._keys)
+
+    def index(self, design):
+        return self._keys.index(design.folder)
+
+    def unload(self, index):
+        """ drops a loaded design, it is loaded again on next access """
+        self._values[index] = None
+
+    def __reduce__(self):
+        return self.__class__, (self.store,self._keys)
+
+    def __repr__(self):
+        return '<DesignList> with %i designs' % len(self)
+
+#: class DesignList
+
+
+# -------------------------------------------------------------------
+#  Config Delta
+# -------------------------------------------------------------------
+
+class _ConfigDelta(object):
+    """ the keys of a config that differ from a base config,
+        and the key order if applying the keys does not give it
+    """
+
+    def __init__(self, changed, removed, order=None):
+        self.changed = changed
+        self.removed = removed
+        self.order   = order
+
+    def apply(self, base):
+        config = copy.deepcopy(base)
+        for key in self.removed:
+            del config[key]
+        for key, value in self.changed:
+            config[key] = value
+        # new keys were appended at the end
+        order = getattr(self,'order',None)
+        if order is not None:
+            for key in order:
+                value = dict.__getitem__(config,key)
+                del config[key]
+                config[key] = value
+        return config
+
+def _config_delta( config, base ):
+    """ delta = _config_delta(config,base)
+        compares stored values, without copying them
+    """
+    changed = []
+    for key in config:
+        value = dict.__getitem__(config,key)
+        if dict.__contains__(base,key):
+            base_value = dict.__getitem__(base,key)
+            if value is base_value or value == base_value:
+                continue
+        changed.append( (key,value) )
+    removed = [ key for key in base if not dict.__contains__(config,key) ]
+
+    # order of the keys after apply()
+    order = [ key for key in base if dict.__contains__(config,key) ]
+    order += [ key for key, value in changed if not dict.__contains__(base,key) ]
+    if order == list(config.keys()):
+        order = None
+    else:
+        order = list(config.keys())
+
+    return _ConfigDelta(changed,removed,order)
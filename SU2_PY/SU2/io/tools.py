@@ -30,7 +30,8 @@
 # -------------------------------------------------------------------
 
 import os
-import shutil, glob
+import shutil, glob, itertools, warnings
+import numpy as np
 from SU2.util import ordered_bunch
 from .historyMap import history_header_map as historyOutFields
 
@@ -69,12 +70,81 @@ def read_plot( filename ):
     """ reads a plot file
         returns an ordered bunch with the headers for keys
         and a list of each header's floats for values.
+        
+        the file is parsed in one pass with numpy, use iread_plot()
+        for the columnar arrays or for files that do not fit in memory.
     """
     
-    extension = os.path.splitext( filename )[1]
+    # a single chunk holds the whole file
+    for plot_data in iread_plot( filename, chunk_size=None ):
+        # lists at the boundary, states are written with toYAML
+        for key,value in plot_data.items():
+            plot_data[key] = value.tolist()
+        return plot_data
+
+#: def read_plot()
+
+
+def iread_plot( filename, chunk_size=10000 ):
+    """ for plot_data in iread_plot(filename,chunk_size=10000):
+        
+        reads a plot file in chunks of rows
+        yields ordered bunches with the headers for keys and a
+        numpy array of at most chunk_size floats for values.
+        if chunk_size is None, yields the whole file at once.
+    """
     
     # open history file
-    plot_file = open(filename)
+    with open(filename) as plot_file:
+        
+        Variables = read_plot_header( plot_file )
+        n_Vars = len(Variables)
+        
+        # data rows, zone lines are filtered out
+        rows = _plot_rows( plot_file )
+        
+        while True:
+            
+            if chunk_size is None:
+                chunk = rows
+            else:
+                chunk = list( itertools.islice(rows,chunk_size) )
+                if not chunk: break
+            
+            # parse all rows of the chunk at once
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                data = np.loadtxt( chunk, delimiter=',', dtype=float, ndmin=2 )
+            if data.size == 0:
+                data = np.zeros([0,n_Vars])
+            if data.shape[1] != n_Vars:
+                raise IOError('number of values does not match number of headers in %s' % filename)
+            
+            # one contiguous array per column
+            data = np.ascontiguousarray(data.T)
+            
+            # store to dictionary
+            plot_data = ordered_bunch()
+            for i_Var,this_variable in enumerate(Variables):
+                plot_data[this_variable] = data[i_Var]
+            
+            yield plot_data
+            
+            if chunk_size is None: break
+        
+        #: while chunks
+    
+    #: with plot file
+
+#: def iread_plot()
+
+
+def read_plot_header( plot_file ):
+    """ Variables = read_plot_header(plot_file)
+        reads the title and variable lines of an open plot file
+        returns the list of header names, the file is left 
+        at the first line after the header
+    """
     
     # title?
     line = plot_file.readline()
@@ -82,52 +152,45 @@ def read_plot( filename ):
         title = line.split('=')[1] .strip() # not used right now
         line = plot_file.readline()
 
+    # tecplot variables, may be on the same line
     if line.startswith('VARIABLES'):
-          line = plot_file.readline()
+        line = line.split('=',1)[1]
+        if not line.strip():
+            line = plot_file.readline()
 
     line = line.split(",")
     Variables = [ x.strip().strip('"') for x in line ]
-    n_Vars = len(Variables)
     
-    # initialize plot data dictionary
-    plot_data = ordered_bunch.fromkeys(Variables)
-    # must default each value to avoid pointer problems
-    for key in plot_data.keys(): plot_data[key] = [] 
+    return Variables
+
+#: def read_plot_header()
+
+
+def _plot_rows( plot_file ):
+    """ yields the data lines of an open plot file,
+        skipping empty lines and the zone line
+    """
     
     # zone list
     zones = []
-        
-    # read all data rows
-    while 1:
-        # read line
-        line = plot_file.readline()
-        if not line:
-            break
+    
+    for line in plot_file:
         
         #zone?
         if line.startswith('ZONE'):
             zone = line.split('=')[1].strip('" ')
             zones.append(zone)
+            # check for number of zones
+            if len(zones) > 1:
+                raise IOError('multiple zones not supported')
             continue
         
-        # split line
-        line_data = line.strip().split(',')
-        line_data = [ float(x.strip()) for x in line_data ]  
+        if not line.strip():
+            continue
         
-        # store to dictionary
-        for i_Var in range(n_Vars):
-            this_variable = Variables[i_Var] 
-            plot_data[this_variable] = plot_data[this_variable] + [ line_data[i_Var] ]
-    
-    #: for each line
+        yield line
 
-    # check for number of zones
-    if len(zones) > 1:
-        raise IOError('multiple zones not supported')
-    
-    # done
-    plot_file.close()              
-    return plot_data
+#: def _plot_rows()
 
 
 # -------------------------------------------------------------------
@@ -152,10 +215,7 @@ def read_history( History_filename, nZones = 1):
 
     # map header names
     for key in plot_data.keys():
-        var = key
-        for field in historyOutFields:
-            if key == historyOutFields[field]['HEADER']:
-                var = field
+        var = history_header_index.get(key,key)
         history_data[var] = plot_data[key]
     
     return history_data
@@ -164,17 +224,52 @@ def read_history( History_filename, nZones = 1):
 
 
 
+# -------------------------------------------------------------------
+#  History Field Indices
+# -------------------------------------------------------------------
+
+def _index_history_fields():
+    """ field_headers, header_index, type_index, group_index = _index_history_fields()
+        builds the lookup tables of the history output fields once,
+        fields keep the order of historyOutFields in each list.
+        for headers shared by several fields the last field wins,
+        the same as the previous linear scan in read_history().
+    """
+    
+    field_headers = dict()
+    header_index  = dict()
+    type_index    = dict()
+    group_index   = dict()
+    
+    for field, value in historyOutFields.items():
+        field_headers[field] = value['HEADER']
+        header_index[value['HEADER']] = field
+        type_index.setdefault(value['TYPE'],[]).append(field)
+        group_index.setdefault(value['GROUP'],[]).append(field)
+    
+    return field_headers, header_index, type_index, group_index
+
+#: def _index_history_fields()
+
+_history_field_headers, history_header_index, history_type_index, history_group_index = _index_history_fields()
+
+#: optnames_aero, optnames_aero_diff, optnames_aero_tavg
+
+optnames_aero      = history_type_index.get('COEFFICIENT',[])
+optnames_aero_diff = history_type_index.get('D_COEFFICIENT',[])
+optnames_aero_tavg = history_type_index.get('TAVG_COEFFICIENT',[]) + history_type_index.get('TAVG_D_COEFFICIENT',[])
+
+_optnames_aero_all = [ field for field in historyOutFields
+                       if historyOutFields[field]['TYPE'] in ('COEFFICIENT','D_COEFFICIENT') ]
+
+
 # -------------------------------------------------------------------
 #  Define Dictionary Map for Header Names
 # -------------------------------------------------------------------
 
 def get_headerMap(nZones = 1):
 
-    headerMap = dict()
-    for outputField in historyOutFields:
-        headerMap[outputField] = historyOutFields[outputField]['HEADER']
-
-    return headerMap        
+    return dict(_history_field_headers)
 
 def getTurboPerfIndex(nZones = 1):
 
@@ -288,20 +383,13 @@ per_surface_map = {"LIFT"       :   "CL" ,
 #  Include per-surface output from History File
 # ------------------------------------------------------------------- 
 def update_persurface(config, state):
-    # Update the header map (checking to make sure entries are not duplicated)
-    header_map = get_headerMap()
-    for base in per_surface_map:
-        base2 = per_surface_map[base]
-        for marker in config['MARKER_MONITORING']:
-            if not (base2+'_'+marker) in header_map:
-                header_map[base2+'_'+marker] = base2+'_'+marker
     # Update the function values in state to include the per-surface quantities
     if 'DIRECT' in state['HISTORY']:
         for base in per_surface_map:
             base2 = per_surface_map[base]
             for marker in config['MARKER_MONITORING']:
                 if (base2+'_'+marker) in state['HISTORY']['DIRECT']:
-                    state['FUNCTIONS'][base2+'_'+marker] = state['HISTORY']['DIRECT'][base2+'_'+marker][-1]
+                    state['FUNCTIONS'][base2+'_'+marker] = float( state['HISTORY']['DIRECT'][base2+'_'+marker][-1] )
                     
 # -------------------------------------------------------------------
 #  Read Aerodynamic Function Values from History File
@@ -322,28 +410,27 @@ def read_aerodynamics( History_filename , nZones = 1, special_cases=[], final_av
     
     # pull only these functions
     Func_Values = ordered_bunch()
-    for this_objfun in historyOutFields:
+    for this_objfun in _optnames_aero_all:
         if this_objfun in history_data:
-            if historyOutFields[this_objfun]['TYPE'] == 'COEFFICIENT' or historyOutFields[this_objfun]['TYPE'] == 'D_COEFFICIENT':
-                Func_Values[this_objfun] = history_data[this_objfun] 
+            Func_Values[this_objfun] = history_data[this_objfun] 
 
     if 'TIME_MARCHING' in special_cases:
         # for unsteady cases, average time-accurate objective function values
         for key, value in Func_Values.items():
             if historyOutFields[key]['TYPE'] == 'COEFFICIENT':
-                if not history_data.get('TAVG_'+ key):
+                if not 'TAVG_'+ key in history_data:
                     raise KeyError('Key ' + historyOutFields['TAVG_'+ key]['HEADER'] + ' was not found in history output.')
-                Func_Values[key] = history_data['TAVG_'+ key][-1]
+                Func_Values[key] = float( history_data['TAVG_'+ key][-1] )
             elif historyOutFields[key]['TYPE'] == 'D_COEFFICIENT':
-                if not history_data.get('TAVG_' + key):
+                if not 'TAVG_' + key in history_data:
                     raise KeyError('Key ' + historyOutFields['TAVG_' + key]['HEADER'] + ' was not found in history output.')
-                Func_Values[key] = history_data['TAVG_' + key][-1]
+                Func_Values[key] = float( history_data['TAVG_' + key][-1] )
     else:
         # in steady cases take only last value.
-        for key, value in Func_Values.iteritems():
-            if not history_data.get(key):
+        for key, value in Func_Values.items():
+            if not len(value):
                 raise KeyError('Key ' + historyOutFields[key]['HEADER'] + ' was not found in history output.')
-            Func_Values[key] = value[-1]
+            Func_Values[key] = float( value[-1] )
 
     return Func_Values
 
@@ -1001,7 +1088,10 @@ def restart2solution(config,state={}):
         optionally updates state
         direct or adjoint is read from config
         adjoint objective is read from config
+        files are moved in SU2.io.getcwd()
     """
+    
+    from .redirect import work_path
 
     # direct solution
     if config.MATH_PROBLEM == 'DIRECT':
@@ -1026,12 +1116,12 @@ def restart2solution(config,state={}):
 
         # move
         for res,sol in zip(restarts,solutions):
-            if os.path.exists(res):
-                shutil.move( res , sol )
+            if os.path.exists(work_path(res)):
+                shutil.move( work_path(res) , work_path(sol) )
         # update state
         if state: 
             state.FILES.DIRECT = solution
-            if os.path.exists('flow.meta'):
+            if os.path.exists(work_path('flow.meta')):
                 state.FILES.FLOW_META = 'flow.meta'
         
     # adjoint solution
@@ -1061,7 +1151,7 @@ def restart2solution(config,state={}):
 
         # move
         for res,sol in zip(restarts,solutions):
-            shutil.move( res , sol )
+            shutil.move( work_path(res) , work_path(sol) )
         # udpate state
         if "," in func_name:
             func_name="COMBO"
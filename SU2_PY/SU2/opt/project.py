@@ -33,7 +33,10 @@ from __future__ import print_function
 # -------------------------------------------------------------------
 
 import os, sys, shutil, copy, glob, time
+import threading
+import multiprocessing as mp
 import numpy as np
+from collections import deque
 from .. import io   as su2io
 from .. import eval as su2eval
 from .. import util as su2util
@@ -64,9 +67,13 @@ class Project(object):
              config  - base config
              state   - base state
              files   - base files
-             designs - list of designs
+             designs - list of designs, loaded from the store on access
              folder  - project working folder
              results - project design results
+             store   - append-only store of the designs
+             results_store - append-only store of the result rows,
+                             results are rebuilt from it when the
+                             project is loaded
              
         Methods:
             Optimizer Interface
@@ -89,11 +96,38 @@ class Project(object):
                                             where method is 'CONTINUOUS_ADJOINT' or 'FINDIFF'
             setup config for given dvs with 
             config = project.unpack_dvs(dvs)
+            
+            Batch Interface
+            futures = project.submit(func,dvs_list,max_cores) - evaluates designs
+                                            in parallel worker processes
+            values  = project.wait(futures) - waits for the evaluations and 
+                                            merges the designs into the project
+            
+            Warm Start
+            With WARM_START=YES, new designs restart their direct and 
+            adjoint solutions from the closest design with a direct 
+            solution, see seed_design(). The iterations saved are 
+            reported by warm_start_savings().
     """  
     
     _design_folder = 'DESIGNS/DSN_*'
     _design_number = '%03d'
     
+    store = None
+    results_store = None
+    _design_vectors = None
+    _result_rows    = None
+    _plot_keys      = None
+    _plot_offsets   = ()
+    _warm_start_counts = None
+    _warm_start_totals = None
+    
+    # design scheduler, not pickled
+    _executor = None
+    _pending  = None
+    _futures  = None
+    _merged   = None
+    
     
     def __init__( self, config, state=None , 
                   designs=None, folder='.' ,
@@ -108,6 +142,10 @@ class Project(object):
         # setup config
         config = copy.deepcopy(config)
         
+        # result cache, shared by the designs
+        if config.get('RESULT_CACHE','NONE') != 'NONE':
+            config.RESULT_CACHE = os.path.abspath(config.RESULT_CACHE)
+        
         # data_dict creation does not preserve the ordering of the config file.
         # This section ensures that the order of markers and objectives match 
         # It is only needed when more than one objective is used.
@@ -144,13 +182,14 @@ class Project(object):
         self.config  = config      # base config
         self.state   = state       # base state
         self.files   = state.FILES # base files
-        self.designs = designs     # design list
         self.folder  = folder      # project folder
         self.results = su2util.ordered_bunch() # project design results
+        self._result_rows = _new_result_rows()
 
         # output filenames
         self.filename = 'project.pkl'
-        self.results_filename = 'results.pkl'
+        self.results_filename = 'results.store'
+        self.store_filename = 'project.store'
 
         # initialize folder with files
         pull,link = state.pullnlink(config)
@@ -167,6 +206,21 @@ class Project(object):
                 for f in folders: shutil.rmtree(f)
             #: if existing designs
             
+            # start design store
+            self.store = su2io.ProjectStore(self.store_filename)
+            self.store.clear()
+            self.store.save_config(config)
+            
+            # start result store
+            self.results_store = su2io.ProjectStore(self.results_filename)
+            self.results_store.clear()
+            
+            self.designs = su2io.DesignList(self.store) # design list
+            for design in designs:
+                design.store = self.store
+                design.save()
+                self.designs.append(design)
+            
             # save project
             su2io.save_data(self.filename,self)
             
@@ -185,6 +239,9 @@ class Project(object):
         # check folder
         assert os.path.exists(folder) , 'cannot find project folder %s' % folder
 
+        # designs finished by the scheduler
+        self.merge_designs()
+
         # list project files to pull and link
         pull,link = state.pullnlink(config)
 
@@ -193,6 +250,7 @@ class Project(object):
 
             # start design
             design = self.new_design(konfig)
+            design = self._wait_design(design)
             
             if config.get('CONSOLE','VERBOSE') == 'VERBOSE':
                 print(os.path.join(self.folder,design.folder))
@@ -208,11 +266,15 @@ class Project(object):
             # check for update
             if design.state.toc(timestamp):
 
-                # recompile design results
-                self.compile_results()
+                # update design results
+                i_dsn = self.update_results(design)
+                
+                # plot results, from the updated design on
+                self.plot_results(i_dsn)
                 
-                # plot results
-                self.plot_results()
+                # report warm start
+                if design.warm_start and config.get('CONSOLE','VERBOSE') == 'VERBOSE':
+                    self._print_warm_start(design)
 
                 # save data
                 su2io.save_data(filename,self)
@@ -275,6 +337,201 @@ class Project(object):
         raise NotImplementedError
         #return self._eval(config, user_func,*args) 
     
+    def submit(self,func,dvs_list,max_cores=None):
+        """ futures = SU2.opt.Project.submit(func,dvs_list,max_cores=None)
+            starts the evaluation of a batch of design vectors
+            
+            Inputs:
+                func      - evaluation function, such as SU2.eval.obj_f
+                            or SU2.eval.con_cieq
+                dvs_list  - list of design vectors
+                max_cores - core budget, default is all cores of the node
+            
+            Outputs:
+                futures   - list of concurrent.futures.Future, one per 
+                            design vector, with the value of func
+            
+            Each design is evaluated in a worker process, in its own 
+            design folder, so the working folder of this process does 
+            not change while SU2 runs. At most max_cores/NUMBER_PART 
+            designs run at once. Designs are saved to the project store 
+            by the workers, and merged into the project by wait(), or 
+            by the next evaluation.
+            Equal design vectors in a batch share one evaluation.
+        """
+        
+        config = self.config
+        state  = self.state
+        folder = self.folder
+        
+        assert self.store is not None , 'the scheduler needs a project with a design store'
+        
+        executor = self._get_executor(max_cores)
+        
+        # list project files to pull and link
+        pull,link = state.pullnlink(config)
+        
+        futures = []
+        
+        # start designs, in the project folder
+        with redirect_folder(folder,pull,link,force=False):
+            for dvs in dvs_list:
+                
+                konfig,dvs = self.unpack_dvs(dvs)
+                design = self.new_design(konfig)
+                
+                # one evaluation per design at a time
+                if design.folder in self._pending:
+                    future = self._pending[design.folder]
+                    this_func, this_dvs = self._futures[future]
+                    if this_func is func and this_dvs == dvs:
+                        futures.append(future)
+                        continue
+                    design = self._wait_design(design)
+                
+                future = executor.submit( _eval_design, os.path.abspath('.'), 
+                                          design, func, dvs )
+                
+                self._pending[design.folder] = future
+                self._futures[future] = (func,dvs)
+                future.add_done_callback( lambda f, key=design.folder: self._merged.append((key,f)) )
+                futures.append(future)
+            
+        #: with redirect folder
+        
+        return futures
+    
+    def wait(self,futures=None):
+        """ values = SU2.opt.Project.wait(futures=None)
+            waits for submitted evaluations, by default all of them,
+            merges the finished designs into the project, and 
+            returns the values of the futures
+        """
+        
+        if futures is None:
+            futures = list((self._futures or {}).keys())
+            
+        for future in futures:
+            try:
+                future.result()
+            except Exception:
+                pass
+        
+        self.merge_designs()
+        
+        return [ future.result() for future in futures ]
+    
+    def merge_designs(self):
+        """ SU2.opt.Project.merge_designs()
+            reloads the designs finished by the scheduler from 
+            the project store, and updates the project results
+        """
+        
+        merged = self._merged
+        if not merged:
+            return
+        
+        # records appended by the workers
+        self.store.refresh()
+        
+        with redirect_folder(self.folder):
+            while merged:
+                key, future = merged.popleft()
+                
+                # already merged by _wait_design()
+                if not future in self._futures:
+                    continue
+                del self._futures[future]
+                if self._pending.get(key) is future:
+                    del self._pending[key]
+                
+                # latest version saved by the worker
+                i_dsn = self.designs.keys().index(key)
+                self.designs.unload(i_dsn)
+                
+                i_dsn = self.update_results(self.designs[i_dsn])
+                self.plot_results(i_dsn)
+                
+            su2io.save_data(self.filename,self)
+        
+        return
+    
+    def shutdown(self):
+        """ SU2.opt.Project.shutdown()
+            waits for all submitted evaluations and stops the workers
+        """
+        if self._executor is None:
+            return
+        self.wait()
+        self._executor.shutdown()
+        self._executor = None
+    
+    def _get_executor(self,max_cores=None):
+        """ starts the worker processes for the core budget """
+        
+        if max_cores is None:
+            max_cores = mp.cpu_count()
+        n_part  = max( int(self.config.get('NUMBER_PART',1)), 1 )
+        n_workers = max( max_cores // n_part, 1 )
+        
+        executor = self._executor
+        if executor is not None and self._n_workers != n_workers:
+            self.shutdown()
+            executor = None
+        
+        if executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(n_workers)
+            self._executor  = executor
+            self._n_workers = n_workers
+            self._pending  = {}
+            self._futures  = {}
+            self._merged   = deque()
+            
+        return executor
+    
+    def _wait_design(self,design):
+        """ design = SU2.opt.Project._wait_design(design)
+            waits for a submitted evaluation of a design, 
+            and returns the design reloaded from the store
+        """
+        
+        if not self._pending or not design.folder in self._pending:
+            return design
+        
+        future = self._pending[design.folder]
+        try:
+            future.result()
+        except Exception:
+            pass
+        
+        # reload the design, in the project folder
+        self._pending.pop(design.folder)
+        self._futures.pop(future)
+        self.store.refresh()
+        i_dsn = self.designs.keys().index(design.folder)
+        self.designs.unload(i_dsn)
+        design = self.designs[i_dsn]
+        self.update_results(design)
+        self.plot_results(i_dsn)
+        
+        return design
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for key in ['_executor','_n_workers','_pending','_futures','_merged']:
+            state.pop(key,None)
+        # results are rebuilt from the result store
+        if self.results_store is not None:
+            for key in ['results','_result_rows']:
+                state.pop(key,None)
+        return state
+    
+    def __setstate__(self,state):
+        self.__dict__.update(state)
+        if not 'results' in state:
+            self._load_results()
+    
     def add_design(self,config):
         #func = su2eval.touch # hack - TWL
         func = su2eval.skip 
@@ -295,6 +552,9 @@ class Project(object):
             design = closest
         # start new design
         else:
+            # restart from the closest converged design
+            if su2eval.functions.warm_start(konfig):
+                closest = self.seed_design(konfig)
             design = self.init_design(konfig,closest)
         #: if new design
         return design
@@ -311,30 +571,83 @@ class Project(object):
     def closest_design(self,config):
         """ looks for an existing or closest design 
             given a config
+            compares DV_VALUE_NEW to the rows of the design vector matrix,
+            the distance is the same as Config.dist()
         """        
                 
         designs = self.designs
         
-        keys_check = ['DV_VALUE_NEW']
-        
         if not designs: 
             return [] , inf
         
-        diffs = []
-        for this_design in designs:
-            this_config = this_design.config
-            distance = config.dist(this_config,keys_check)
-            diffs.append(distance) 
-                        
-        #: for each design 
+        diffs = self._design_distances(config)
         
         # pick closest design
-        i_min = np.argmin(diffs)
-        delta  = diffs[i_min]
+        i_min = int( np.argmin(diffs) )
+        delta  = float( diffs[i_min] )
         closest = designs[i_min]
         
         return closest, delta 
     
+    def seed_design(self,config):
+        """ seed = SU2.opt.Project.seed_design(config)
+            closest design with a direct solution, used as warm
+            start for a new design, or [] if there is none
+            designs are loaded in order of distance, until one
+            is found
+        """
+        
+        designs = self.designs
+        
+        if not designs:
+            return []
+        
+        diffs = self._design_distances(config)
+        
+        for i_dsn in np.argsort(diffs,kind='stable'):
+            if diffs[i_dsn] >= inf: break
+            design = designs[int(i_dsn)]
+            if 'DIRECT' in design.files:
+                return design
+        
+        return []
+    
+    def _design_distances(self,config):
+        """ distances of DV_VALUE_NEW of a config to all designs, inf 
+            for designs with a different number of design variables
+        """
+        
+        design_vectors = self.design_vectors()
+        this_vector = np.array( dict.get(config,'DV_VALUE_NEW'), dtype=float ).ravel()
+        
+        # distance to all designs at once
+        if this_vector.shape[0] == design_vectors.shape[1]:
+            diffs = np.sqrt( np.sum( (design_vectors-this_vector)**2, axis=1 ) )
+            diffs[np.isnan(diffs)] = inf
+        else:
+            diffs = np.full( design_vectors.shape[0], inf )
+        
+        return diffs
+    
+    def design_vectors(self):
+        """ design_vectors = SU2.opt.Project.design_vectors()
+            array of the DV_VALUE_NEW of each design, one row per design
+            
+            rows are added for new designs only, designs with a 
+            different number of design variables get a row of nan
+        """
+        
+        matrix = self._design_vectors
+        designs = self.designs
+        
+        if matrix is None or len(matrix) > len(designs):
+            matrix = self._design_vectors = _Rows(vector=True)
+        
+        for design in designs[len(matrix):]:
+            matrix.append( dict.get(design.config,'DV_VALUE_NEW') )
+        
+        return matrix.array
+    
     def init_design(self,config,closest=None):
         """ starts a new design
             works in project folder
@@ -344,11 +657,17 @@ class Project(object):
         ztate  = copy.deepcopy(self.state)
         if closest is None: closest = []
         
+        warm_start = []
+        
         # use closest design as seed
         if closest:
             # copy useful state info
             seed_folder = closest.folder
             seed_files  = closest.files
+            # solutions restarted from the seed
+            if su2eval.functions.warm_start(konfig):
+                warm_start = [ key for key in seed_files.keys() 
+                               if key == 'DIRECT' or key.startswith('ADJOINT_') ]
             for key in seed_files.keys():
                 # ignore mesh
                 if key == 'MESH': continue 
@@ -369,7 +688,7 @@ class Project(object):
         folder = folder % (len(self.designs) + 1)
 
         # start new design (pulls files to folder)
-        design = su2eval.Design(konfig,ztate,folder)
+        design = su2eval.Design(konfig,ztate,folder,self.store)
         
         # update local state filenames ( ??? why not in Design() )
         for key in design.files:
@@ -382,6 +701,10 @@ class Project(object):
             else:
                 name = os.path.split(name)[-1]
                 design.files[key] = name
+        if closest:
+            design.seed = closest.folder
+            design.warm_start = warm_start
+        design.save()
         
         # add design to project 
         self.designs.append(design)        
@@ -405,91 +728,327 @@ class Project(object):
                 results.HISTORY.DIRECT
                 results.HISTORY.ADJOINT_*
                 
+            Rebuilds the results of all designs, the project
+            updates the results of one design with update_results()
+        """
+        
+        self._result_rows = None
+        
+        results_store = self.results_store
+        if results_store is not None:
+            results_store.clear()
+        
+        self._warm_start_counts = {}
+        self._warm_start_totals = su2util.ordered_bunch()
+        
+        for i_dsn,design in enumerate(self.designs):
+            row = _result_row(design.state)
+            self._set_result_row(i_dsn,row,default)
+            if results_store is not None:
+                results_store.append( '%i' % i_dsn, (row,default) )
+            self._count_warm_start(i_dsn,design)
+        
+        return self._publish_results()
+    
+    def update_results(self,design,default=np.nan):
+        """ i_dsn = SU2.opt.Project.update_results(design,default=np.nan)
+            updates the results of one design, and returns its index
+            a new design adds one row to each result, and appends
+            the row to the result store
         """
         
+        i_dsn = self.designs.index(design)
+        rows = self._result_rows
+        
+        # results are not incremental yet
+        if rows is None:
+            self.compile_results(default)
+            return i_dsn
+        
+        row = _result_row(design.state)
+        self._set_result_row(i_dsn,row,default)
+        if self.results_store is not None:
+            self.results_store.append( '%i' % i_dsn, (row,default) )
+        self._publish_row(i_dsn)
+        
+        # projects saved without the warm start totals count all designs once
+        if self._warm_start_totals is None:
+            self._warm_start_counts = {}
+            self._warm_start_totals = su2util.ordered_bunch()
+            for j_dsn,this_design in enumerate(self.designs):
+                self._count_warm_start(j_dsn,this_design)
+        else:
+            self._count_warm_start(i_dsn,design)
+        
+        return i_dsn
+    
+    def _load_results(self):
+        """ rebuilds the results from the rows in the result store,
+            the latest row of each design is used
+        """
+        
+        self._result_rows = None
+        results_store = self.results_store
+        
+        if results_store is not None:
+            results_store.refresh()
+            for key in results_store.keys():
+                row,default = results_store.load(key)
+                self._set_result_row(int(key),row,default)
+        
+        self._publish_results()
+    
+    def _set_result_row(self,i_dsn,row,default):
+        """ sets the row of one design in the result arrays """
+        
+        rows = self._result_rows
+        if rows is None:
+            rows = self._result_rows = _new_result_rows(default)
+        
+        # check design vectors are of same length
+        this_designvector = row.VARIABLES
+        if len(rows.VARIABLES) and rows.VARIABLES.array.shape[1] != len(this_designvector):
+            warn('different dv vector length during compile_results()')
+        rows.VARIABLES[i_dsn] = this_designvector
+        
+        for key,value in row.FUNCTIONS.items():
+            if not key in rows.FUNCTIONS:
+                rows.FUNCTIONS[key] = _Rows(default)
+            rows.FUNCTIONS[key][i_dsn] = value
+        for key,value in row.GRADIENTS.items():
+            if not key in rows.GRADIENTS:
+                rows.GRADIENTS[key] = _Rows(default,vector=True)
+            rows.GRADIENTS[key][i_dsn] = value
+        for TYPE,history in row.HISTORY.items():
+            if not TYPE in rows.HISTORY:
+                rows.HISTORY[TYPE] = su2util.ordered_bunch()
+            for key,value in history.items():
+                if not key in rows.HISTORY[TYPE]:
+                    rows.HISTORY[TYPE][key] = _Rows(default)
+                rows.HISTORY[TYPE][key][i_dsn] = value
+        
+        return
+    
+    def _publish_results(self):
+        """ fills self.results with lists of the result arrays """
+        
+        rows  = self._result_rows
+        n_dsn = len(self.designs)
+        
         results = su2io.State()
-        results.VARIABLES = []
         del results.FILES
-        filename = self.results_filename
-        
-        n_dv = 0
-        
-        # populate fields
-        for i,design in enumerate(self.designs):
-            for key in design.state.FUNCTIONS.keys():
-                results.FUNCTIONS[key] = []
-            for key in design.state.GRADIENTS.keys():
-                results.GRADIENTS[key] = []
-            for TYPE in design.state.HISTORY.keys():
-                if not TYPE in results.HISTORY:
-                    results.HISTORY[TYPE] = su2util.ordered_bunch()
-                for key in design.state.HISTORY[TYPE].keys():
-                    results.HISTORY[TYPE][key] = []
-            this_ndv = len( design.state.design_vector() )
-            
-            # check design vectors are of same length
-            if i == 0:
-                n_dv = this_ndv
-            else:
-                if n_dv != this_ndv:
-                    warn('different dv vector length during compile_results()')
-        #: for each design
-            
-        # populate results
-        for design in self.designs:
-            this_designvector = design.state.design_vector()
-            results.VARIABLES.append( this_designvector )
-            for key in results.FUNCTIONS.keys():
-                if key in design.state.FUNCTIONS:
-                    new_func = design.state.FUNCTIONS[key]
-                else:
-                    new_func = default
-                results.FUNCTIONS[key].append(new_func)
-            for key in results.GRADIENTS.keys():
-                if key in design.state.GRADIENTS:
-                    new_grad = design.state.GRADIENTS[key]
-                else:
-                    new_grad = [default] * len( this_designvector )
-                results.GRADIENTS[key].append(new_grad)
-            for TYPE in results.HISTORY.keys():
-                for key in results.HISTORY[TYPE].keys():
-                    if key in results.FUNCTIONS.keys():
-                        new_func = results.FUNCTIONS[key][-1]
-                    elif ( TYPE in design.state.HISTORY.keys() and
-                            key in design.state.HISTORY[TYPE].keys() ):
-                        new_func = design.state.HISTORY[TYPE][key][-1]
+        
+        def column(this_rows):
+            this_rows.resize(n_dsn)
+            return this_rows.array.tolist()
+        
+        if rows is None:
+            results.VARIABLES = []
+        else:
+            results.VARIABLES = column(rows.VARIABLES)
+            for key,this_rows in rows.FUNCTIONS.items():
+                results.FUNCTIONS[key] = column(this_rows)
+            for key,this_rows in rows.GRADIENTS.items():
+                results.GRADIENTS[key] = column(this_rows)
+            for TYPE,history in rows.HISTORY.items():
+                results.HISTORY[TYPE] = su2util.ordered_bunch()
+                for key,this_rows in history.items():
+                    # function values take precedence over history
+                    if key in results.FUNCTIONS:
+                        results.HISTORY[TYPE][key] = results.FUNCTIONS[key]
                     else:
-                        new_func = default
-                    results.HISTORY[TYPE][key].append(new_func)
-        #: for each design
+                        results.HISTORY[TYPE][key] = column(this_rows)
         
-        # save
         self.results = results
-        su2io.save_data(filename,results)
             
         return self.results
     
+    def _publish_row(self,i_dsn):
+        """ sets the row of one design in the lists of self.results,
+            the other rows are not converted again
+        """
+        
+        rows    = self._result_rows
+        results = self.results
+        n_dsn   = len(self.designs)
+        
+        if not 'FUNCTIONS' in results:
+            return self._publish_results()
+        
+        def update(this_rows,published):
+            # new designs, and the row of this design
+            this_rows.resize(n_dsn)
+            array = this_rows.array
+            n_published = len(published)
+            for i in range(n_published,n_dsn):
+                published.append( array[i].tolist() )
+            if i_dsn < n_published:
+                published[i_dsn] = array[i_dsn].tolist()
+        
+        def column(this_rows):
+            this_rows.resize(n_dsn)
+            return this_rows.array.tolist()
+        
+        update(rows.VARIABLES,results.VARIABLES)
+        for key,this_rows in rows.FUNCTIONS.items():
+            if key in results.FUNCTIONS:
+                update(this_rows,results.FUNCTIONS[key])
+            else:
+                results.FUNCTIONS[key] = column(this_rows)
+        for key,this_rows in rows.GRADIENTS.items():
+            if key in results.GRADIENTS:
+                update(this_rows,results.GRADIENTS[key])
+            else:
+                results.GRADIENTS[key] = column(this_rows)
+        for TYPE,history in rows.HISTORY.items():
+            if not TYPE in results.HISTORY:
+                results.HISTORY[TYPE] = su2util.ordered_bunch()
+            published = results.HISTORY[TYPE]
+            for key,this_rows in history.items():
+                # function values take precedence over history
+                if key in results.FUNCTIONS:
+                    published[key] = results.FUNCTIONS[key]
+                elif key in published:
+                    update(this_rows,published[key])
+                else:
+                    published[key] = column(this_rows)
+        
+        return results
+    
+    def warm_start_savings(self):
+        """ savings = SU2.opt.Project.warm_start_savings()
+            iterations of the solutions of each design, and the 
+            iterations saved by warm starts, see WARM_START
+            
+            Outputs:
+                savings.SEED               - seed folder of each design, or None
+                savings.ITERATIONS.<TYPE>  - iterations of each design
+                savings.SAVED.<TYPE>       - iterations saved by each design
+                savings.TOTAL_SAVED.<TYPE> - iterations saved by all designs
+                
+            TYPE is DIRECT or ADJOINT_*. The iterations saved by a warm 
+            started design are relative to the mean of the designs that 
+            did not restart that solution, nan if there are none. 
+            Missing values are nan.
+        """
+        
+        designs = self.designs
+        n_dsn = len(designs)
+        
+        savings = su2util.ordered_bunch()
+        savings.SEED        = []
+        savings.ITERATIONS  = su2util.ordered_bunch()
+        savings.SAVED       = su2util.ordered_bunch()
+        savings.TOTAL_SAVED = su2util.ordered_bunch()
+        
+        for i_dsn,design in enumerate(designs):
+            savings.SEED.append(design.seed)
+            for TYPE,history in design.state.HISTORY.items():
+                if not TYPE in savings.ITERATIONS:
+                    savings.ITERATIONS[TYPE] = np.full([n_dsn],np.nan)
+                    savings.SAVED[TYPE] = np.full([n_dsn],np.nan)
+                savings.ITERATIONS[TYPE][i_dsn] = _history_length(history)
+        
+        for TYPE,iterations in savings.ITERATIONS.items():
+            warm = np.array([ TYPE in design.warm_start for design in designs ],dtype=bool)
+            cold = iterations[~warm & ~np.isnan(iterations)]
+            if len(cold):
+                reference = np.mean(cold)
+                savings.SAVED[TYPE][warm] = reference - iterations[warm]
+            saved = savings.SAVED[TYPE]
+            savings.TOTAL_SAVED[TYPE] = float( np.sum(saved[~np.isnan(saved)]) )
+            
+        return savings
+    
+    def _count_warm_start(self,i_dsn,design):
+        """ updates the running iteration totals of the cold and 
+            warm started solutions with one design, replacing its 
+            previous count, see _print_warm_start()
+        """
+        
+        counts = self._warm_start_counts
+        totals = self._warm_start_totals
+        
+        for TYPE,(warm,iterations) in counts.pop(i_dsn,{}).items():
+            totals[TYPE][warm][0] -= 1
+            totals[TYPE][warm][1] -= iterations
+        
+        this_counts = {}
+        for TYPE,history in design.state.HISTORY.items():
+            iterations = _history_length(history)
+            if np.isnan(iterations): continue
+            warm = int( TYPE in design.warm_start )
+            if not TYPE in totals:
+                # [ [cold designs, cold iterations], [warm designs, warm iterations] ]
+                totals[TYPE] = [[0,0],[0,0]]
+            totals[TYPE][warm][0] += 1
+            totals[TYPE][warm][1] += iterations
+            this_counts[TYPE] = (warm,iterations)
+        counts[i_dsn] = this_counts
+        
+        return
+    
+    def _print_warm_start(self,design):
+        """ prints the iterations of a warm started design,
+            from the running totals of the project
+        """
+        
+        i_dsn  = self.designs.index(design)
+        counts = self._warm_start_counts.get(i_dsn,{})
+        totals = self._warm_start_totals
+        
+        for TYPE in design.warm_start:
+            if not TYPE in counts: continue
+            warm,iterations = counts[TYPE]
+            (n_cold,cold),(n_warm,warmed) = totals[TYPE]
+            line = 'Warm start %s from %s: %i iterations' % (TYPE,design.seed,iterations)
+            if n_cold:
+                reference = float(cold) / n_cold
+                saved = reference - iterations
+                total_saved = n_warm * reference - warmed
+                line += ', %i saved, %i saved by the project' % (saved,total_saved)
+            print(line)
+        
+        return
+    
     def deep_compile(self):
         """ Project.deep_compile()
-            recompiles project using design files saved in each design folder
+            recompiles project using the designs saved in the project store,
+            and the design files of designs that are not in the store
             useful if designs were run outside of project class
         """
         
         project_folder = self.folder
-        designs = self.designs
+        store = self.store
         
         with su2io.redirect_folder(project_folder):
-            for i_dsn,design in enumerate(designs):
-                design_filename = os.path.join(design.folder,design.filename)
-                self.designs[i_dsn] = su2io.load_data(design_filename)
+            
+            # index scan of the store, designs are loaded on access
+            if store is not None:
+                store.refresh()
+                design_folders = [ folder for folder in self.designs.keys()
+                                   if not folder in store ]
+                self.designs = su2io.DesignList(store,store.design_keys())
+            else:
+                design_folders = [ design.folder for design in self.designs ]
+                self.designs = []
+            self._design_vectors = None
+            
+            # designs that are not in the store
+            for folder in design_folders:
+                design_filename = os.path.join(folder,'design.pkl')
+                self.designs.append( su2io.load_data(design_filename) )
             
             self.compile_results()
             su2io.save_data(self.filename,self)
             
         return
     
-    def plot_results(self):
+    def plot_results(self,first_row=0):
         """ writes a tecplot file for plotting design results
+            rows before first_row are kept, if the file was written 
+            by this project with the same variables, and the 
+            following rows are appended
         """
         output_format = self.config.TABULAR_FORMAT
         functions     = self.results.FUNCTIONS
@@ -501,9 +1060,38 @@ class Project(object):
         results_plot.update(history.get('DIRECT',{}))
         
         if (output_format == 'CSV'):
-          su2util.write_plot('history_project.csv',output_format,results_plot)
+          plot_filename = 'history_project.csv'
         else:
-          su2util.write_plot('history_project.dat',output_format,results_plot)
+          plot_filename = 'history_project.dat'
+        
+        # file sizes after the header and after each row
+        keys    = list(results_plot.keys())
+        offsets = list(self._plot_offsets)
+        
+        # write the header
+        if not ( keys == self._plot_keys and first_row < len(offsets)     and 
+                 os.path.exists(plot_filename)                             and
+                 os.path.getsize(plot_filename) == offsets[-1]                 ):
+            header = su2util.ordered_bunch( [ (key,[]) for key in keys ] )
+            su2util.write_plot(plot_filename,output_format,header)
+            offsets = [ os.path.getsize(plot_filename) ]
+            first_row = 0
+        
+        # drop rows from first_row on
+        del offsets[first_row+1:]
+        with open(plot_filename,'r+') as plot_file:
+            plot_file.truncate(offsets[-1])
+        
+        # append rows
+        for i_row in range(first_row,len(self.designs)):
+            row_plot = su2util.ordered_bunch()
+            for key in keys:
+                row_plot[key] = [ results_plot[key][i_row] ]
+            su2util.write_plot(plot_filename,output_format,row_plot,append=True)
+            offsets.append( os.path.getsize(plot_filename) )
+        
+        self._plot_keys    = keys
+        self._plot_offsets = offsets
         
     def save(self):
         with su2io.redirect_folder(self.folder):
@@ -514,3 +1102,111 @@ class Project(object):
     def __str__(self):
         output = self.__repr__()
         return output    
+    
+#: class Project
+
+
+# -------------------------------------------------------------------
+#  Design Worker
+# -------------------------------------------------------------------
+
+def _eval_design(project_folder,design,func,dvs):
+    """ evaluates a design in a worker process of Project.submit() 
+        the design is saved to the project store
+    """
+    with redirect_folder(project_folder):
+        return design._eval(func,dvs)
+
+
+
+def _history_length(history):
+    """ number of iterations in a solution history bunch """
+    for values in history.values():
+        return len(values)
+    return np.nan
+
+def _result_row(state):
+    """ row of the project results for the state of a design,
+        the last value of each history
+    """
+    row = su2util.ordered_bunch()
+    row.VARIABLES = state.design_vector()
+    row.FUNCTIONS = su2util.ordered_bunch( state.FUNCTIONS.items() )
+    row.GRADIENTS = su2util.ordered_bunch( state.GRADIENTS.items() )
+    row.HISTORY   = su2util.ordered_bunch()
+    for TYPE,history in state.HISTORY.items():
+        row.HISTORY[TYPE] = su2util.ordered_bunch()
+        for key,value in history.items():
+            row.HISTORY[TYPE][key] = value[-1]
+    return row
+
+def _new_result_rows(default=np.nan):
+    """ empty result arrays of a project """
+    rows = su2util.ordered_bunch()
+    rows.VARIABLES = _Rows(default,vector=True)
+    rows.FUNCTIONS = su2util.ordered_bunch()
+    rows.GRADIENTS = su2util.ordered_bunch()
+    rows.HISTORY   = su2util.ordered_bunch()
+    return rows
+
+
+# -------------------------------------------------------------------
+#  Result Rows Class
+# -------------------------------------------------------------------
+
+class _Rows(object):
+    """ rows of an array that grows as rows are set
+        the capacity is doubled when it is full, so adding a 
+        row does not copy the array
+        
+        rows are floats, or vectors if vector is True, in which
+        case the number of columns is set by the first row.
+        missing rows, and vectors of a different length, are 
+        filled with the default value.
+    """
+    
+    def __init__(self,default=np.nan,vector=False):
+        self.default = default
+        self.vector  = vector
+        self._data   = None
+        self.n_rows  = 0
+        
+    def __len__(self):
+        return self.n_rows
+    
+    @property
+    def array(self):
+        if self._data is None:
+            return np.zeros([0,0] if self.vector else [0])
+        return self._data[:self.n_rows]
+    
+    def __setitem__(self,index,value):
+        value = np.array( value, dtype=float )
+        if self.vector:
+            value = value.ravel()
+            
+        if self._data is None:
+            shape = [8] + list(value.shape)
+            self._data = np.full( shape, self.default, dtype=float )
+        if self.vector and value.shape[0] != self._data.shape[1]:
+            value = self.default
+        
+        self.resize(index+1)
+        self._data[index] = value
+        
+    def append(self,value):
+        self[self.n_rows] = value
+        
+    def resize(self,n_rows):
+        """ adds default rows up to n_rows """
+        if self._data is None or n_rows <= self.n_rows:
+            return
+        capacity = self._data.shape[0]
+        if n_rows > capacity:
+            while n_rows > capacity: capacity *= 2
+            data = np.full( [capacity] + list(self._data.shape[1:]), self.default, dtype=float )
+            data[:self.n_rows] = self._data[:self.n_rows]
+            self._data = data
+        self.n_rows = n_rows
+        
+#: class _Rows
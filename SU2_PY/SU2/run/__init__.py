@@ -3,6 +3,7 @@
 from .interface import (
     build_command     ,
     run_command       ,
+    run_command_async ,
     CFD               ,
     MSH               ,
     DEF               ,
@@ -10,6 +11,8 @@ from .interface import (
     SOL               ,
     SOL_FSI)
 
+from .progress   import Progress, active_runs, watch
+from .session    import Session, run_session, session_supported, close_sessions
 from .direct     import direct
 from .adjoint    import adjoint
 from .projection import projection
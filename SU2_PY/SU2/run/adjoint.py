@@ -29,7 +29,7 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import copy
+import os, copy
 
 from .. import io  as su2io
 from .merge     import merge     as su2merge
@@ -39,8 +39,8 @@ from .interface import CFD       as SU2_CFD
 #  Adjoint Simulation
 # ----------------------------------------------------------------------
 
-def adjoint( config ): 
-    """ info = SU2.run.adjoint(config)
+def adjoint( config, cwd=None ): 
+    """ info = SU2.run.adjoint(config,cwd=None)
         
         Runs an adjoint analysis with:
             SU2.run.decomp()
@@ -61,11 +61,12 @@ def adjoint( config ):
             config.MATH_PROBLEM
             
         Executes in:
-            ./
+            cwd, default SU2.io.getcwd()
     """
     
     # local copy
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = su2io.getcwd()
     
     # setup problem    
     if konfig.get('GRADIENT_METHOD', 'CONTINUOUS_ADJOINT') == 'DISCRETE_ADJOINT':
@@ -76,11 +77,11 @@ def adjoint( config ):
     konfig['CONV_FILENAME'] = konfig['CONV_FILENAME'] + '_adjoint'
 
     # Run Solution
-    SU2_CFD(konfig)
+    SU2_CFD(konfig,cwd)
     
     # merge
     konfig['SOLUTION_ADJ_FILENAME'] = konfig['RESTART_ADJ_FILENAME'] 
-    su2merge(konfig)
+    su2merge(konfig,cwd)
     
     # filenames
     plot_format      = konfig.get('TABULAR_FORMAT', 'CSV')
@@ -89,7 +90,7 @@ def adjoint( config ):
     special_cases    = su2io.get_specialCases(konfig)
     
     # get history
-    history = su2io.read_history( history_filename, config.NZONES )
+    history = su2io.read_history( os.path.join(cwd,history_filename), config.NZONES )
     
     # update super config
     config.update({ 'MATH_PROBLEM' : konfig['MATH_PROBLEM'] ,
@@ -39,8 +39,8 @@ from .interface import DEF as SU2_DEF
 #  Mesh Deformation
 # ----------------------------------------------------------------------
 
-def deform ( config, dv_new=None, dv_old=None ):
-    """ info = SU2.run.deform(config,dv_new=[],dv_old=[])
+def deform ( config, dv_new=None, dv_old=None, cwd=None ):
+    """ info = SU2.run.deform(config,dv_new=[],dv_old=[],cwd=None)
         
         Deforms mesh with:
             SU2.run.decomp()
@@ -61,7 +61,7 @@ def deform ( config, dv_new=None, dv_old=None ):
             config.DV_VALUE_OLD = config.DV_VALUE_NEW
             
         Executes in:
-            ./
+            cwd, default SU2.io.getcwd()
     """    
     
     if dv_new is None: dv_new = []
@@ -90,7 +90,7 @@ def deform ( config, dv_new=None, dv_old=None ):
     konfig['MESH_OUT_FILENAME'] = meshname_suffixed
     
     # Run Deformation
-    SU2_DEF(konfig)
+    SU2_DEF(konfig,cwd)
     
     # update super config
     config.update({ 'MESH_FILENAME' : konfig['MESH_OUT_FILENAME'] , 
@@ -29,7 +29,7 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import copy
+import os, copy
 
 from .. import io  as su2io
 from .merge     import merge     as su2merge
@@ -39,8 +39,8 @@ from .interface import CFD       as SU2_CFD
 #  Direct Simulation
 # ----------------------------------------------------------------------
 
-def direct ( config ): 
-    """ info = SU2.run.direct(config)
+def direct ( config, cwd=None ): 
+    """ info = SU2.run.direct(config,cwd=None)
         
         Runs an adjoint analysis with:
             SU2.run.decomp()
@@ -61,11 +61,12 @@ def direct ( config ):
             config.MATH_PROBLEM
             
         Executes in:
-            ./
+            cwd, default SU2.io.getcwd()
     """
     
     # local copy
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = su2io.getcwd()
 
     # setup direct problem
     konfig['MATH_PROBLEM']  = 'DIRECT'
@@ -74,7 +75,7 @@ def direct ( config ):
     direct_diff = konfig.get('DIRECT_DIFF','NO') == "YES"
 
     # Run Solution
-    SU2_CFD(konfig)
+    SU2_CFD(konfig,cwd)
 
     # multizone cases
     multizone_cases = su2io.get_multizone(konfig)
@@ -104,6 +105,7 @@ def direct ( config ):
     wnd_fct = config.get('WINDOW_FUNCTION', 'SQUARE')
 
     # get history and objectives
+    history_filename = os.path.join(cwd,history_filename)
     history      = su2io.read_history( history_filename , config.NZONES)
     aerodynamics = su2io.read_aerodynamics( history_filename , config.NZONES, special_cases, final_avg, wnd_fct )
     
@@ -133,6 +135,6 @@ def direct ( config ):
         info['WND_CAUCHY_DATA'] = {'TIME_ITER': konfig['TIME_ITER'], 'UNST_ADJOINT_ITER': konfig['UNST_ADJOINT_ITER'],
                                    'ITER_AVERAGE_OBJ': konfig['ITER_AVERAGE_OBJ']}
 
-    su2merge(konfig)
+    su2merge(konfig,cwd)
 
     return info
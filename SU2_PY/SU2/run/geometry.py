@@ -29,7 +29,7 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-import copy
+import os, copy
 
 from .. import io  as su2io
 from .interface import GEO       as SU2_GEO
@@ -39,8 +39,8 @@ from ..util import ordered_bunch
 #  Direct Simulation
 # ----------------------------------------------------------------------
 
-def geometry ( config , step = 1e-3 ): 
-    """ info = SU2.run.geometry(config)
+def geometry ( config , step = 1e-3, cwd=None ): 
+    """ info = SU2.run.geometry(config,step=1e-3,cwd=None)
         
         Runs an geometry analysis with:
             SU2.run.decomp()
@@ -61,11 +61,12 @@ def geometry ( config , step = 1e-3 ):
         Updates:
         
         Executes in:
-            ./
+            cwd, default SU2.io.getcwd()
     """
     
     # local copy
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = su2io.getcwd()
     
     # unpack
     function_name = konfig['GEO_PARAM']
@@ -93,21 +94,21 @@ def geometry ( config , step = 1e-3 ):
     konfig.unpack_dvs(dv_new,dv_old)    
     
     # Run Solution
-    SU2_GEO(konfig)
+    SU2_GEO(konfig,cwd)
     
     # info out
     info = su2io.State()    
     
     # get function values
     if konfig.GEO_MODE == 'FUNCTION':
-        functions = su2io.tools.read_plot(func_filename)
+        functions = su2io.tools.read_plot(os.path.join(cwd,func_filename))
         for key,value in functions.items():
-            functions[key] = value[0]
+            functions[key] = float( value[0] )
         info.FUNCTIONS.update( functions )
     
     # get gradient_values
     if konfig.GEO_MODE == 'GRADIENT':
-        gradients = su2io.tools.read_plot(grad_filename)
+        gradients = su2io.tools.read_plot(os.path.join(cwd,grad_filename))
         info.GRADIENTS.update( gradients )
 
     return info
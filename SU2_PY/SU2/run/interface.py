@@ -31,8 +31,12 @@
 
 import os, sys, shutil, copy
 import subprocess
-from ..io import Config
+from collections import deque
+from ..io import Config, getcwd, output_streams
 from ..util import which
+from .progress import Progress, _notify
+from .progress import _start as progress_start, _finish as progress_finish
+from .session  import run_session, session_supported
 
 # ------------------------------------------------------------
 #  Setup
@@ -68,16 +72,31 @@ return_code_map = {
     1 : EvaluationFailure ,
     2 : DivergenceFailure ,
 }
+
+# lines of stderr in error messages, longest line of output, 
+# and seconds to wait for a killed process
+_stderr_lines = 200
+_line_limit   = 2**24
+_kill_delay   = 5.0
     
 # ------------------------------------------------------------
 #  SU2 Suite Interface Functions
 # ------------------------------------------------------------
 
-def CFD(config):
+def CFD(config, cwd=None):
     """ run SU2_CFD
         partitions set by config.NUMBER_PART
+        runs in cwd, default SU2.io.getcwd()
+        with CFD_BACKEND= PYSU2, steady single zone problems run in
+        a session of the python process, see SU2.run.Session
     """
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = getcwd()
+    
+    # in the python process, see SU2.run.Session
+    if konfig.get('CFD_BACKEND','SUBPROCESS') == 'PYSU2' and session_supported(konfig):
+        run_session(konfig,cwd)
+        return
     
     direct_diff = not konfig.get('DIRECT_DIFF',"") in ["NONE", ""]
 
@@ -86,7 +105,7 @@ def CFD(config):
     if direct_diff:
         tempname = 'config_CFD_DIRECTDIFF.cfg'
 
-        konfig.dump(tempname)
+        konfig.dump(os.path.join(cwd,tempname))
 
         processes = konfig['NUMBER_PART']
 
@@ -94,7 +113,7 @@ def CFD(config):
 
     elif auto_diff:
         tempname = 'config_CFD_AD.cfg'
-        konfig.dump(tempname)
+        konfig.dump(os.path.join(cwd,tempname))
 
         processes = konfig['NUMBER_PART']
 
@@ -102,28 +121,30 @@ def CFD(config):
 
     else:
         tempname = 'config_CFD.cfg'
-        konfig.dump(tempname)
+        konfig.dump(os.path.join(cwd,tempname))
     
         processes = konfig['NUMBER_PART']
     
         the_Command = 'SU2_CFD%s %s' % (quote, tempname)
 
     the_Command = build_command( the_Command, processes )
-    run_command( the_Command )
+    run_command( the_Command, cwd, timeout=konfig.get('SOLVER_TIMEOUT',0) )
     
     #os.remove(tempname)
     
     return
 
-def MSH(config):
+def MSH(config, cwd=None):
     """ run SU2_MSH
         partitions set by config.NUMBER_PART
+        runs in cwd, default SU2.io.getcwd()
         currently forced to run serially
     """    
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = getcwd()
     
     tempname = 'config_MSH.cfg'
-    konfig.dump(tempname)
+    konfig.dump(os.path.join(cwd,tempname))
     
     # must run with rank 1
     processes = konfig['NUMBER_PART']
@@ -131,45 +152,49 @@ def MSH(config):
     
     the_Command = 'SU2_MSH%s %s' % (quote, tempname)
     the_Command = build_command( the_Command , processes )
-    run_command( the_Command )
+    run_command( the_Command, cwd, timeout=konfig.get('SOLVER_TIMEOUT',0) )
     
     #os.remove(tempname)
     
     return
 
-def DEF(config):
+def DEF(config, cwd=None):
     """ run SU2_DEF
         partitions set by config.NUMBER_PART
+        runs in cwd, default SU2.io.getcwd()
         forced to run in serial, expects merged mesh input
     """
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = getcwd()
     
     tempname = 'config_DEF.cfg'
-    konfig.dump(tempname) 
+    konfig.dump(os.path.join(cwd,tempname))
     
     # must run with rank 1
     processes = konfig['NUMBER_PART']
     
     the_Command = 'SU2_DEF%s %s' % (quote, tempname)
     the_Command = build_command( the_Command, processes )
-    run_command( the_Command )
+    run_command( the_Command, cwd, timeout=konfig.get('SOLVER_TIMEOUT',0) )
     
     #os.remove(tempname)
     
     return
 
-def DOT(config):
+def DOT(config, cwd=None):
     """ run SU2_DOT
         partitions set by config.NUMBER_PART
+        runs in cwd, default SU2.io.getcwd()
     """    
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = getcwd()
 
     auto_diff = konfig.MATH_PROBLEM == 'DISCRETE_ADJOINT' or konfig.get('AUTO_DIFF','NO') == 'YES'
 
     if auto_diff:
 
         tempname = 'config_DOT_AD.cfg'
-        konfig.dump(tempname)
+        konfig.dump(os.path.join(cwd,tempname))
 
         processes = konfig['NUMBER_PART']
 
@@ -177,77 +202,83 @@ def DOT(config):
     else:
     
         tempname = 'config_DOT.cfg'
-        konfig.dump(tempname)
+        konfig.dump(os.path.join(cwd,tempname))
     
         processes = konfig['NUMBER_PART']
     
         the_Command = 'SU2_DOT%s %s' % (quote, tempname)
 
     the_Command = build_command( the_Command, processes )
-    run_command( the_Command )
+    run_command( the_Command, cwd, timeout=konfig.get('SOLVER_TIMEOUT',0) )
     
     #os.remove(tempname)
     
     return
 
-def GEO(config):
+def GEO(config, cwd=None):
     """ run SU2_GEO
         partitions set by config.NUMBER_PART
+        runs in cwd, default SU2.io.getcwd()
         forced to run in serial
     """    
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = getcwd()
     
     tempname = 'config_GEO.cfg'
-    konfig.dump(tempname)   
+    konfig.dump(os.path.join(cwd,tempname))
     
     # must run with rank 1
     processes = konfig['NUMBER_PART']
         
     the_Command = 'SU2_GEO%s %s' % (quote, tempname)
     the_Command = build_command( the_Command , processes )
-    run_command( the_Command )
+    run_command( the_Command, cwd, timeout=konfig.get('SOLVER_TIMEOUT',0) )
     
     #os.remove(tempname)
     
     return
         
-def SOL(config):
+def SOL(config, cwd=None):
     """ run SU2_SOL
       partitions set by config.NUMBER_PART
+      runs in cwd, default SU2.io.getcwd()
     """
   
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = getcwd()
     
     tempname = 'config_SOL.cfg'
-    konfig.dump(tempname)
+    konfig.dump(os.path.join(cwd,tempname))
   
     # must run with rank 1
     processes = konfig['NUMBER_PART']
     
     the_Command = 'SU2_SOL%s %s' % (quote, tempname)
     the_Command = build_command( the_Command , processes )
-    run_command( the_Command )
+    run_command( the_Command, cwd, timeout=konfig.get('SOLVER_TIMEOUT',0) )
     
     #os.remove(tempname)
     
     return
 
-def SOL_FSI(config):
+def SOL_FSI(config, cwd=None):
     """ run SU2_SOL for FSI problems
       partitions set by config.NUMBER_PART
+      runs in cwd, default SU2.io.getcwd()
     """
   
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = getcwd()
     
     tempname = 'config_SOL.cfg'
-    konfig.dump(tempname)
+    konfig.dump(os.path.join(cwd,tempname))
   
     # must run with rank 1
     processes = konfig['NUMBER_PART']
     
     the_Command = 'SU2_SOL%s %s 2' % (quote, tempname)
     the_Command = build_command( the_Command , processes )
-    run_command( the_Command )
+    run_command( the_Command, cwd, timeout=konfig.get('SOLVER_TIMEOUT',0) )
     
     #os.remove(tempname)
     
@@ -267,31 +298,148 @@ def build_command( the_Command , processes=0 ):
         the_Command = mpi_Command % (processes,the_Command)
     return the_Command
 
-def run_command( Command ):
+def run_command( Command, cwd=None, stdout=None, callback=None, timeout=None ):
     """ runs os command with subprocess
         checks for errors from command
+        
+        runs in cwd, default SU2.io.getcwd(), the process working 
+        folder is not changed. output goes to stdout, a filename or 
+        a file stream, default the output stream of this thread, 
+        see SU2.io.redirect_output()
+        
+        stdout and stderr are streamed line by line, see 
+        run_command_async(), which also takes callback and timeout
     """
     
-    sys.stdout.flush()
+    if cwd is None: cwd = getcwd()
+    if stdout is None: stdout = output_streams()[0]
     
-    proc = subprocess.Popen( Command, shell=True    ,
-                             stdout=sys.stdout      , 
-                             stderr=subprocess.PIPE  )
-    return_code = proc.wait()
-    message = proc.stderr.read().decode()
+    return _run_sync( run_command_async(Command,cwd,stdout,callback,timeout) )
+
+async def run_command_async( Command, cwd=None, stdout=None, callback=None, timeout=None ):
+    """ return_code = await SU2.run.run_command_async(Command,cwd=None,stdout=None,
+                                                      callback=None,timeout=None)
+        runs os command with asyncio, checks for errors from command,
+        many commands can run at once from one event loop
+        
+        Inputs:
+            Command  - shell command
+            cwd      - working folder, default SU2.io.getcwd()
+            stdout   - output, a filename or a file stream, default 
+                       the output stream of this thread
+            callback - callback(progress,stream,line) for each line 
+                       of output, see SU2.run.watch()
+            timeout  - seconds, the process is killed after timeout,
+                       None or 0 for no timeout
+        
+        stdout and stderr are read line by line as the process writes 
+        them, and written to stdout, so a full pipe can not stop the 
+        process. The last lines of stderr are part of the error message.
+        The progress of the process is in SU2.run.active_runs() while 
+        it runs. The process is killed when the task is cancelled.
+    """
+    
+    import asyncio
+    
+    if cwd is None: cwd = getcwd()
+    
+    new_stdout = isinstance(stdout,str)
+    if new_stdout:
+        stdout = open(os.path.join(cwd,stdout),'a')
+    elif stdout is None:
+        stdout = output_streams()[0]
+    
+    stdout.flush()
+    
+    progress = Progress(Command,cwd)
+    stderr_tail = deque(maxlen=_stderr_lines)
+    
+    async def follow(stream,name):
+        while True:
+            line = await stream.readline()
+            if not line: break
+            line = line.decode(errors='replace')
+            if name == 'stdout':
+                progress.parse(line)
+            else:
+                progress.n_lines += 1
+                stderr_tail.append(line)
+            stdout.write(line)
+            stdout.flush()
+            if callback is not None:
+                callback(progress,name,line)
+            _notify(progress,name,line)
+    
+    progress_start(progress)
+    try:
+        proc = await asyncio.create_subprocess_shell( Command, cwd=cwd           ,
+                                                      stdout=subprocess.PIPE     ,
+                                                      stderr=subprocess.PIPE     ,
+                                                      limit=_line_limit          ,
+                                                      start_new_session=(os.name == 'posix') )
+        try:
+            await asyncio.wait_for( asyncio.gather( follow(proc.stdout,'stdout') ,
+                                                    follow(proc.stderr,'stderr') ,
+                                                    proc.wait()                  ) ,
+                                    timeout or None )
+        except asyncio.TimeoutError:
+            await _kill(proc)
+            message = "Path = %s\nCommand = %s\nSU2 process timed out after %g s\n%s" % (cwd,Command,timeout,''.join(stderr_tail))
+            raise EvaluationFailure(message)
+        except BaseException:
+            # cancelled, or interrupted
+            await _kill(proc)
+            raise
+        return_code = proc.returncode
+    finally:
+        progress.done = True
+        progress_finish(progress)
+        if new_stdout: stdout.close()
+    
+    progress.return_code = return_code
+    message = ''.join(stderr_tail)
     
     if return_code < 0:
         message = "SU2 process was terminated by signal '%s'\n%s" % (-return_code,message)
         raise SystemExit(message)
     elif return_code > 0:
-        message = "Path = %s\nCommand = %s\nSU2 process returned error '%s'\n%s" % (os.path.abspath(','),Command,return_code,message)
+        message = "Path = %s\nCommand = %s\nSU2 process returned error '%s'\n%s" % (cwd,Command,return_code,message)
         if return_code in return_code_map.keys():
             exception = return_code_map[return_code]
         else:
             exception = RuntimeError
         raise exception(message)
-    else:
-        sys.stdout.write(message)
             
     return return_code
 
+async def _kill( proc ):
+    """ stops a process and its children, SIGTERM then SIGKILL """
+    import asyncio, signal
+    if proc.returncode is not None:
+        return
+    for sig in [signal.SIGTERM, getattr(signal,'SIGKILL',signal.SIGTERM)]:
+        try:
+            if os.name == 'posix':
+                os.killpg(proc.pid,sig)
+            else:
+                proc.send_signal(sig)
+        except (OSError,ProcessLookupError):
+            pass
+        try:
+            await asyncio.wait_for(proc.wait(),_kill_delay)
+            return
+        except asyncio.TimeoutError:
+            pass
+
+def _run_sync( coroutine ):
+    """ runs a coroutine to its end, in a new event loop of this thread,
+        or of a helper thread if an event loop is running in this thread
+    """
+    import asyncio
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run,coroutine).result()
@@ -36,8 +36,8 @@ from .interface import SOL_FSI as SU2_SOL_FSI
 #  Merge Mesh
 # ----------------------------------------------------------------------
 
-def merge( config ):
-    """ info = SU2.run.merge(config)
+def merge( config, cwd=None ):
+    """ info = SU2.run.merge(config,cwd=None)
         
         Merges mesh with:
             SU2.run.SOL()    (volume merging)
@@ -54,7 +54,7 @@ def merge( config ):
             info - an empty SU2 State
             
         Executes in:
-            ./
+            cwd, default SU2.io.getcwd()
     """
     
     # local copy
@@ -73,12 +73,12 @@ def merge( config ):
     
     # # MERGING # #
     if 'FLUID_STRUCTURE_INTERACTION' in multizone_cases:
-        merge_multizone(konfig)
+        merge_multizone(konfig,cwd=cwd)
     else:
         if 'WRT_UNSTEADY' in special_cases:
-            merge_unsteady(konfig)
+            merge_unsteady(konfig,cwd=cwd)
         else:
-            merge_solution(konfig)
+            merge_solution(konfig,cwd)
         
     # info out (empty)
     info = su2io.State()
@@ -87,35 +87,35 @@ def merge( config ):
 
 #: merge
 
-def merge_unsteady( config, begintime=0, endtime=None ):
+def merge_unsteady( config, begintime=0, endtime=None, cwd=None ):
     
     if not endtime:
         endtime = config.EXT_ITER
     
     # SU2_SOL handles unsteady volume merge
-    merge_solution( config )
+    merge_solution( config, cwd )
 
     return
 
 #: def merge_unsteady()
 
-def merge_solution( config ):
-    """ SU2.io.merge.merge_solution(config)
+def merge_solution( config, cwd=None ):
+    """ SU2.io.merge.merge_solution(config,cwd=None)
         general volume surface merging with SU2_SOL
     """
     
-    SU2_SOL( config )
+    SU2_SOL( config, cwd )
     
     return
 
 #: merge_solution( config )
 
-def merge_multizone( config, begintime=0, endtime=None ):
+def merge_multizone( config, begintime=0, endtime=None, cwd=None ):
 
     if not endtime:
         endtime = config.TIME_ITER
     
-    SU2_SOL_FSI( config )
+    SU2_SOL_FSI( config, cwd )
     
     return
 
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+
+## \file progress.py
+#  \brief python package for the progress of running SU2 processes
+#  \author T. Lukaczyk, F. Palacios
+#  \version 7.0.6 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import time, threading
+from ..util import ordered_bunch
+
+# running processes, and callbacks of all processes
+_runs      = []
+_callbacks = []
+_lock      = threading.Lock()
+
+
+# ----------------------------------------------------------------------
+#  Progress Class
+# ----------------------------------------------------------------------
+
+class Progress(object):
+    """ progress = SU2.run.Progress(command,cwd)
+
+        live progress of an SU2 process started by run_command(),
+        parsed from the convergence table of its screen output:
+
+        |  Inner_Iter|   rms[Rho]|  rms[RhoU]|  rms[RhoE]|
+        |           0|  -2.304214|  -2.813142|  -2.019406|
+
+        Attributes:
+            command     - command line of the process
+            cwd         - working folder of the process
+            start_time  - time the process was started
+            iteration   - first iteration column of the last table
+                          row, the outer loop, None before the first row
+            values      - ordered bunch of the last table row, by title
+            residuals   - rms[*], max[*] and bgs[*] columns of values
+            n_lines     - number of output lines, stdout and stderr
+            done        - True once the process has exited
+            return_code - return code, None while running
+
+        Methods:
+            elapsed()   - seconds since the start of the process
+            parse(line) - updates the progress with a line of output
+    """
+
+    def __init__(self, command, cwd):
+        self.command     = command
+        self.cwd         = cwd
+        self.start_time  = time.time()
+        self.iteration   = None
+        self.values      = ordered_bunch()
+        self.residuals   = ordered_bunch()
+        self.n_lines     = 0
+        self.done        = False
+        self.return_code = None
+        self._titles     = None
+
+    def elapsed(self):
+        return time.time() - self.start_time
+
+    def parse(self, line):
+        """ updated = progress.parse(line)
+            True if line was a row of the convergence table
+        """
+
+        self.n_lines += 1
+
+        line = line.strip()
+        if len(line) < 2 or line[0] != '|' or line[-1] != '|':
+            return False
+        cells = [ cell.strip() for cell in line[1:-1].split('|') ]
+
+        # table row
+        try:
+            row = [ float(cell) for cell in cells ]
+        except ValueError:
+            # table header
+            if any( 'Iter' in cell for cell in cells ):
+                self._titles = cells
+            return False
+
+        titles = self._titles
+        if titles is None or len(titles) != len(row):
+            return False
+
+        values = ordered_bunch( zip(titles,row) )
+        self.values    = values
+        self.residuals = ordered_bunch( (title,value) for title,value in values.items()
+                                        if title[:4] in ('rms[','max[','bgs[') )
+        for title in titles:
+            if 'Iter' in title:
+                self.iteration = int(values[title])
+                break
+
+        return True
+
+    def __repr__(self):
+        return '<Progress> %s, iteration %s' % (self.cwd,self.iteration)
+
+#: class Progress
+
+
+# ----------------------------------------------------------------------
+#  Progress Registry
+# ----------------------------------------------------------------------
+
+def active_runs():
+    """ progress_list = SU2.run.active_runs()
+        Progress of the SU2 processes that are running, in all threads
+    """
+    with _lock:
+        return list(_runs)
+
+class watch(object):
+    """ with SU2.run.watch(callback):
+
+        calls callback(progress,stream,line) for each line of output
+        of the SU2 processes started in all threads, while in the
+        with block. stream is 'stdout' or 'stderr'.
+
+        Example:
+            def report(progress,stream,line):
+                if progress.iteration is not None:
+                    print(progress.cwd,progress.iteration,progress.residuals)
+            with SU2.run.watch(report):
+                SU2.eval.func('DRAG',config)
+
+        Callbacks run in the thread of the process, they should
+        return quickly.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+
+    def __enter__(self):
+        with _lock:
+            _callbacks.append(self.callback)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with _lock:
+            _callbacks.remove(self.callback)
+
+#: class watch()
+
+def _start(progress):
+    with _lock:
+        _runs.append(progress)
+
+def _finish(progress):
+    with _lock:
+        if progress in _runs: _runs.remove(progress)
+
+def _notify(progress, stream, line):
+    with _lock:
+        callbacks = list(_callbacks)
+    for callback in callbacks:
+        callback(progress,stream,line)
@@ -40,8 +40,8 @@ from .interface import DOT as SU2_DOT
 #  Gradient Projection
 # ----------------------------------------------------------------------
 
-def projection( config, state={}, step = 1e-3 ):
-    """ info = SU2.run.projection(config,state,step=1e-3)
+def projection( config, state={}, step = 1e-3, cwd=None ):
+    """ info = SU2.run.projection(config,state,step=1e-3,cwd=None)
         
         Runs an gradient projection with:
             SU2.run.decomp()
@@ -65,10 +65,11 @@ def projection( config, state={}, step = 1e-3 ):
             config.MATH_PROBLEM
             
         Executes in:
-            ./
+            cwd, default SU2.io.getcwd()
     """
     # local copy
     konfig = copy.deepcopy(config)
+    if cwd is None: cwd = su2io.getcwd()
             
     # choose dv values 
     Definition_DV = konfig['DEFINITION_DV']
@@ -90,9 +91,10 @@ def projection( config, state={}, step = 1e-3 ):
     grad_plotname  = os.path.splitext(grad_filename)[0] + '_' + adj_suffix + plot_extension    
 
     # Run Projection
-    SU2_DOT(konfig)
+    SU2_DOT(konfig,cwd)
     
     # read raw gradients
+    grad_filename = os.path.join(cwd,grad_filename)
     raw_gradients = su2io.read_gradients(grad_filename)
     os.remove(grad_filename)
     
@@ -103,7 +105,7 @@ def projection( config, state={}, step = 1e-3 ):
     data_plot['VARIABLE']     = range(len(raw_gradients)) 
     data_plot['GRADIENT']     = raw_gradients             
     data_plot['FINDIFF_STEP'] = step
-    su2util.write_plot(grad_plotname,output_format,data_plot)
+    su2util.write_plot(os.path.join(cwd,grad_plotname),output_format,data_plot)
 
     # gradient output dictionary
     objective = objective.split(',')
@@ -0,0 +1,391 @@
+#!/usr/bin/env python
+
+## \file session.py
+#  \brief python package for SU2_CFD runs kept alive in the python process
+#  \author T. Lukaczyk, F. Palacios
+#  \version 7.0.6 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os, copy, time, atexit, threading
+from collections import OrderedDict
+from ..io import getcwd, output_streams
+
+# the wrapped solvers are optional, and imported by the first session,
+# the wrappers initialize MPI in the python process
+_wrappers = {}
+
+# sessions by key, the solver keeps global state, so one session
+# runs at a time, in any thread
+_sessions = OrderedDict()
+_lock     = threading.RLock()
+
+# sessions kept alive, the least recently used is closed first
+_max_sessions = 4
+
+# options that a session sets for each run, or that do not change the solver
+_ignored_options = set([
+    'MESH_FILENAME', 'MESH_OUT_FILENAME', 'DV_VALUE', 'DV_VALUE_OLD',
+    'DV_VALUE_NEW', 'RESTART_SOL', 'WARM_START', 'CONSOLE', 'NUMBER_PART',
+    'FIN_DIFF_JOBS', 'MULTIPOINT_JOBS', 'MULTIPOINT_NUMBER_PART',
+    'STABILITY_JOBS', 'ADJOINT_JOBS', 'SOLVER_TIMEOUT', 'RESULT_CACHE',
+    'RESULT_CACHE_SIZE', 'OPT_ITERATIONS', 'OPT_ACCURACY',
+    'OPT_BOUND_UPPER', 'OPT_BOUND_LOWER', 'OPT_GRADIENT_FACTOR',
+    'OPT_RELAX_FACTOR' ])
+
+# options that run SU2_CFD in several threads at once, a session changes
+# the working folder and the output files of the whole process
+_job_options = [ 'FIN_DIFF_JOBS', 'MULTIPOINT_JOBS', 'STABILITY_JOBS', 'ADJOINT_JOBS' ]
+
+
+# ----------------------------------------------------------------------
+#  Session Class
+# ----------------------------------------------------------------------
+
+class Session(object):
+    """ session = SU2.run.Session(config,cwd=None)
+
+        SU2_CFD kept alive in the python process with the pysu2
+        wrapper, for the runs of a config on new designs. the mesh
+        is read and the solver is set up once, a new design pushes
+        the displacement of the DV_MARKER surfaces to the mesh
+        solver of the driver, and starts from the solution in memory.
+
+        a direct session uses pysu2.CSinglezoneDriver and deforms
+        the volume mesh with DEFORM_MESH, a discrete adjoint session
+        uses pysu2ad.CDiscAdjSinglezoneDriver and loads the direct
+        solution and deformed mesh of each run from its restart file.
+
+        Inputs:
+            config - config of the first run, the driver reads it
+            cwd    - folder of the first run, default SU2.io.getcwd()
+
+        Attributes:
+            key        - options of the config that the session runs
+            mesh       - mesh file and its modification time,
+                         of the last run
+            n_runs     - number of runs
+            setup_time - seconds spent on the setup of the driver
+            run_time   - seconds spent on the runs
+
+        Methods:
+            run(config,cwd=None)    - runs the solver in cwd, with the
+                                      mesh and solution of config
+            move_mesh(mesh_filename) - pushes the surfaces of a mesh file
+            close()                 - releases the driver
+
+        Runs change the working folder and the screen output files of
+        the process while they run, so sessions cannot run with
+        FIN_DIFF_JOBS, MULTIPOINT_JOBS, STABILITY_JOBS or ADJOINT_JOBS
+        above 1, run_session() raises an exception for these configs.
+
+        SOLVER_TIMEOUT does not apply to sessions, and errors of the
+        solver are not raised as SU2.DivergenceFailure, an error of
+        SU2_CFD stops the python process.
+    """
+
+    def __init__(self, config, cwd=None):
+        if cwd is None: cwd = getcwd()
+
+        konfig = session_config(config)
+        adjoint = konfig.MATH_PROBLEM == 'DISCRETE_ADJOINT'
+        if adjoint:
+            pysu2ad = _import_wrapper('pysu2ad')
+            assert pysu2ad is not None, 'CFD_BACKEND= PYSU2 needs the pysu2ad module for discrete adjoints'
+            Driver = pysu2ad.CDiscAdjSinglezoneDriver
+        else:
+            pysu2 = _import_wrapper('pysu2')
+            assert pysu2 is not None, 'CFD_BACKEND= PYSU2 needs the pysu2 module'
+            Driver = pysu2.CSinglezoneDriver
+
+        self.key        = session_key(config)
+        self.adjoint    = adjoint
+        self.deform     = konfig.get('DEFORM_MESH','NO') == 'YES'
+        self.markers    = _deform_markers(konfig)
+        self.mesh       = _mesh_id(os.path.join(cwd,konfig.MESH_FILENAME))
+        self.n_runs     = 0
+        self.setup_time = 0.0
+        self.run_time   = 0.0
+
+        tempname = 'config_CFD.cfg'
+        konfig.dump(os.path.join(cwd,tempname))
+
+        start = time.time()
+        with _working_folder(cwd):
+            self.driver = _new_driver(Driver,tempname)
+        self.setup_time = time.time() - start
+
+    def run(self, config, cwd=None):
+        """ session.run(config,cwd=None)
+            runs the solver in cwd, default SU2.io.getcwd(),
+            on the mesh of config
+        """
+        if cwd is None: cwd = getcwd()
+        driver = self.driver
+        assert driver is not None, 'session is closed'
+
+        start = time.time()
+        with _working_folder(cwd):
+
+            # new design
+            if self.n_runs:
+                driver.ReopenHistoryFiles()
+                if self.adjoint:
+                    driver.LoadRestart()
+                else:
+                    self.move_mesh(config.MESH_FILENAME)
+
+            # steady single zone iteration
+            driver.Preprocess(0)
+            driver.Run()
+            driver.Postprocess()
+            driver.Update()
+            driver.Monitor(0)
+            driver.Output(0)
+
+        self.n_runs  += 1
+        self.run_time += time.time() - start
+
+    def move_mesh(self, mesh_filename):
+        """ session.move_mesh(mesh_filename)
+            pushes the surface displacement of the DV_MARKER markers
+            of a mesh file, relative to the mesh of the setup, to the
+            mesh solver of the driver. the volume is deformed by
+            the next run.
+        """
+        mesh = _mesh_id(mesh_filename)
+        if mesh == self.mesh:
+            return
+        assert self.deform, 'session needs DEFORM_MESH= YES to move the mesh'
+
+        from ..mesh.tools import read as read_mesh
+        meshdata = read_mesh(mesh[0])
+        points   = meshdata['POIN']
+
+        driver  = self.driver
+        markers = driver.GetAllBoundaryMarkers()
+        for tag in self.markers:
+            # markers of other partitions
+            if not tag in markers: continue
+            i_marker = markers[tag]
+            for i_vertex in range(driver.GetNumberVertices(i_marker)):
+                i_point = driver.GetVertexGlobalIndex(i_marker,i_vertex)
+                coord   = driver.GetVertex_UndeformedCoord(i_marker,i_vertex)
+                new     = list(points[i_point][0:meshdata['NDIME']]) + [0.0]
+                driver.SetMeshDisplacement( i_marker, i_vertex, new[0]-coord[0],
+                                            new[1]-coord[1], new[2]-coord[2] )
+        driver.CommunicateMeshDisplacement()
+
+        self.mesh = mesh
+
+    def close(self):
+        """ session.close()
+            releases the driver and its memory
+        """
+        if self.driver is None: return
+        self.driver.Postprocessing()
+        self.driver = None
+
+    def __repr__(self):
+        return '<Session> %s, %i runs' % ('adjoint' if self.adjoint else 'direct',self.n_runs)
+
+#: class Session
+
+
+# ----------------------------------------------------------------------
+#  Session Registry
+# ----------------------------------------------------------------------
+
+def run_session(config, cwd=None):
+    """ SU2.run.run_session(config,cwd=None)
+        runs SU2_CFD in the python process, in the session of config,
+        a new session is set up if there is none
+    """
+    if cwd is None: cwd = getcwd()
+    key = session_key(config)
+
+    # sessions change the working folder of the process
+    jobs = [ name for name in _job_options if int(config.get(name,1)) > 1 ]
+    if jobs:
+        raise Exception('CFD_BACKEND= PYSU2 cannot run with %s above 1, use CFD_BACKEND= SUBPROCESS' % ', '.join(jobs))
+
+    with _lock, _output_files():
+        session = _sessions.pop(key,None)
+        if session is None:
+            session = Session(config,cwd)
+        _sessions[key] = session
+
+        # the least recently used sessions
+        while len(_sessions) > _max_sessions:
+            _sessions.popitem(last=False)[1].close()
+
+        session.run(config,cwd)
+
+#: def run_session()
+
+def session_supported(config):
+    """ supported = SU2.run.session_supported(config)
+        True if the runs of config can use a session, steady
+        single zone direct and discrete adjoint problems, on one
+        partition
+    """
+    if config.get('TIME_DOMAIN','NO') == 'YES':
+        return False
+    if int(config.get('NZONES',1)) != 1:
+        return False
+    if int(config.get('NUMBER_PART',0)) > 1:
+        return False
+    if config.get('DECOMPOSED',False):
+        return False
+    if not config.get('DIRECT_DIFF','NO') in ['NO','NONE','']:
+        return False
+    if config.get('MATH_PROBLEM','DIRECT') == 'DISCRETE_ADJOINT':
+        return _import_wrapper('pysu2ad') is not None
+    return _import_wrapper('pysu2') is not None
+
+def close_sessions():
+    """ SU2.run.close_sessions()
+        releases the drivers of all sessions
+    """
+    with _lock:
+        while _sessions:
+            _sessions.popitem()[1].close()
+
+atexit.register(close_sessions)
+
+def session_config(config):
+    """ konfig = SU2.run.session_config(config)
+        config of the driver of a session, with the mesh solver
+        on the DV_MARKER surfaces of shape design variables
+    """
+    konfig = copy.deepcopy(config)
+    markers = _deform_markers(konfig)
+    if markers and konfig.get('DEFORM_MESH','NO') != 'YES':
+        konfig['DEFORM_MESH'] = 'YES'
+        konfig['MARKER_DEFORM_MESH'] = '( %s )' % ', '.join(markers)
+    return konfig
+
+def session_key(config):
+    """ key = SU2.run.session_key(config)
+        the options of a config that a session is set up with
+    """
+    options = []
+    for name in sorted(config.keys()):
+        if name in _ignored_options: continue
+        options.append( (name,repr(config[name])) )
+    return repr(options)
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def _import_wrapper(name):
+    """ the pysu2 or pysu2ad module, None if it is not installed """
+    with _lock:
+        if not name in _wrappers:
+            try:
+                _wrappers[name] = __import__(name)
+            except ImportError:
+                _wrappers[name] = None
+        return _wrappers[name]
+
+def _deform_markers(config):
+    """ markers of the shape design variables, [] if none """
+    markers = config.get('DV_MARKER','NONE')
+    if not isinstance(markers,list):
+        markers = markers.strip('() ').split(',')
+    markers = [ marker.strip() for marker in markers ]
+    return [ marker for marker in markers if marker and marker != 'NONE' ]
+
+def _mesh_id(name):
+    """ path and modification time of a mesh file """
+    path = os.path.realpath(name)
+    return path, os.path.getmtime(path)
+
+def _new_driver(Driver, filename):
+    """ driver of the MPI communicator of the process, if the wrapper
+        is built with MPI, serial otherwise
+    """
+    comms = [0]
+    try:
+        from mpi4py import MPI
+        comms = [MPI.COMM_WORLD,0]
+    except ImportError:
+        pass
+    for comm in comms[:-1]:
+        try:
+            return Driver(filename,1,comm)
+        except TypeError:
+            # serial build of the wrapper
+            pass
+    return Driver(filename,1,comms[-1])
+
+class _working_folder(object):
+    """ changes the working folder of the process, for the files of the driver """
+
+    def __init__(self, folder):
+        self.folder = folder
+
+    def __enter__(self):
+        self.old_folder = os.getcwd()
+        os.chdir(self.folder)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        os.chdir(self.old_folder)
+
+class _output_files(object):
+    """ sends the screen output of the driver to the output streams of
+        the thread, see SU2.io.output_streams(), if they are files
+    """
+
+    def __enter__(self):
+        stdout, stderr = output_streams()
+        _flush_c_streams()
+        self.saved = []
+        for fd, stream in ((1,stdout),(2,stderr)):
+            try:
+                stream_fd = stream.fileno()
+            except (AttributeError, ValueError, OSError):
+                continue
+            if stream_fd == fd: continue
+            stream.flush()
+            self.saved.append( (fd,os.dup(fd),stream) )
+            os.dup2(stream_fd,fd)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _flush_c_streams()
+        for fd, saved_fd, stream in self.saved:
+            stream.flush()
+            os.dup2(saved_fd,fd)
+            os.close(saved_fd)
+
+def _flush_c_streams():
+    """ flushes the C streams, that the screen output of the driver uses """
+    try:
+        import ctypes
+        ctypes.CDLL(None).fflush(None)
+    except (OSError, TypeError, AttributeError):
+        pass
@@ -2,6 +2,7 @@ from .switch        import switch
 from .bunch import Bunch        as bunch
 from .ordered_dict import OrderedDict  as ordered_dict
 from .ordered_bunch import OrderedBunch as ordered_bunch
+from .cow_bunch     import CowBunch     as cow_bunch
 from .plot          import write_plot, tecplot, paraview
 from .lhc_unif      import lhc_unif
 from .mp_eval       import mp_eval
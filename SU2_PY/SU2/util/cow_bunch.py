@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+""" CowBunch is an OrderedBunch that shares its immutable values with copies.
+
+    copy.deepcopy() of a CowBunch keeps the immutable values of the
+    original, strings, numbers and tuples of them, without visiting
+    them, and deep copies every mutable value. the copy and the original
+    never share a value that can be changed, so a reference taken before
+    a copy still belongs to the original only.
+
+    >>> import copy
+    >>> b = CowBunch(names=['a','b'], mach=0.8)
+    >>> names = b.names
+    >>> c = copy.deepcopy(b)
+    >>> c.names.append('c')
+    >>> names.append('d')
+    >>> b.names
+    ['a', 'b', 'd']
+    >>> c.names
+    ['a', 'b', 'c']
+
+    peek() returns a stored value, for read-only use.
+"""
+
+import copy
+from .ordered_dict  import OrderedDict
+from .ordered_bunch import OrderedBunch
+
+_immutable_types = ( str, int, float, bool, complex, type(None) )
+
+
+class CowBunch(OrderedBunch):
+    """ An OrderedBunch whose copies share immutable values only, 
+        see module documentation.
+    """
+
+    def peek(self, k, default=None):
+        """ value = CowBunch.peek(k,default=None)
+            returns the stored value, the value must not be modified
+        """
+        return dict.get(self,k,default)
+
+    def __eq__(self, other):
+        # compares the stored values
+        if isinstance(other,OrderedDict):
+            return len(self) == len(other) and _raw_items(self) == _raw_items(other)
+        return dict.__eq__(self,other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __deepcopy__(self, memo):
+        """ keeps the immutable values, deep copies the others
+        """
+        cls = self.__class__
+        new = cls.__new__(cls)
+        memo[id(self)] = new
+
+        # bare ordered bunch, skips subclass initialization
+        OrderedBunch.__init__(new)
+
+        # instance attributes
+        for k, v in vars(self).items():
+            if k.startswith('_OrderedDict__'):
+                continue
+            object.__setattr__(new, k, copy.deepcopy(v,memo))
+
+        # values, in order
+        for k in self:
+            v = dict.__getitem__(self,k)
+            if not _is_immutable(v):
+                v = copy.deepcopy(v,memo)
+            OrderedBunch.__setitem__(new,k,v)
+
+        return new
+
+    def __reduce__(self):
+        """ pickles the stored values """
+        items = [ [k, dict.__getitem__(self,k)] for k in self ]
+        inst_dict = vars(self).copy()
+        for k in list(inst_dict.keys()):
+            if k.startswith('_OrderedDict__'):
+                del inst_dict[k]
+        if inst_dict:
+            return (self.__class__, (items,), inst_dict)
+        return self.__class__, (items,)
+
+#: class CowBunch
+
+
+def _is_immutable(value):
+    """ True for scalars, and tuples and frozensets of immutable values """
+    if isinstance(value,_immutable_types):
+        return True
+    if isinstance(value,(tuple,frozenset)):
+        return all( _is_immutable(v) for v in value )
+    return False
+
+def _raw_items(d):
+    """ ordered (key,value) pairs of an ordered dict, without copying """
+    return [ (k, dict.__getitem__(d,k)) for k in d ]
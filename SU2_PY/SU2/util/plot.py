@@ -26,12 +26,14 @@
 # License along with SU2. If not, see <http://www.gnu.org/licenses/>.
 
 
-def write_plot(filename,plot_format,data_plot,keys_plot=None):
-    """ write_plot(filename,plot_format,data_plot,keys_plot=[])
+def write_plot(filename,plot_format,data_plot,keys_plot=None,append=False):
+    """ write_plot(filename,plot_format,data_plot,keys_plot=[],append=False)
         writes a tecplot or paraview plot of dictionary data 
         data_plot is a dictionary of lists with equal length
         if data_plot is an ordered dictionary, will output in order
         otherwise use keys_plot to specify the order of output
+        if append is True, the lines are added to the end of an 
+        existing plot of the same keys, without the header
     """
     
     default_spacing = 16
@@ -65,12 +67,15 @@ def write_plot(filename,plot_format,data_plot,keys_plot=None):
             keys_space[i] = len(key)
         keys_space[i] = "%-" + str(keys_space[i]) + "s"
         
-    plotfile = open(filename,'w')
-    plotfile.write(header)
-    for i,key in enumerate(keys_print):
-        if i > 0: plotfile.write(", ")
-        plotfile.write(keys_space[i] % key)
-    plotfile.write('\n')
+    if append:
+        plotfile = open(filename,'a')
+    else:
+        plotfile = open(filename,'w')
+        plotfile.write(header)
+        for i,key in enumerate(keys_print):
+            if i > 0: plotfile.write(", ")
+            plotfile.write(keys_space[i] % key)
+        plotfile.write('\n')
 
     for i_line in range(n_lines):
         plotfile.write(indent_spacing)
@@ -81,11 +81,10 @@ def direct_differentiation( filename           ,
     state.find_files(config)
 
     foundDerivativeField = False
-    for fields in SU2.io.historyOutFields:
+    for fields in SU2.io.optnames_aero_diff:
         group = SU2.io.historyOutFields[fields]['GROUP']
         if group in config.HISTORY_OUTPUT:
-            if SU2.io.historyOutFields[fields]['TYPE'] == 'D_COEFFICIENT':
-                foundDerivativeField = True
+            foundDerivativeField = True
     
     if not foundDerivativeField:
         sys.exit('No derivative field found in HISTORY_OUTPUT')
@@ -38,6 +38,7 @@ threads="1"
 ) pysu2ad
 %{
 
+#define SWIG_FILE_WITH_INIT
 #include "../../SU2_CFD/include/drivers/CDriver.hpp"
 #include "../../SU2_CFD/include/drivers/CSinglezoneDriver.hpp"
 #include "../../SU2_CFD/include/drivers/CMultizoneDriver.hpp"
@@ -52,7 +53,10 @@ threads="1"
 %include "std_vector.i"
 %include "std_map.i"
 %include "typemaps.i"
-//%include "numpy.i"
+%include "numpy.i"
+%init %{
+import_array();
+%}
 #ifdef HAVE_MPI                    //Need mpi4py only for a parallel build of the wrapper.
   %include "mpi4py/mpi4py.i"
   %mpi4py_typemap(Comm, MPI_Comm)
@@ -66,6 +70,30 @@ namespace std {
    %template() map<string, string>;
 }
 
+// ----------- NUMPY ARRAYS ---------------
+// Bulk marker access: getters fill preallocated arrays in place,
+// setters read contiguous arrays, one row per vertex of the marker.
+%numpy_typemaps(bool, NPY_BOOL, int)
+%apply (long* INPLACE_ARRAY1, int DIM1) {(long* indices, int nRow)}
+%apply (bool* INPLACE_ARRAY1, int DIM1) {(bool* halo, int nRow)}
+%apply (double* INPLACE_ARRAY1, int DIM1) {(passivedouble* values, int nRow)}
+%apply (double* INPLACE_ARRAY2, int DIM1, int DIM2) {(passivedouble* values, int nRow, int nCol)}
+%apply (double* IN_ARRAY1, int DIM1) {(const passivedouble* values, int nRow)}
+%apply (double* IN_ARRAY2, int DIM1, int DIM2) {(const passivedouble* values, int nRow, int nCol)}
+// Solution access: GetSolutionView returns an array that shares the memory of a solver.
+%apply (double** ARGOUTVIEW_ARRAY2, int* DIM1, int* DIM2) {(passivedouble** view, int* nRow, int* nCol)}
+
+%extend CDriver {
+%pythoncode %{
+def GetSolutionArray(self, iZone=0, adjoint=False):
+    """Copy of the solution of all primal or adjoint solvers of a zone, a (nPoint, nVar) array."""
+    import numpy
+    values = numpy.empty((self.GetNumberPoints(iZone), self.GetTotalNumberOfVariables(iZone, adjoint)))
+    self.GetSolutions(iZone, adjoint, values)
+    return values
+%}
+}
+
 // ----------- API CLASSES ----------------
 
 //Constants definitions
@@ -85,6 +113,11 @@ const unsigned int MESH_0 = 0; /*!< \brief Definition of the finest grid level.
 const unsigned int MESH_1 = 1; /*!< \brief Definition of the finest grid level. */
 const unsigned int ZONE_0 = 0; /*!< \brief Definition of the first grid domain. */
 const unsigned int ZONE_1 = 1; /*!< \brief Definition of the first grid domain. */
+const unsigned int FLOW_SOL = 0; /*!< \brief Position of the mean flow solution in the solver container array. */
+const unsigned int TURB_SOL = 2; /*!< \brief Position of the turbulence model solution in the solver container array. */
+const unsigned int HEAT_SOL = 5; /*!< \brief Position of the heat equation in the solver container array. */
+const unsigned int MESH_SOL = 9; /*!< \brief Position of the mesh solver in the solver container array. */
+const unsigned int FEA_SOL = 0;  /*!< \brief Position of the FEA equation in the solver container array. */
 
 // CDriver class
 %include "../../SU2_CFD/include/drivers/CDriver.hpp"
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+## \file test_cow_bunch.py
+#  \brief tests of the copy-on-write bunch
+#  \version 7.0.6 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+import copy, pickle, threading
+
+from SU2.util import cow_bunch
+from SU2.io import Config, State
+
+
+def test_deepcopy_isolation():
+    b = cow_bunch(names=['a', 'b'], nested={'x': [1, 2]}, mach=0.8)
+    c = copy.deepcopy(b)
+
+    c.names.append('c')
+    c.nested['x'].append(3)
+    c.mach = 0.9
+    assert b.names == ['a', 'b']
+    assert b.nested == {'x': [1, 2]}
+    assert b.mach == 0.8
+
+    # changes to the original do not reach the copy
+    b.names.append('d')
+    assert c.names == ['a', 'b', 'c']
+
+
+def test_references_before_copy():
+    state = State()
+    files = state.FILES
+    ztate = copy.deepcopy(state)
+
+    # a reference taken before the copy still belongs to the original
+    state.FILES.DIRECT = 'restart_flow.dat'
+    assert 'DIRECT' in files
+    files['ADJOINT_DRAG'] = 'restart_adj_cd.dat'
+    assert 'ADJOINT_DRAG' in state.FILES
+    assert not 'DIRECT' in ztate.FILES
+    assert not 'ADJOINT_DRAG' in ztate.FILES
+
+    config = Config()
+    config.DV_VALUE_NEW = [0.0, 0.0]
+    dv_new = config.DV_VALUE_NEW
+    konfig = copy.deepcopy(config)
+    dv_new[0] = 5.0
+    assert config.DV_VALUE_NEW == [5.0, 0.0]
+    assert konfig.DV_VALUE_NEW == [0.0, 0.0]
+
+
+def test_immutable_values_shared():
+    b = cow_bunch(name='mesh.su2', sizes=(1, 2), names=['a'])
+    c = copy.deepcopy(b)
+    assert c.peek('name') is b.peek('name')
+    assert c.peek('sizes') is b.peek('sizes')
+    assert c.peek('names') is not b.peek('names')
+
+
+def test_original_changed_first():
+    b = cow_bunch(names=['a'])
+    c = copy.deepcopy(b)
+    b.names.append('b')
+    assert c.names == ['a']
+
+
+def test_copy_of_copy():
+    b = cow_bunch(names=['a'])
+    c = copy.deepcopy(b)
+    d = copy.deepcopy(c)
+    d.names.append('d')
+    c.names.append('c')
+    assert b.names == ['a']
+    assert c.names == ['a', 'c']
+    assert d.names == ['a', 'd']
+
+
+def test_config_and_state():
+    config = Config()
+    config.DV_VALUE_NEW = [0.0, 0.0]
+    konfig = copy.deepcopy(config)
+    konfig.DV_VALUE_NEW[1] = 1.0
+    assert isinstance(konfig, Config)
+    assert config.DV_VALUE_NEW == [0.0, 0.0]
+
+    state = State()
+    state.FUNCTIONS.DRAG = 0.01
+    ztate = copy.deepcopy(state)
+    ztate.FUNCTIONS.DRAG = 0.02
+    assert state.FUNCTIONS.DRAG == 0.01
+
+
+def test_pickle():
+    b = cow_bunch(names=['a'])
+    c = pickle.loads(pickle.dumps(copy.deepcopy(b)))
+    c.names.append('c')
+    assert b.names == ['a']
+    assert c.names == ['a', 'c']
+
+
+def test_threads():
+    b = cow_bunch(sequence=list(range(100)))
+    c = copy.deepcopy(b)
+    copies = [None] * 8
+
+    # copies of a shared copy, taken and changed by each thread
+    def change(i):
+        copies[i] = copy.deepcopy(c)
+        for j in range(100):
+            copies[i].sequence[j] += i
+
+    threads = [ threading.Thread(target=change, args=(i,)) for i in range(8) ]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+
+    assert b.sequence == list(range(100))
+    assert c.sequence == list(range(100))
+    for i, d in enumerate(copies):
+        assert d.sequence == [ j + i for j in range(100) ]
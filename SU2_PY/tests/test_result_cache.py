@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+## \file test_result_cache.py
+#  \brief tests of the result cache
+#  \version 7.0.6 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+import pytest
+
+from SU2.io import Config, State, ResultCache
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('mesh.su2', 'w') as mesh_file:
+        mesh_file.write('NDIME= 2\n')
+    config = Config()
+    config.MESH_FILENAME      = 'mesh.su2'
+    config.MATH_PROBLEM       = 'DIRECT'
+    config.OBJECTIVE_FUNCTION = 'DRAG'
+    config.OBJECTIVE_WEIGHT   = '1.0'
+    config.DV_VALUE_NEW       = [0.0, 0.0]
+    config.CONSOLE            = 'QUIET'
+    return config
+
+
+def _state(drag):
+    state = State()
+    state.FUNCTIONS.DRAG = drag
+    return state
+
+
+def _cached_keys(cache, keys):
+    return [ key for key in keys if os.path.exists(os.path.join(cache.folder, key)) ]
+
+
+def test_key_sensitivity(tmp_path, config):
+    cache = ResultCache(str(tmp_path / 'cache'))
+    key = cache.key(config)
+
+    # options that do not change the results
+    konfig = config.copy()
+    konfig.CONSOLE = 'VERBOSE'
+    konfig.NUMBER_PART = 4
+    assert cache.key(konfig) == key
+
+    # design vector and objective
+    konfig = config.copy()
+    konfig.DV_VALUE_NEW = [0.0, 1e-3]
+    assert cache.key(konfig) != key
+    konfig = config.copy()
+    konfig.OBJECTIVE_FUNCTION = 'LIFT'
+    assert cache.key(konfig) != key
+
+    # the weights only count for combined objectives
+    konfig = config.copy()
+    konfig.OBJECTIVE_WEIGHT = '2.0'
+    assert cache.key(konfig) == key
+    combined = config.copy()
+    combined.OPT_COMBINE_OBJECTIVE = 'YES'
+    konfig.OPT_COMBINE_OBJECTIVE = 'YES'
+    assert cache.key(konfig) != cache.key(combined)
+
+    # mesh contents
+    with open('mesh.su2', 'a') as mesh_file:
+        mesh_file.write('NELEM= 0\n')
+    assert cache.key(config) != key
+    os.remove('mesh.su2')
+    assert cache.key(config) is None
+
+
+def test_save_load(tmp_path, config):
+    cache = ResultCache(str(tmp_path / 'cache'))
+    key = cache.key(config)
+
+    state = State()
+    assert not cache.load(key, state)
+    cache.save(key, config, _state(0.01))
+    assert cache.load(key, state)
+    assert state.FUNCTIONS.DRAG == 0.01
+
+
+def test_eviction(tmp_path, config):
+    cache = ResultCache(str(tmp_path / 'cache'))
+
+    keys = []
+    for i in range(3):
+        konfig = config.copy()
+        konfig.DV_VALUE_NEW = [0.0, 1e-3 * i]
+        keys.append(cache.key(konfig))
+
+    cache.save(keys[0], config, _state(0.0))
+    entry_size = sum( os.path.getsize(os.path.join(cache.folder, keys[0], name))
+                      for name in os.listdir(os.path.join(cache.folder, keys[0])) )
+    cache.save(keys[1], config, _state(1.0))
+
+    # budget of two entries, the first entry is used last
+    cache.max_size = 2.5 * entry_size / 1024.**2
+    os.utime(os.path.join(cache.folder, keys[0], 'entry.pkl'), (1000, 1000))
+    os.utime(os.path.join(cache.folder, keys[1], 'entry.pkl'), (2000, 2000))
+    assert cache.load(keys[0], State())
+
+    cache.save(keys[2], config, _state(2.0))
+    assert _cached_keys(cache, keys) == [keys[0], keys[2]]
+
+    # the entry just saved is kept, even over the budget
+    cache.max_size = 0.
+    cache.save(keys[1], config, _state(1.0))
+    assert _cached_keys(cache, keys) == [keys[1]]
+
@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+## \file test_store.py
+#  \brief tests of the append-only project store
+#  \version 7.0.6 "Blackbird"
+#
+# SU2 Project Website: https://su2code.github.io
+#
+# The SU2 Project is maintained by the SU2 Foundation
+# (http://su2foundation.org)
+#
+# Copyright 2012-2020, SU2 Contributors (cf. AUTHORS.md)
+#
+# SU2 is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# SU2 is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with SU2. If not, see <http://www.gnu.org/licenses/>.
+
+import os
+
+from SU2.io import Config, State, ProjectStore, DesignList
+from SU2.opt import Project
+
+
+class _Design(object):
+    """ the attributes of a design that the store saves """
+    def __init__(self, config, folder, drag):
+        self.config = config
+        self.state  = State()
+        self.state.FUNCTIONS.DRAG = drag
+        self.folder = folder
+
+
+def _design_store(filename, n_designs=3):
+    config = Config()
+    config.MESH_FILENAME = 'mesh.su2'
+    config.DV_VALUE_NEW  = [0.0, 0.0]
+
+    store = ProjectStore(filename)
+    store.save_config(config)
+    for i in range(n_designs):
+        konfig = Config(config)
+        konfig.DV_VALUE_NEW = [0.0, 1e-3 * i]
+        store.save_design('DESIGNS/DSN_%03d' % (i+1), _Design(konfig, 'DESIGNS/DSN_%03d' % (i+1), 0.1 * i))
+    return store
+
+
+def test_append_reload(tmp_path):
+    filename = str(tmp_path / 'project.store')
+
+    store = ProjectStore(filename)
+    store.append('DSN_001', {'DRAG': 0.01})
+    store.append('DSN_002', [1.0, 2.0])
+    store.append('DSN_001', {'DRAG': 0.02})
+
+    # a new store indexes the file
+    store = ProjectStore(filename)
+    assert store.keys() == ['DSN_001', 'DSN_002']
+    assert store.versions('DSN_001') == 2
+    assert store.load('DSN_001') == {'DRAG': 0.02}
+    assert store.load('DSN_001', 0) == {'DRAG': 0.01}
+    assert store.load('DSN_002') == [1.0, 2.0]
+
+
+def test_refresh(tmp_path):
+    filename = str(tmp_path / 'project.store')
+
+    store = ProjectStore(filename)
+    other = ProjectStore(filename)
+    store.append('DSN_001', 1)
+    assert 'DSN_001' in other
+    store.append('DSN_002', 2)
+    other.refresh()
+    assert other.load('DSN_002') == 2
+
+
+def test_truncated_record(tmp_path):
+    filename = str(tmp_path / 'project.store')
+
+    store = ProjectStore(filename)
+    store.append('DSN_001', 'complete')
+    store.append('DSN_002', 'lost in a crash')
+
+    # cut the last record
+    with open(filename, 'r+b') as store_file:
+        store_file.truncate(os.path.getsize(filename) - 3)
+
+    store = ProjectStore(filename)
+    assert store.keys() == ['DSN_001']
+    assert store.load('DSN_001') == 'complete'
+
+    # the next append overwrites the incomplete record
+    store.append('DSN_002', 'saved again')
+    store = ProjectStore(filename)
+    assert store.keys() == ['DSN_001', 'DSN_002']
+    assert store.load('DSN_002') == 'saved again'
+
+
+def test_design_list_lazy(tmp_path):
+    store = _design_store(str(tmp_path / 'project.store'))
+    store = ProjectStore(store.filename)
+
+    loaded = []
+    load_design = store.load_design
+    def counted_load(key):
+        loaded.append(key)
+        return load_design(key)
+    store.load_design = counted_load
+
+    designs = DesignList(store, store.design_keys())
+    assert len(designs) == 3
+    assert designs.keys() == ['DESIGNS/DSN_001', 'DESIGNS/DSN_002', 'DESIGNS/DSN_003']
+    assert loaded == []
+
+    design = designs[1]
+    assert loaded == ['DESIGNS/DSN_002']
+    assert design.state.FUNCTIONS.DRAG == 0.1
+    assert design.config.DV_VALUE_NEW == [0.0, 1e-3]
+    assert design.config.MESH_FILENAME == 'mesh.su2'
+    assert design.store is store
+
+    # loaded once
+    assert designs[1] is design
+    assert loaded == ['DESIGNS/DSN_002']
+
+
+def test_deep_compile(tmp_path):
+    store = _design_store(str(tmp_path / 'project.store'))
+
+    # a project that only knows the first design
+    project = Project.__new__(Project)
+    project.folder           = str(tmp_path)
+    project.filename         = 'project.pkl'
+    project.results_filename = 'results.pkl'
+    project.store            = store
+    project.designs          = DesignList(store, store.design_keys()[:1])
+
+    project.deep_compile()
+
+    assert project.designs.keys() == store.design_keys()
+    assert list(project.results.FUNCTIONS.DRAG) == [0.0, 0.1, 0.2]
+    assert os.path.exists(str(tmp_path / 'project.pkl'))
+
+
+def test_config_delta_order(tmp_path):
+    store = ProjectStore(str(tmp_path / 'project.store'))
+
+    config = Config()
+    config.MESH_FILENAME = 'mesh.su2'
+    config.MACH_NUMBER   = 0.8
+    config.DV_VALUE_NEW  = [0.0, 0.0]
+    store.save_config(config)
+
+    # a new key in the middle, a changed and a removed key
+    konfig = Config()
+    konfig.MESH_FILENAME = 'mesh.su2'
+    konfig.AOA           = 1.25
+    konfig.DV_VALUE_NEW  = [0.0, 1e-3]
+    konfig.RESTART_SOL   = 'YES'
+    store.save_design('DESIGNS/DSN_001', _Design(konfig, 'DESIGNS/DSN_001', 0.0))
+
+    # and one in the order of the base config
+    config.RESTART_SOL = 'NO'
+    store.save_design('DESIGNS/DSN_002', _Design(config, 'DESIGNS/DSN_002', 0.0))
+
+    store = ProjectStore(store.filename)
+    for key, this_config in [('DESIGNS/DSN_001', konfig), ('DESIGNS/DSN_002', config)]:
+        loaded = store.load_design(key).config
+        assert isinstance(loaded, Config)
+        assert list(loaded.keys()) == list(this_config.keys())
+        assert loaded == this_config